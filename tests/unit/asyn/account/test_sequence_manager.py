@@ -0,0 +1,87 @@
+import asyncio
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from xrpl.asyncio.account import SequenceManager
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.models.response import Response, ResponseStatus
+
+_ACCOUNT = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+
+
+class _AccountInfoClient(AsyncClient):
+    def __init__(self, sequence):
+        super().__init__("stand-in")
+        self.sequence = sequence
+        self.requests = 0
+
+    async def request_impl(self, request):
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        return Response(
+            status=ResponseStatus.SUCCESS,
+            result={"account_data": {"Sequence": self.sequence}},
+        )
+
+
+class TestSequenceManager(IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_get_consecutive_numbers(self):
+        client = _AccountInfoClient(7)
+        manager = SequenceManager(_ACCOUNT)
+        sequences = await asyncio.gather(
+            *(manager.next_sequence(client) for _ in range(5))
+        )
+        self.assertEqual(sorted(sequences), [7, 8, 9, 10, 11])
+
+        requests = client.requests
+        self.assertEqual(await manager.next_sequence(client), 12)
+        self.assertEqual(client.requests, requests)
+
+    async def test_resyncs_on_sequence_errors(self):
+        client = _AccountInfoClient(7)
+        manager = SequenceManager(_ACCOUNT)
+        await manager.next_sequence(client)
+        await manager.next_sequence(client)
+
+        self.assertFalse(manager.check_result("tesSUCCESS"))
+        self.assertTrue(manager.check_result("terPRE_SEQ"))
+        self.assertEqual(await manager.next_sequence(client), 7)
+        self.assertEqual(client.requests, 2)
+
+    async def test_refetches_after_max_age(self):
+        client = _AccountInfoClient(7)
+        manager = SequenceManager(_ACCOUNT, max_age=0)
+        await manager.next_sequence(client)
+        await asyncio.sleep(0.01)
+        client.sequence = 20
+        self.assertEqual(await manager.next_sequence(client), 20)
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        client = _AccountInfoClient(7)
+        manager = SequenceManager(_ACCOUNT)
+        await asyncio.gather(*(manager.next_sequence(client) for _ in range(5)))
+        self.assertEqual(client.requests, 1)
+
+    async def test_release(self):
+        client = _AccountInfoClient(7)
+        manager = SequenceManager(_ACCOUNT)
+        first = await manager.next_sequence(client)
+        second = await manager.next_sequence(client)
+
+        manager.release(second)
+        self.assertEqual(await manager.next_sequence(client), 8)
+        # later numbers are in use, so giving back an earlier one resyncs
+        manager.release(first)
+        client.sequence = 9
+        self.assertEqual(await manager.next_sequence(client), 9)
+
+    async def test_check_result_releases_unused_sequence(self):
+        client = _AccountInfoClient(7)
+        manager = SequenceManager(_ACCOUNT)
+        sequence = await manager.next_sequence(client)
+        self.assertFalse(manager.check_result("temBAD_FEE", sequence))
+        self.assertEqual(await manager.next_sequence(client), 7)
+        self.assertEqual(client.requests, 1)
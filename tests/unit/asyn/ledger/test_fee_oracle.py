@@ -0,0 +1,128 @@
+import asyncio
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.asyncio.ledger import FeeOracle
+from xrpl.asyncio.transaction import autofill
+from xrpl.constants import XRPLException
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import AccountDelete, AccountSet
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+_RESULTS = {
+    "account_info": {"account_data": {"Sequence": 7}},
+    "fee": {
+        "current_queue_size": "0",
+        "max_queue_size": "2000",
+        "drops": {
+            "base_fee": "10",
+            "median_fee": "5000",
+            "minimum_fee": "10",
+            "open_ledger_fee": "12",
+        },
+    },
+    "ledger": {"ledger_index": 100},
+    "server_state": {"state": {"validated_ledger": {"reserve_inc": 2000000}}},
+}
+
+
+class _CountingClient(AsyncClient):
+    def __init__(self, status=ResponseStatus.SUCCESS):
+        super().__init__("stand-in")
+        self.status = status
+        self.methods = []
+
+    async def request_impl(self, request):
+        self.methods.append(request.method.value)
+        await asyncio.sleep(0.01)
+        if self.status == ResponseStatus.ERROR:
+            return Response(status=self.status, result={"error": "noNetwork"})
+        return Response(status=self.status, result=_RESULTS[request.method.value])
+
+
+class TestFeeOracle(IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_lookup(self):
+        client = _CountingClient()
+        oracle = FeeOracle()
+
+        fees = await asyncio.gather(*(oracle.get_fee(client) for _ in range(5)))
+
+        self.assertEqual(fees, ["12"] * 5)
+        self.assertEqual(await oracle.get_fee(client, fee_type="minimum"), "10")
+        self.assertEqual(client.methods, ["fee"])
+
+    async def test_looks_up_again_after_ttl(self):
+        client = _CountingClient()
+        oracle = FeeOracle(ttl=0)
+        await oracle.get_fee(client)
+        await oracle.get_fee(client)
+
+        self.assertEqual(client.methods, ["fee", "fee"])
+
+    async def test_ledger_closed_refreshes_cache(self):
+        client = _CountingClient()
+        oracle = FeeOracle()
+        await oracle.get_fee(client)
+
+        oracle._on_ledger_closed(client, {"type": "ledgerClosed", "reserve_inc": 5})
+
+        self.assertEqual(await oracle.get_reserve_increment(client), 5)
+        await oracle.get_fee(client)
+        self.assertEqual(client.methods, ["fee", "fee"])
+
+    async def test_failed_lookup_is_not_cached(self):
+        client = _CountingClient(ResponseStatus.ERROR)
+        oracle = FeeOracle()
+
+        results = await asyncio.gather(
+            oracle.get_fee(client), oracle.get_fee(client), return_exceptions=True
+        )
+
+        self.assertTrue(
+            all(isinstance(r, XRPLRequestFailureException) for r in results)
+        )
+        client.status = ResponseStatus.SUCCESS
+        self.assertEqual(await oracle.get_fee(client), "12")
+        self.assertEqual(client.methods, ["fee", "fee"])
+
+    async def test_cancelled_lookup_is_not_waited_for(self):
+        client = _CountingClient()
+        oracle = FeeOracle()
+        owner = asyncio.ensure_future(oracle.get_fee(client))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(oracle.get_fee(client))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(owner, 0)
+        with self.assertRaises(XRPLException):
+            await asyncio.wait_for(waiter, 1)
+        self.assertEqual(await asyncio.wait_for(oracle.get_fee(client), 1), "12")
+        self.assertEqual(client.methods, ["fee", "fee"])
+
+    async def test_autofill_uses_oracle(self):
+        client = _CountingClient()
+        oracle = FeeOracle()
+        await asyncio.gather(
+            autofill(
+                AccountSet(account=_WALLET.classic_address), client, fee_oracle=oracle
+            ),
+            autofill(
+                AccountDelete(
+                    account=_WALLET.classic_address,
+                    destination=Wallet.create().classic_address,
+                ),
+                client,
+                fee_oracle=oracle,
+            ),
+        )
+
+        self.assertEqual(client.methods.count("fee"), 1)
+        self.assertEqual(client.methods.count("server_state"), 1)
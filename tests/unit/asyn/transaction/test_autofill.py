@@ -0,0 +1,168 @@
+import asyncio
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from xrpl.asyncio.account import SequenceManager
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.transaction import (
+    autofill,
+    safe_sign_and_autofill_transaction,
+    safe_sign_and_submit_transaction,
+)
+from xrpl.constants import XRPLException
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import AccountDelete, AccountSet
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+_RESULTS = {
+    "account_info": {"account_data": {"Sequence": 7}},
+    "fee": {
+        "current_queue_size": "0",
+        "max_queue_size": "2000",
+        "drops": {"base_fee": "10", "open_ledger_fee": "12"},
+    },
+    "ledger": {"ledger_index": 100},
+    "server_state": {"state": {"validated_ledger": {"reserve_inc": 2000000}}},
+    "submit": {"engine_result": "tefPAST_SEQ"},
+}
+
+
+class _RecordingClient(AsyncClient):
+    def __init__(self):
+        super().__init__("stand-in")
+        self.methods = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request_impl(self, request):
+        self.methods.append(request.method.value)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return Response(
+            status=ResponseStatus.SUCCESS, result=_RESULTS[request.method.value]
+        )
+
+
+class TestAutofill(IsolatedAsyncioTestCase):
+    async def test_lookups_are_concurrent(self):
+        client = _RecordingClient()
+        transaction = await autofill(
+            AccountSet(account=_WALLET.classic_address), client
+        )
+
+        self.assertEqual(transaction.sequence, 7)
+        self.assertEqual(transaction.fee, "12")
+        self.assertEqual(transaction.last_ledger_sequence, 120)
+        self.assertEqual(client.max_in_flight, 3)
+
+    async def test_account_delete_fee_lookup_is_concurrent(self):
+        client = _RecordingClient()
+        transaction = await autofill(
+            AccountDelete(
+                account=_WALLET.classic_address,
+                destination=Wallet.create().classic_address,
+            ),
+            client,
+        )
+
+        self.assertEqual(transaction.fee, "2000000")
+        self.assertEqual(client.methods.count("server_state"), 1)
+        self.assertEqual(client.max_in_flight, 4)
+
+    async def test_prefetched_values_skip_lookups(self):
+        client = _RecordingClient()
+        transaction = await autofill(
+            AccountSet(account=_WALLET.classic_address),
+            client,
+            sequence=3,
+            net_fee="10",
+            ledger_index=50,
+        )
+
+        self.assertEqual(client.methods, [])
+        self.assertEqual(transaction.sequence, 3)
+        self.assertEqual(transaction.fee, "10")
+        self.assertEqual(transaction.last_ledger_sequence, 70)
+
+    async def test_fee_check_shares_fee_lookup(self):
+        client = _RecordingClient()
+        await safe_sign_and_autofill_transaction(
+            AccountSet(account=_WALLET.classic_address, fee="12"), _WALLET, client
+        )
+
+        self.assertEqual(sorted(client.methods), ["account_info", "fee", "ledger"])
+        self.assertEqual(client.max_in_flight, 3)
+
+    async def test_sequence_manager(self):
+        client = _RecordingClient()
+        manager = SequenceManager(_WALLET.classic_address)
+        transactions = await asyncio.gather(
+            *(
+                autofill(
+                    AccountSet(account=_WALLET.classic_address),
+                    client,
+                    sequence_manager=manager,
+                )
+                for _ in range(3)
+            )
+        )
+        self.assertEqual(
+            sorted(transaction.sequence for transaction in transactions), [7, 8, 9]
+        )
+        self.assertEqual(client.methods.count("account_info"), 1)
+
+    async def test_sequence_manager_of_other_account(self):
+        manager = SequenceManager("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        with self.assertRaises(XRPLException):
+            await autofill(
+                AccountSet(account=_WALLET.classic_address),
+                _RecordingClient(),
+                sequence_manager=manager,
+            )
+
+    async def test_failed_fee_check_keeps_sequence(self):
+        client = _RecordingClient()
+        manager = SequenceManager(_WALLET.classic_address)
+        with self.assertRaises(XRPLException):
+            await safe_sign_and_autofill_transaction(
+                AccountSet(account=_WALLET.classic_address, fee="100000000"),
+                _WALLET,
+                client,
+                sequence_manager=manager,
+            )
+        transaction = await autofill(
+            AccountSet(account=_WALLET.classic_address),
+            client,
+            sequence_manager=manager,
+        )
+        self.assertEqual(transaction.sequence, 7)
+
+    async def test_ticketed_submission_leaves_sequence_manager_alone(self):
+        client = _RecordingClient()
+        manager = SequenceManager(_WALLET.classic_address)
+        await autofill(
+            AccountSet(account=_WALLET.classic_address),
+            client,
+            sequence_manager=manager,
+        )
+        await safe_sign_and_submit_transaction(
+            AccountSet(account=_WALLET.classic_address, ticket_sequence=5),
+            _WALLET,
+            client,
+            sequence_manager=manager,
+        )
+        # the rejected transaction used a Ticket, not the next sequence number
+        transaction = await autofill(
+            AccountSet(account=_WALLET.classic_address),
+            client,
+            sequence_manager=manager,
+        )
+        self.assertEqual(transaction.sequence, 8)
+        self.assertEqual(client.methods.count("account_info"), 1)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+from xrpl.constants import XRPLException
+from xrpl.core.addresscodec import decode_classic_address
+from xrpl.core.binarycodec import encode_for_multisigning
+from xrpl.core.keypairs import sign
+from xrpl.models.transactions import AccountSet
+from xrpl.transaction import combine, multisign, verify_signers
+from xrpl.wallet import Wallet
+
+_ACCOUNT = Wallet.create()
+_SIGNERS = [Wallet.create() for _ in range(4)]
+
+_TRANSACTION = AccountSet(
+    account=_ACCOUNT.classic_address,
+    sequence=1,
+    fee="50",
+    last_ledger_sequence=100,
+)
+
+
+class TestMultisign(TestCase):
+    def test_signs_like_encode_for_multisigning(self):
+        signer = _SIGNERS[0]
+        signed = multisign(_TRANSACTION, signer)
+
+        payload = encode_for_multisigning(
+            _TRANSACTION.to_xrpl(), signer.classic_address
+        )
+        self.assertEqual(
+            signed.signers[0].txn_signature,
+            sign(bytes.fromhex(payload), signer.private_key),
+        )
+        self.assertEqual(signed.signers[0].signing_pub_key, signer.public_key)
+        self.assertEqual(signed.signing_pub_key, "")
+
+    def test_combine_sorts_by_account_id(self):
+        combined = combine(
+            [multisign(_TRANSACTION, signer) for signer in reversed(_SIGNERS)]
+        )
+
+        accounts = [signer.account for signer in combined.signers]
+        self.assertEqual(accounts, sorted(accounts, key=decode_classic_address))
+        self.assertEqual(len(accounts), len(_SIGNERS))
+        self.assertEqual(combined, multisign(_TRANSACTION, *_SIGNERS))
+        self.assertTrue(verify_signers(combined))
+
+    def test_combine_rejects_different_transactions(self):
+        other = AccountSet(account=_ACCOUNT.classic_address, sequence=2, fee="50")
+        with self.assertRaises(XRPLException):
+            combine(
+                [multisign(_TRANSACTION, _SIGNERS[0]), multisign(other, _SIGNERS[1])]
+            )
+        with self.assertRaises(XRPLException):
+            combine([_TRANSACTION])
+
+    def test_verify_signers_rejects_a_bad_signature(self):
+        signed = multisign(_TRANSACTION, *_SIGNERS[:2])
+        tampered = AccountSet.from_dict(
+            {**signed.to_dict(), "fee": "60", "transaction_type": "AccountSet"}
+        )
+
+        self.assertTrue(verify_signers(signed))
+        self.assertFalse(verify_signers(tampered))
+        self.assertFalse(verify_signers(_TRANSACTION))
@@ -0,0 +1,138 @@
+import asyncio
+from unittest.mock import patch
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from tests.unit.clients.stand_in_server import StandInServer
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.transaction import (
+    XRPLReliableSubmissionException,
+    safe_sign_transaction,
+    send_reliable_submission,
+)
+from xrpl.models.requests import StreamParameter, Subscribe
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import AccountSet
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+_SUBMIT_RESULT = {"engine_result": "tesSUCCESS", "engine_result_message": ""}
+
+
+async def _signed_transaction():
+    return await safe_sign_transaction(
+        AccountSet(
+            account=_WALLET.classic_address,
+            sequence=1,
+            fee="10",
+            last_ledger_sequence=110,
+        ),
+        _WALLET,
+        False,
+    )
+
+
+async def _wait_for_command(server, command):
+    while not any(request["command"] == command for request in server.received):
+        await asyncio.sleep(0.01)
+
+
+class _PollingClient(AsyncClient):
+    def __init__(self, validated_after):
+        super().__init__("stand-in")
+        self.validated_after = validated_after
+        self.methods = []
+
+    async def request_impl(self, request):
+        method = request.method.value
+        self.methods.append(method)
+        if method == "submit":
+            result = _SUBMIT_RESULT
+        elif method == "tx":
+            validated = self.methods.count("tx") > self.validated_after
+            result = {"validated": validated, "LastLedgerSequence": 110}
+        else:
+            result = {"ledger_index": 100}
+        return Response(status=ResponseStatus.SUCCESS, result=result)
+
+
+class TestReliableSubmission(IsolatedAsyncioTestCase):
+    async def test_resolves_on_validated_transaction_message(self):
+        transaction = await _signed_transaction()
+        results = {
+            "submit": _SUBMIT_RESULT,
+            "tx": {"validated": True, "hash": transaction.get_hash()},
+        }
+        async with StandInServer(results) as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                submission = asyncio.ensure_future(
+                    send_reliable_submission(transaction, client)
+                )
+                await _wait_for_command(server, "submit")
+                await server.push(
+                    {
+                        "type": "transaction",
+                        "validated": True,
+                        "transaction": {
+                            "Account": _WALLET.classic_address,
+                            "hash": transaction.get_hash(),
+                        },
+                        "meta": {"AffectedNodes": []},
+                    }
+                )
+                response = await asyncio.wait_for(submission, 1)
+
+                self.assertTrue(response.result["validated"])
+                commands = [request["command"] for request in server.received]
+                self.assertEqual(commands, ["subscribe", "submit", "tx", "unsubscribe"])
+                self.assertEqual(
+                    server.received[0]["accounts"], [_WALLET.classic_address]
+                )
+                self.assertEqual(server.received[0]["streams"], ["ledger"])
+
+    async def test_raises_once_last_ledger_closes(self):
+        transaction = await _signed_transaction()
+        results = {"submit": _SUBMIT_RESULT, "tx": {"validated": False}}
+        async with StandInServer(results) as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                await client.request(Subscribe(streams=[StreamParameter.LEDGER]))
+                submission = asyncio.ensure_future(
+                    send_reliable_submission(transaction, client)
+                )
+                await _wait_for_command(server, "submit")
+                await server.push({"type": "ledgerClosed", "ledger_index": 109})
+                await server.push({"type": "ledgerClosed", "ledger_index": 110})
+
+                with self.assertRaises(XRPLReliableSubmissionException):
+                    await asyncio.wait_for(submission, 1)
+                commands = [request["command"] for request in server.received]
+                self.assertEqual(commands.count("tx"), 1)
+                # the ledger stream was already subscribed to by the caller
+                self.assertEqual(server.received[-1]["command"], "unsubscribe")
+                self.assertNotIn("streams", server.received[-1])
+                # the caller's own iteration on the client still gets the ledgers
+                messages = [
+                    client._messages.get_nowait()
+                    for _ in range(client._messages.qsize())
+                ]
+                self.assertEqual(
+                    [
+                        message["ledger_index"]
+                        for message in messages
+                        if message["type"] == "ledgerClosed"
+                    ],
+                    [109, 110],
+                )
+
+    @patch("xrpl.asyncio.transaction.reliable_submission._FIRST_POLL_DELAY", 0)
+    async def test_polls_without_stream(self):
+        client = _PollingClient(validated_after=3)
+        response = await send_reliable_submission(await _signed_transaction(), client)
+
+        self.assertTrue(response.result["validated"])
+        self.assertEqual(client.methods.count("tx"), 4)
@@ -0,0 +1,76 @@
+import asyncio
+from unittest import TestCase
+
+from xrpl.clients.sync_client import SyncClient
+from xrpl.constants import XRPLException
+from xrpl.core.binarycodec import encode
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import AccountSet
+from xrpl.transaction import safe_sign_transaction, sign_many, submit_transaction
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+_TRANSACTIONS = [
+    AccountSet(
+        account=_WALLET.classic_address,
+        sequence=sequence,
+        fee="10",
+        last_ledger_sequence=100,
+    )
+    for sequence in range(1, 6)
+]
+
+
+class _SubmitClient(SyncClient):
+    def __init__(self):
+        super().__init__("stand-in")
+        self.tx_blobs = []
+
+    async def request_impl(self, request):
+        self.tx_blobs.append(request.tx_blob)
+        return Response(status=ResponseStatus.SUCCESS, result={})
+
+
+class TestSignMany(TestCase):
+    def test_matches_safe_sign_transaction(self):
+        signed = sign_many(_TRANSACTIONS, _WALLET)
+
+        for transaction, signed_transaction in zip(_TRANSACTIONS, signed):
+            expected = safe_sign_transaction(transaction, _WALLET)
+            self.assertEqual(signed_transaction.tx_blob, encode(expected.to_xrpl()))
+            self.assertEqual(signed_transaction.hash, expected.get_hash())
+            self.assertEqual(signed_transaction.transaction, expected)
+
+    def test_builds_the_model_on_demand(self):
+        signed_transaction = sign_many(_TRANSACTIONS[:1], _WALLET)[0]
+        self.assertIsNone(signed_transaction._transaction)
+        self.assertEqual(signed_transaction.account, _WALLET.classic_address)
+        self.assertEqual(signed_transaction.last_ledger_sequence, 100)
+        self.assertIs(signed_transaction.transaction, signed_transaction.transaction)
+
+    def test_submits_the_signed_blob(self):
+        client = _SubmitClient()
+        signed_transaction = sign_many(_TRANSACTIONS[:1], _WALLET)[0]
+        submit_transaction(signed_transaction, client)
+        self.assertEqual(client.tx_blobs, [signed_transaction.tx_blob])
+
+    def test_process_pool_keeps_order(self):
+        self.assertEqual(
+            [signed.tx_blob for signed in sign_many(_TRANSACTIONS, _WALLET, workers=2)],
+            [signed.tx_blob for signed in sign_many(_TRANSACTIONS, _WALLET)],
+        )
+
+    def test_can_be_called_from_a_coroutine(self):
+        async def sign():
+            return sign_many(_TRANSACTIONS, _WALLET)
+
+        self.assertEqual(len(asyncio.run(sign())), len(_TRANSACTIONS))
+
+    def test_checks_fees(self):
+        transaction = AccountSet(
+            account=_WALLET.classic_address, sequence=1, fee="3000000"
+        )
+        with self.assertRaises(XRPLException):
+            sign_many([transaction], _WALLET)
+        self.assertEqual(len(sign_many([transaction], _WALLET, check_fee=False)), 1)
@@ -0,0 +1,113 @@
+import asyncio
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.transaction import (
+    SubmissionTracker,
+    XRPLReliableSubmissionException,
+    safe_sign_transaction,
+)
+from xrpl.core.binarycodec import decode
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import AccountSet
+from xrpl.models.transactions.transaction import Transaction
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+
+async def _signed_transaction(sequence, last_ledger_sequence=110):
+    return await safe_sign_transaction(
+        AccountSet(
+            account=_WALLET.classic_address,
+            sequence=sequence,
+            fee="10",
+            last_ledger_sequence=last_ledger_sequence,
+        ),
+        _WALLET,
+        False,
+    )
+
+
+class _LedgerClient(AsyncClient):
+    """Validates every submitted transaction with a sequence below 10."""
+
+    def __init__(self, engine_result="tesSUCCESS"):
+        super().__init__("stand-in")
+        self.engine_result = engine_result
+        self.validated_ledger = 100
+        self.ledgers = {}
+        self.methods = []
+
+    async def request_impl(self, request):
+        method = request.method.value
+        self.methods.append(method)
+        await asyncio.sleep(0)
+        if method == "submit":
+            transaction = Transaction.from_xrpl(decode(request.tx_blob))
+            if transaction.sequence < 10:
+                self.ledgers.setdefault(self.validated_ledger + 1, []).append(
+                    {"hash": transaction.get_hash(), "metaData": {"index": 0}}
+                )
+            result = {
+                "engine_result": self.engine_result,
+                "engine_result_message": "",
+            }
+        elif method == "ledger" and request.ledger_index == "validated":
+            # a new ledger is validated every time it is asked for
+            self.validated_ledger += 1
+            result = {"ledger_index": self.validated_ledger}
+        elif method == "ledger":
+            result = {
+                "ledger": {"transactions": self.ledgers.get(request.ledger_index, [])}
+            }
+        else:
+            return Response(
+                status=ResponseStatus.ERROR, result={"error": "txnNotFound"}
+            )
+        return Response(status=ResponseStatus.SUCCESS, result=result)
+
+
+class TestSubmissionTracker(IsolatedAsyncioTestCase):
+    async def test_settles_transactions_from_one_scan_per_ledger(self):
+        client = _LedgerClient()
+        tracker = SubmissionTracker(client, poll_interval=0)
+        validated = [await _signed_transaction(sequence) for sequence in (1, 2, 3)]
+        expired = await _signed_transaction(10, last_ledger_sequence=103)
+
+        futures = [tracker.track(transaction) for transaction in validated]
+        expired_future = tracker.track(expired)
+        outcomes = [outcome async for outcome in tracker.completed()]
+
+        for future in futures:
+            response = await future
+            self.assertTrue(response.result["validated"])
+            self.assertEqual(response.result["meta"], {"index": 0})
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await expired_future
+        self.assertEqual(len(outcomes), 4)
+        self.assertEqual(tracker.pending, 0)
+        scans = [method for method in client.methods if method in ("ledger", "tx")]
+        # one look-up of each ledger, plus one of the expired transaction
+        self.assertLessEqual(len(scans), 2 * (client.validated_ledger - 100) + 1)
+
+    async def test_malformed_transaction_fails_at_once(self):
+        client = _LedgerClient(engine_result="temMALFORMED")
+        tracker = SubmissionTracker(client, poll_interval=0)
+
+        future = tracker.track(await _signed_transaction(1))
+
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await future
+        await tracker.close()
+
+    async def test_requires_last_ledger_sequence(self):
+        tracker = SubmissionTracker(_LedgerClient())
+        with self.assertRaises(XRPLReliableSubmissionException):
+            tracker.track(
+                AccountSet(account=_WALLET.classic_address, sequence=1, fee="10")
+            )
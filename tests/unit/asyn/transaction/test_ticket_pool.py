@@ -0,0 +1,143 @@
+import asyncio
+from unittest.mock import patch
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.transaction import TicketPool, autofill
+from xrpl.constants import XRPLException
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import AccountSet
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+
+class _TicketClient(AsyncClient):
+    def __init__(self, pages, ticket_create_result="tesSUCCESS"):
+        super().__init__("stand-in")
+        self.pages = pages
+        self.ticket_create_result = ticket_create_result
+        self.methods = []
+        self.submitted = []
+        self.sequence = 40
+
+    async def request_impl(self, request):
+        method = request.method.value
+        self.methods.append(method)
+        await asyncio.sleep(0)
+        if method == "account_objects":
+            page = request.marker or 0
+            result = {
+                "account_objects": [
+                    {"LedgerEntryType": "Ticket", "TicketSequence": ticket}
+                    for ticket in self.pages[page]
+                ]
+            }
+            if page + 1 < len(self.pages):
+                result["marker"] = page + 1
+        elif method == "account_info":
+            result = {"account_data": {"Sequence": self.sequence}}
+        elif method == "fee":
+            result = {
+                "current_queue_size": "0",
+                "max_queue_size": "2000",
+                "drops": {"base_fee": "10", "open_ledger_fee": "10"},
+            }
+        elif method == "ledger":
+            result = {"ledger_index": 100}
+        elif method == "submit":
+            self.submitted.append(request.tx_blob)
+            result = {"engine_result": "tesSUCCESS"}
+        elif method == "tx":
+            result = {
+                "validated": True,
+                "meta": {"TransactionResult": self.ticket_create_result},
+            }
+        return Response(status=ResponseStatus.SUCCESS, result=result)
+
+
+class TestTicketPool(IsolatedAsyncioTestCase):
+    async def test_discovers_tickets_over_pages(self):
+        client = _TicketClient([[3, 5], [4]])
+        pool = TicketPool(_WALLET, refill_below=0)
+
+        tickets = await asyncio.gather(*(pool.lease(client) for _ in range(3)))
+
+        self.assertEqual(sorted(tickets), [3, 4, 5])
+        self.assertEqual(client.methods, ["account_objects", "account_objects"])
+
+    async def test_released_tickets_are_leased_again(self):
+        client = _TicketClient([[3, 4]])
+        pool = TicketPool(_WALLET, refill_below=0)
+        ticket = await pool.lease(client)
+
+        pool.check_result("tesSUCCESS", await pool.lease(client))
+        pool.check_result("tefPAST_SEQ", ticket)
+
+        self.assertEqual(await pool.lease(client), ticket)
+        await pool.discover(client)
+        self.assertEqual(pool.available, 0)
+
+    async def test_unknown_tickets_are_dropped(self):
+        client = _TicketClient([[3]])
+        pool = TicketPool(_WALLET, refill_below=0)
+        pool.check_result("tefNO_TICKET", await pool.lease(client))
+
+        self.assertEqual(pool.available, 0)
+
+    @patch("xrpl.asyncio.transaction.reliable_submission._FIRST_POLL_DELAY", 0)
+    async def test_refills_when_empty(self):
+        client = _TicketClient([[]])
+        pool = TicketPool(_WALLET, refill_below=1, refill_count=3)
+
+        tickets = await asyncio.gather(*(pool.lease(client) for _ in range(2)))
+
+        # the TicketCreate takes sequence 40, so the Tickets are 41 to 43
+        self.assertEqual(sorted(tickets), [41, 42])
+        self.assertEqual(client.methods.count("submit"), 1)
+
+    @patch("xrpl.asyncio.transaction.reliable_submission._FIRST_POLL_DELAY", 0)
+    async def test_failed_refill_raises(self):
+        client = _TicketClient([[]], ticket_create_result="tecINSUFFICIENT_RESERVE")
+        pool = TicketPool(_WALLET)
+
+        with self.assertRaises(XRPLException):
+            await pool.lease(client)
+
+    @patch("xrpl.asyncio.transaction.reliable_submission._FIRST_POLL_DELAY", 0)
+    async def test_leases_more_tickets_than_an_account_can_own(self):
+        # the ledger has no Tickets left: every leased Ticket has been used
+        client = _TicketClient([[]])
+        pool = TicketPool(_WALLET, refill_count=50)
+        tickets = set()
+        for _ in range(300):
+            tickets.add(await pool.lease(client))
+            # each TicketCreate creates its Tickets after its own sequence
+            client.sequence = max(tickets) + 1
+
+        self.assertEqual(len(tickets), 300)
+        # once the account seemed full, its Tickets were looked up again
+        self.assertEqual(client.methods.count("account_objects"), 2)
+
+    async def test_submit_uses_ticket(self):
+        client = _TicketClient([[3]])
+        pool = TicketPool(_WALLET, refill_below=0)
+
+        await pool.submit(AccountSet(account=_WALLET.classic_address), client)
+
+        self.assertEqual(len(client.submitted), 1)
+        self.assertNotIn("account_info", client.methods)
+        self.assertEqual(pool.available, 0)
+
+    async def test_autofill_ticketed_transaction(self):
+        client = _TicketClient([[]])
+        transaction = await autofill(
+            AccountSet(account=_WALLET.classic_address, ticket_sequence=3), client
+        )
+
+        self.assertEqual(transaction.sequence, 0)
+        self.assertNotIn("account_info", client.methods)
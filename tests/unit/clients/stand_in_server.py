@@ -0,0 +1,71 @@
+"""A local stand-in for a rippled WebSocket server, for client unit tests."""
+import asyncio
+import json
+
+from websockets.legacy.server import serve
+
+
+class StandInServer:
+    """
+    Answers every request with a successful response and lets tests push
+    stream messages to connected clients.
+
+    ``results`` maps a command to either a result dict or a function of the
+    request returning one. ``delay`` is how long, in seconds, each response takes.
+    """
+
+    def __init__(self, results=None, delay=0):
+        self.results = results if results is not None else {}
+        self.delay = delay
+        self.received = []
+        self.connections = set()
+        self._server = None
+
+    @property
+    def url(self):
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    async def __aenter__(self):
+        self._server = await serve(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *_args):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, websocket, _path=None):
+        self.connections.add(websocket)
+        try:
+            async for raw in websocket:
+                request = json.loads(raw)
+                self.received.append(request)
+                result = self.results.get(request["command"], {})
+                if callable(result):
+                    result = result(request)
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                await websocket.send(
+                    json.dumps(
+                        {
+                            "id": request.get("id"),
+                            "result": result,
+                            "status": "success",
+                            "type": "response",
+                        }
+                    )
+                )
+        finally:
+            self.connections.discard(websocket)
+
+    async def push(self, message):
+        for websocket in list(self.connections):
+            await websocket.send(json.dumps(message))
+
+    async def wait_for_connections(self, count=1):
+        while len(self.connections) < count:
+            await asyncio.sleep(0.01)
+
+    async def drop_connections(self):
+        for websocket in list(self.connections):
+            await websocket.close()
@@ -0,0 +1,410 @@
+import asyncio
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from tests.unit.clients.stand_in_server import StandInServer
+from xrpl.asyncio.clients import (
+    AsyncWebsocketClient,
+    ConnectionState,
+    QueueOverflowPolicy,
+    ReconnectPolicy,
+)
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
+from xrpl.models.currencies import XRP, IssuedCurrency
+from xrpl.models.requests import (
+    Ping,
+    StreamParameter,
+    Subscribe,
+    SubscribeBook,
+    Unsubscribe,
+)
+
+
+def _ledger_closed(ledger_index):
+    return {"type": "ledgerClosed", "ledger_index": ledger_index}
+
+
+class TestAsyncWebsocketClientQueue(IsolatedAsyncioTestCase):
+    async def _fill_queue(self, server, client, count):
+        await server.wait_for_connections()
+        for ledger_index in range(count):
+            await server.push(_ledger_closed(ledger_index))
+        # a round trip guarantees every pushed message has been handled
+        await client.request(Ping())
+
+    async def test_unbounded_by_default(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                await self._fill_queue(server, client, 5)
+                self.assertEqual(client._messages.qsize(), 6)
+                self.assertEqual(client.dropped_messages, 0)
+
+    async def test_drop_newest(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(
+                server.url,
+                max_queue_size=2,
+                overflow_policy=QueueOverflowPolicy.DROP_NEWEST,
+            ) as client:
+                await self._fill_queue(server, client, 5)
+                self.assertEqual(client.dropped_messages, 4)
+                self.assertEqual((await client._do_pop_message())["ledger_index"], 0)
+                self.assertEqual((await client._do_pop_message())["ledger_index"], 1)
+
+    async def test_drop_oldest(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(
+                server.url,
+                max_queue_size=2,
+                overflow_policy=QueueOverflowPolicy.DROP_OLDEST,
+                queue_request_responses=False,
+            ) as client:
+                await self._fill_queue(server, client, 5)
+                self.assertEqual(client.dropped_messages, 3)
+                self.assertEqual((await client._do_pop_message())["ledger_index"], 3)
+                self.assertEqual((await client._do_pop_message())["ledger_index"], 4)
+
+    async def test_raise(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(
+                server.url,
+                max_queue_size=2,
+                overflow_policy=QueueOverflowPolicy.RAISE,
+            ) as client:
+                await server.wait_for_connections()
+                for ledger_index in range(3):
+                    await server.push(_ledger_closed(ledger_index))
+                while client.dropped_messages == 0:
+                    await asyncio.sleep(0.01)
+                with self.assertRaises(XRPLWebsocketException):
+                    async for _ in client:
+                        pass
+                # no response would ever be read, so new requests fail at once
+                with self.assertRaises(XRPLWebsocketException):
+                    await asyncio.wait_for(client.request(Ping()), 1)
+
+    async def test_raise_wakes_up_stream_consumers(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(
+                server.url,
+                overflow_policy=QueueOverflowPolicy.RAISE,
+            ) as client:
+                transactions = client.stream("transaction")
+                waiting = asyncio.ensure_future(transactions.__anext__())
+                ledgers = client.stream(StreamParameter.LEDGER, max_queue_size=1)
+                first_ledger = asyncio.ensure_future(ledgers.__anext__())
+                await asyncio.sleep(0.05)
+
+                await server.wait_for_connections()
+                for ledger_index in range(3):
+                    await server.push(_ledger_closed(ledger_index))
+                with self.assertRaisesRegex(XRPLWebsocketException, r"\(1 messages"):
+                    await asyncio.wait_for(waiting, 1)
+                with self.assertRaises(XRPLWebsocketException):
+                    await asyncio.wait_for(first_ledger, 1)
+
+    async def test_block_keeps_every_message(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url, max_queue_size=1) as client:
+                await server.wait_for_connections()
+                for ledger_index in range(3):
+                    await server.push(_ledger_closed(ledger_index))
+                received = [(await client._do_pop_message()) for _ in range(3)]
+                self.assertEqual([m["ledger_index"] for m in received], [0, 1, 2])
+                self.assertEqual(client.dropped_messages, 0)
+
+    async def test_request_responses_not_queued(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(
+                server.url, queue_request_responses=False
+            ) as client:
+                response = await client.request(Ping())
+                self.assertTrue(response.is_successful())
+                self.assertEqual(client._messages.qsize(), 0)
+
+                await client.send(Ping(id="sent"))
+                self.assertEqual((await client._do_pop_message())["id"], "sent")
+
+
+_ACCOUNT = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+_OTHER_ACCOUNT = "rPT1Sjq2YGrBMTttX4GZHjKu9dyfzbpAYe"
+_ISSUER = "rvYAfWj5gh67oV6fW32ZzP3Aw4Eubs59B"
+
+
+def _transaction(account, destination, ledger_index=1):
+    return {
+        "type": "transaction",
+        "ledger_index": ledger_index,
+        "validated": True,
+        "transaction": {
+            "Account": account,
+            "Destination": destination,
+            "TransactionType": "Payment",
+        },
+        "meta": {"AffectedNodes": []},
+    }
+
+
+def _offer(taker_gets, taker_pays):
+    return {
+        "type": "transaction",
+        "validated": True,
+        "transaction": {
+            "Account": _OTHER_ACCOUNT,
+            "TakerGets": taker_gets,
+            "TakerPays": taker_pays,
+            "TransactionType": "OfferCreate",
+        },
+        "meta": {"AffectedNodes": []},
+    }
+
+
+class TestAsyncWebsocketClientStreams(IsolatedAsyncioTestCase):
+    async def _next(self, iterator):
+        return await asyncio.wait_for(iterator.__anext__(), 1)
+
+    async def test_stream_by_type(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                ledgers = client.stream(StreamParameter.LEDGER)
+                transactions = client.stream("transaction")
+                # start both iterators so that they are registered
+                ledger_task = asyncio.ensure_future(self._next(ledgers))
+                transaction_task = asyncio.ensure_future(self._next(transactions))
+                await asyncio.sleep(0.05)
+
+                await server.wait_for_connections()
+                await server.push(_transaction(_ACCOUNT, _OTHER_ACCOUNT))
+                await server.push(_ledger_closed(7))
+
+                self.assertEqual((await ledger_task)["ledger_index"], 7)
+                self.assertEqual((await transaction_task)["type"], "transaction")
+                # routed messages are not duplicated into the generic queue
+                await client.request(Ping())
+                self.assertEqual(client._messages.qsize(), 1)
+
+    async def test_stream_registers_its_queue_when_called(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                ledgers = client.stream(StreamParameter.LEDGER)
+
+                await server.wait_for_connections()
+                await server.push(_ledger_closed(7))
+                await client.request(Ping())
+
+                # the message arrived before the first read, and is not lost
+                self.assertEqual((await ledgers.__anext__())["ledger_index"], 7)
+                self.assertEqual(client._messages.qsize(), 1)
+                await ledgers.aclose()
+                self.assertEqual(client._stream_subscribers, {})
+                with self.assertRaises(StopAsyncIteration):
+                    await ledgers.__anext__()
+
+    async def test_stream_fan_out_by_account(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                mine = client.stream(StreamParameter.TRANSACTIONS, account=_ACCOUNT)
+                task = asyncio.ensure_future(self._next(mine))
+                await asyncio.sleep(0.05)
+
+                await server.wait_for_connections()
+                await server.push(_transaction(_OTHER_ACCOUNT, _ISSUER, 1))
+                await server.push(_transaction(_OTHER_ACCOUNT, _ACCOUNT, 2))
+
+                self.assertEqual((await task)["ledger_index"], 2)
+                # the unmatched transaction falls back to the generic queue
+                self.assertEqual((await client._do_pop_message())["ledger_index"], 1)
+
+    async def test_callbacks_by_book(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                received = []
+                usd = IssuedCurrency(currency="USD", issuer=_ISSUER)
+                book = SubscribeBook(taker_gets=XRP(), taker_pays=usd, taker=_ACCOUNT)
+                client.on("transaction", received.append, book=book)
+
+                await server.wait_for_connections()
+                usd_amount = {"currency": "USD", "issuer": _ISSUER, "value": "1"}
+                await server.push(_offer(usd_amount, "100"))
+                await server.push(_offer("100", usd_amount))
+                await client.request(Ping())
+                await asyncio.sleep(0)
+
+                self.assertEqual(len(received), 1)
+                self.assertEqual(received[0]["transaction"]["TakerGets"], "100")
+
+                client.off("transaction", received.append, book=book)
+                self.assertEqual(client._stream_subscribers, {})
+
+    async def test_callbacks_that_do_not_consume(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                received = []
+                client.on(StreamParameter.LEDGER, received.append, consume=False)
+                await client.request(Subscribe(streams=[StreamParameter.LEDGER]))
+                self.assertEqual(
+                    client.subscriptions[0].streams, [StreamParameter.LEDGER]
+                )
+                await client._do_pop_message()
+
+                await server.push(_ledger_closed(7))
+                await client.request(Ping())
+                await asyncio.sleep(0)
+
+                self.assertEqual(received, [_ledger_closed(7)])
+                self.assertEqual((await client._do_pop_message())["ledger_index"], 7)
+
+    async def test_stream_ends_on_close(self):
+        async with StandInServer() as server:
+            client = AsyncWebsocketClient(server.url)
+            await client.open()
+            ledgers = client.stream(StreamParameter.LEDGER)
+            task = asyncio.ensure_future(ledgers.__anext__())
+            await asyncio.sleep(0.05)
+            await client.close()
+            with self.assertRaises(StopAsyncIteration):
+                await asyncio.wait_for(task, 1)
+
+
+_FAST_RECONNECT = ReconnectPolicy(base_delay=0.01, max_delay=0.05)
+
+
+class TestAsyncWebsocketClientReconnect(IsolatedAsyncioTestCase):
+    async def _wait_for_state(self, states, state):
+        while not states or states[-1]["state"] != state:
+            await asyncio.sleep(0.01)
+        return states[-1]
+
+    async def test_resubscribes_and_reports_gap(self):
+        async with StandInServer({"subscribe": {"ledger_index": 10}}) as server:
+            async with AsyncWebsocketClient(
+                server.url, reconnect=_FAST_RECONNECT
+            ) as client:
+                states = []
+                client.on("connectionState", states.append)
+                await client.request(
+                    Subscribe(streams=[StreamParameter.LEDGER], accounts=[_ACCOUNT])
+                )
+                await client.request(Unsubscribe(accounts=[_ACCOUNT]))
+                await server.push(_ledger_closed(5))
+                await client.request(Ping())
+
+                await server.drop_connections()
+                connected = await asyncio.wait_for(
+                    self._wait_for_state(states, "connected"), 1
+                )
+
+                self.assertEqual(states[0]["state"], "reconnecting")
+                self.assertEqual(connected["last_ledger_index"], 5)
+                self.assertEqual(connected["ledger_index"], 10)
+                self.assertEqual(client.connection_state, ConnectionState.CONNECTED)
+                replayed = server.received[-1]
+                self.assertEqual(replayed["command"], "subscribe")
+                self.assertEqual(replayed["streams"], ["ledger"])
+                self.assertNotIn("accounts", replayed)
+
+                response = await client.request(Ping())
+                self.assertTrue(response.is_successful())
+
+    async def test_gives_up_after_max_attempts(self):
+        async with StandInServer() as server:
+            client = AsyncWebsocketClient(
+                server.url,
+                reconnect=ReconnectPolicy(max_attempts=2, base_delay=0.05),
+            )
+            await client.open()
+            states = []
+            client.on("connectionState", states.append)
+            await server.wait_for_connections()
+        # the server is gone, so every attempt fails
+        while client.connection_state != ConnectionState.RECONNECTING:
+            await asyncio.sleep(0.01)
+        with self.assertRaises(XRPLWebsocketException):
+            # sent while reconnecting, so it waits until the client gives up
+            await asyncio.wait_for(client.send(Ping()), 1)
+        self.assertEqual(client.connection_state, ConnectionState.DISCONNECTED)
+        await asyncio.sleep(0)
+        self.assertEqual(
+            [state["state"] for state in states],
+            ["reconnecting", "reconnecting", "disconnected"],
+        )
+        self.assertFalse(client.is_open())
+        await client.close()
+
+    async def test_reports_drop_without_policy(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                states = []
+                client.on("connectionState", states.append)
+                await server.wait_for_connections()
+                await server.drop_connections()
+                message = await asyncio.wait_for(
+                    self._wait_for_state(states, "disconnected"), 1
+                )
+                self.assertEqual(message["type"], "connectionState")
+                # the generic message queue only gets what the server sent
+                self.assertEqual(client._messages.qsize(), 0)
+
+    async def test_pending_requests_fail_without_policy(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                await server.wait_for_connections()
+                client._set_up_future(Ping(id="pending"))
+                client._awaited_requests.add("pending")
+                await server.drop_connections()
+                with self.assertRaises(XRPLWebsocketException):
+                    await asyncio.wait_for(client._open_requests["pending"], 1)
+
+
+class TestAsyncWebsocketClientCallbacks(IsolatedAsyncioTestCase):
+    async def test_subscriber_matching_several_keys_gets_message_once(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                received = []
+                usd = IssuedCurrency(currency="USD", issuer=_ISSUER)
+                book = SubscribeBook(
+                    taker_gets=XRP(), taker_pays=usd, taker=_ACCOUNT, both=True
+                )
+                client.on("transaction", received.append, account=_OTHER_ACCOUNT)
+                client.on("transaction", received.append, book=book)
+
+                await server.wait_for_connections()
+                usd_amount = {"currency": "USD", "issuer": _ISSUER, "value": "1"}
+                offer = _offer(usd_amount, "100")
+                # a crossing offer touches both directions of the book
+                offer["meta"]["AffectedNodes"].append(
+                    {
+                        "ModifiedNode": {
+                            "FinalFields": {"TakerGets": "100", "TakerPays": usd_amount}
+                        }
+                    }
+                )
+                await server.push(offer)
+                await client.request(Ping())
+                await asyncio.sleep(0)
+
+                # once per registration
+                self.assertEqual(len(received), 2)
+
+    async def test_coroutine_callback_errors_are_reported(self):
+        async with StandInServer() as server:
+            async with AsyncWebsocketClient(server.url) as client:
+                errors = []
+                asyncio.get_running_loop().set_exception_handler(
+                    lambda _loop, context: errors.append(context["exception"])
+                )
+
+                async def fail(message):
+                    raise ValueError(message["ledger_index"])
+
+                client.on(StreamParameter.LEDGER, fail)
+                await server.wait_for_connections()
+                await server.push(_ledger_closed(3))
+                await client.request(Ping())
+                await asyncio.sleep(0.01)
+
+                self.assertEqual([str(error) for error in errors], ["3"])
+                self.assertEqual(client._callback_tasks, set())
@@ -0,0 +1,115 @@
+import asyncio
+from contextlib import AsyncExitStack
+from unittest import TestCase
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from tests.unit.clients.stand_in_server import StandInServer
+from xrpl.asyncio.clients import (
+    AsyncClientPool,
+    AsyncJsonRpcClient,
+    AsyncWebsocketClient,
+)
+from xrpl.clients import ClientPool, JsonRpcClient, WebsocketClient
+from xrpl.constants import XRPLException
+from xrpl.models.requests import Ping, SubmitOnly
+
+
+def _server_info(validated_ledger=100, server_state="full"):
+    return {
+        "server_info": {
+            "info": {
+                "server_state": server_state,
+                "validated_ledger": {"seq": validated_ledger},
+            }
+        }
+    }
+
+
+def _commands(server):
+    return [request["command"] for request in server.received]
+
+
+class TestAsyncClientPool(IsolatedAsyncioTestCase):
+    async def _open_pool(self, stack, servers, **kwargs):
+        clients = []
+        for server in servers:
+            await stack.enter_async_context(server)
+            clients.append(
+                await stack.enter_async_context(AsyncWebsocketClient(server.url))
+            )
+        return AsyncClientPool(clients, **kwargs)
+
+    async def test_routes_to_fastest_node(self):
+        slow = StandInServer(_server_info(), delay=0.05)
+        fast = StandInServer(_server_info())
+        async with AsyncExitStack() as stack:
+            pool = await self._open_pool(stack, [slow, fast])
+            response = await pool.request(Ping())
+
+            self.assertTrue(response.is_successful())
+            self.assertEqual(_commands(slow), ["server_info"])
+            self.assertEqual(_commands(fast), ["server_info", "ping"])
+            self.assertLess(pool.nodes[1].latency, pool.nodes[0].latency)
+
+    async def test_later_health_checks_run_in_background(self):
+        slow = StandInServer(_server_info(), delay=0.3)
+        fast = StandInServer(_server_info())
+        async with AsyncExitStack() as stack:
+            pool = await self._open_pool(stack, [slow, fast], health_check_interval=0)
+            await pool.request(Ping())
+
+            await asyncio.wait_for(pool.request(Ping()), 0.2)
+            self.assertFalse(pool._health_check_task.done())
+            await pool._health_check_task
+
+    async def test_skips_unsynced_and_lagging_nodes(self):
+        unsynced = StandInServer(_server_info(server_state="connected"))
+        lagging = StandInServer(_server_info(validated_ledger=90))
+        synced = StandInServer(_server_info(), delay=0.02)
+        async with AsyncExitStack() as stack:
+            pool = await self._open_pool(stack, [unsynced, lagging, synced])
+            await pool.request(Ping())
+
+            self.assertEqual(
+                [node.healthy for node in pool.nodes], [False, False, True]
+            )
+            self.assertEqual(_commands(synced), ["server_info", "ping"])
+            self.assertNotIn("ping", _commands(unsynced) + _commands(lagging))
+
+    async def test_fails_over_to_reachable_node(self):
+        async with StandInServer(_server_info(), delay=0.02) as server:
+            async with AsyncWebsocketClient(server.url) as websocket_client:
+                # nothing listens on port 1, so every request to it fails
+                pool = AsyncClientPool(
+                    [AsyncJsonRpcClient("http://127.0.0.1:1"), websocket_client],
+                    health_check_interval=3600,
+                )
+                await pool.check_health()
+                # pretend the unreachable node is healthy and fastest
+                pool.nodes[0].healthy = True
+                pool.nodes[0].latency = 0
+
+                response = await pool.request(Ping())
+                self.assertTrue(response.is_successful())
+                self.assertFalse(pool.nodes[0].healthy)
+
+    async def test_submit_fans_out(self):
+        servers = [StandInServer(_server_info()) for _ in range(3)]
+        async with AsyncExitStack() as stack:
+            pool = await self._open_pool(stack, servers, submit_fan_out=2)
+            await pool.request(SubmitOnly(tx_blob="1200"))
+
+            submitted = [server for server in servers if "submit" in _commands(server)]
+            self.assertEqual(len(submitted), 2)
+
+
+class TestClientPool(TestCase):
+    def test_rejects_websocket_nodes(self):
+        with self.assertRaises(XRPLException):
+            ClientPool(
+                [JsonRpcClient("http://127.0.0.1:1"), WebsocketClient("ws://a:1")]
+            )
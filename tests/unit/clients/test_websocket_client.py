@@ -0,0 +1,73 @@
+import asyncio
+from threading import Thread
+from unittest import TestCase
+
+from tests.unit.clients.stand_in_server import StandInServer
+from xrpl.clients import WebsocketClient
+from xrpl.models.requests import Ping, StreamParameter
+
+
+class _ThreadedStandInServer:
+    """Runs a StandInServer on its own event loop, for the sync client."""
+
+    def __enter__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = self._run(StandInServer().__aenter__())
+        return self
+
+    def __exit__(self, *_args):
+        self._run(self.server.__aexit__())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def push_later(self, message, delay=0.1):
+        async def push():
+            await asyncio.sleep(delay)
+            await self.server.push(message)
+
+        asyncio.run_coroutine_threadsafe(push(), self.loop)
+
+
+class TestWebsocketClientStreams(TestCase):
+    def test_stream(self):
+        with _ThreadedStandInServer() as server:
+            with WebsocketClient(server.server.url, timeout=1) as client:
+                server.push_later({"type": "ledgerClosed", "ledger_index": 7})
+                ledgers = client.stream(StreamParameter.LEDGER)
+                self.assertEqual(next(ledgers)["ledger_index"], 7)
+                ledgers.close()
+                # the queue is closed on the client's event loop
+                client.request(Ping())
+                self.assertEqual(client._stream_subscribers, {})
+
+    def test_stream_registers_its_queue_when_called(self):
+        with _ThreadedStandInServer() as server:
+            with WebsocketClient(server.server.url, timeout=1) as client:
+                ledgers = client.stream(StreamParameter.LEDGER)
+                server.push_later({"type": "ledgerClosed", "ledger_index": 7}, 0)
+                while not ledgers._queue.qsize():
+                    client.request(Ping())
+                self.assertEqual(next(ledgers)["ledger_index"], 7)
+                ledgers.close()
+                client.request(Ping())
+                self.assertEqual(client._stream_subscribers, {})
+
+    def test_stream_stops_on_timeout(self):
+        with _ThreadedStandInServer() as server:
+            with WebsocketClient(server.server.url, timeout=0.1) as client:
+                self.assertEqual(list(client.stream(StreamParameter.LEDGER)), [])
+
+    def test_callbacks(self):
+        with _ThreadedStandInServer() as server:
+            with WebsocketClient(server.server.url, timeout=1) as client:
+                received = []
+                client.on(StreamParameter.LEDGER, received.append)
+                server.push_later({"type": "ledgerClosed", "ledger_index": 7}, 0)
+                while not received:
+                    client.request(Ping())
+                self.assertEqual(received[0]["ledger_index"], 7)
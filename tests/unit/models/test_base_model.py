@@ -1,9 +1,17 @@
 import json
 import os
+import pickle
 from unittest import TestCase
+from unittest.mock import patch
 
-from xrpl.models import XRPLModelException
+from xrpl.models import (
+    XRPLModelException,
+    set_trusted_construction,
+    trusted_construction,
+)
 from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.base_model import _key_to_json
+from xrpl.models.currencies import IssuedCurrency
 from xrpl.models.requests import (
     AccountChannels,
     BookOffers,
@@ -31,7 +39,7 @@ from xrpl.models.transactions import (
     TrustSet,
     TrustSetFlag,
 )
-from xrpl.models.transactions.transaction import Transaction
+from xrpl.models.transactions.transaction import Transaction, _key_to_tx_json
 
 currency = "BTC"
 value = "100"
@@ -53,6 +61,8 @@ check_create_dict = {
 
 secret = "topsecretpassword"
 
+_OTHER_ACCOUNT = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+
 
 class TestBaseModel(TestCase):
     maxDiff = 1000
@@ -61,6 +71,31 @@ class TestBaseModel(TestCase):
         amount = IssuedCurrencyAmount(**amount_dict)
         self.assertEqual(amount, IssuedCurrencyAmount(**amount_dict))
 
+    def test_eq_and_hash_are_structural(self):
+        def payment(amount):
+            return Payment(
+                account=account,
+                destination=_OTHER_ACCOUNT,
+                amount=IssuedCurrencyAmount(**{**amount_dict, "value": amount}),
+                flags={"TF_NO_DIRECT_RIPPLE": True},
+                memos=[Memo(memo_data="AA")],
+                paths=[[PathStep(account=_OTHER_ACCOUNT)]],
+            )
+
+        self.assertEqual(payment("10"), payment("10"))
+        self.assertNotEqual(payment("10"), payment("20"))
+        self.assertNotEqual(
+            IssuedCurrency(currency=currency, issuer=issuer),
+            IssuedCurrencyAmount(**amount_dict),
+        )
+        self.assertEqual(hash(payment("10")), hash(payment("10")))
+        self.assertEqual(len({payment("10"), payment("10"), payment("20")}), 2)
+
+    def test_hash_is_cached_but_not_pickled(self):
+        amount = IssuedCurrencyAmount(**amount_dict)
+        self.assertEqual(hash(amount), amount._hash)
+        self.assertFalse(hasattr(pickle.loads(pickle.dumps(amount)), "_hash"))
+
     def test_repr(self):
         amount = IssuedCurrencyAmount(**amount_dict)
         expected_repr = (
@@ -931,3 +966,71 @@ class TestFromDict(TestCase):
             "Flags": 0,
         }
         self.assertEqual(tx.to_xrpl(), expected)
+
+    def test_from_dict_plan_is_built_once(self):
+        Payment.from_dict(
+            {"account": account, "destination": _OTHER_ACCOUNT, "amount": "10"}
+        )
+        with patch("xrpl.models.base_model.get_type_hints") as get_type_hints:
+            payment = Payment.from_dict(
+                {"account": account, "destination": _OTHER_ACCOUNT, "amount": "10"}
+            )
+            self.assertTrue(Payment.is_dict_of_model({"amount": "10"}))
+        get_type_hints.assert_not_called()
+        self.assertEqual(payment.amount, "10")
+
+    def test_from_dict_union_and_optional_errors(self):
+        with self.assertRaises(XRPLModelException):
+            CheckCreate.from_dict({**check_create_dict, "send_max": 10})
+        with self.assertRaises(XRPLModelException):
+            Payment.from_dict(
+                {
+                    "account": account,
+                    "destination": _OTHER_ACCOUNT,
+                    "amount": "10",
+                    "memos": "memo",
+                }
+            )
+        check_create = CheckCreate.from_dict({**check_create_dict, "expiration": None})
+        self.assertIsNone(check_create.expiration)
+
+    def test_key_translation_tables(self):
+        # fields of the definitions, from the tables
+        self.assertEqual(_key_to_json("TransactionType"), "transaction_type")
+        self.assertEqual(_key_to_json("NFTokenID"), "nftoken_id")
+        self.assertEqual(_key_to_tx_json("nftoken_id"), "NFTokenID")
+        # other keys, from the cache
+        self.assertEqual(_key_to_json("ledgerIndexMin"), "ledger_index_min")
+        self.assertEqual(_key_to_tx_json("auth_account"), "AuthAccount")
+
+    def test_from_dict_without_validation(self):
+        invalid_payment = {
+            "account": account,
+            "destination": account,
+            "amount": "10",
+        }
+        with self.assertRaises(XRPLModelException):
+            Payment.from_dict(invalid_payment)
+        payment = Payment.from_dict(invalid_payment, validate=False)
+        self.assertEqual(payment.destination, account)
+        # an explicit check still validates the model
+        with self.assertRaises(XRPLModelException):
+            payment.validate()
+        # validation is only skipped for that call
+        with self.assertRaises(XRPLModelException):
+            Payment.from_dict(invalid_payment)
+
+    def test_trusted_construction(self):
+        with trusted_construction():
+            payment = Payment(account=account, destination=account, amount="10")
+        self.assertFalse(payment.is_valid())
+        with self.assertRaises(XRPLModelException):
+            Payment(account=account, destination=account, amount="10")
+
+        set_trusted_construction(True)
+        try:
+            Payment(account=account, destination=account, amount="10")
+        finally:
+            set_trusted_construction(False)
+        with self.assertRaises(XRPLModelException):
+            Payment(account=account, destination=account, amount="10")
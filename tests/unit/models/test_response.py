@@ -1,7 +1,9 @@
 import warnings
 from unittest import TestCase
 
-from xrpl.models.response import Response, ResponseStatus
+from xrpl.asyncio.clients.utils import json_to_response, websocket_to_response
+from xrpl.models import trusted_construction
+from xrpl.models.response import Response, ResponseStatus, ResponseType
 
 
 class TestResponse(TestCase):
@@ -174,3 +176,42 @@ class TestResponse(TestCase):
                     "validated": True,
                 },
             )
+
+    def test_trusted_construction_scans_for_partial_payments_lazily(self):
+        result = {"TransactionType": "Payment", "Flags": 131072}
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            with trusted_construction():
+                response = Response(status=ResponseStatus.SUCCESS, result=result)
+            self.assertEqual(len(w), 0)
+        self.assertFalse(hasattr(response, "_contains_partial_payment"))
+        self.assertTrue(response.contains_partial_payment())
+        self.assertTrue(response._contains_partial_payment)
+
+    def test_client_responses_skip_validation(self):
+        response = json_to_response(
+            {"result": {"status": "success", "state": [{"Flags": 131072}]}}
+        )
+        self.assertEqual(
+            response,
+            Response(
+                status=ResponseStatus.SUCCESS,
+                result={"state": [{"Flags": 131072}]},
+                type=ResponseType.RESPONSE,
+            ),
+        )
+        # the result is not a payment, so it is only scanned when asked
+        self.assertFalse(hasattr(response, "_contains_partial_payment"))
+        self.assertFalse(response.contains_partial_payment())
+
+    def test_client_responses_warn_about_partial_payments(self):
+        with self.assertWarns(Warning):
+            response = websocket_to_response(
+                {
+                    "id": 1,
+                    "status": "success",
+                    "result": {"TransactionType": "Payment", "Flags": 131072},
+                }
+            )
+        self.assertEqual(response.id, 1)
+        self.assertTrue(response._contains_partial_payment)
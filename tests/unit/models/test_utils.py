@@ -1,13 +1,121 @@
-from unittest import TestCase
+import copy
+import os
+import pickle
+import sys
+import tracemalloc
+from dataclasses import dataclass, replace
+from unittest import TestCase, skipUnless
 
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.base_model import BaseModel
 from xrpl.models.currencies import IssuedCurrency
 from xrpl.models.exceptions import XRPLModelException
+from xrpl.models.requests import GenericRequest
+from xrpl.models.transactions import OfferCreate, Payment
+from xrpl.models.transactions.pseudo_transactions import UNLModify
+from xrpl.models.utils import require_kwargs_on_init
 
 currency = "BTC"
 issuer = "r9LqNeG6qHxjeUocjvVki2XR35weJ9mZgQ"
+destination = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
 
 
 class TestUtils(TestCase):
     def test_kwargs_req(self):
         with self.assertRaises(XRPLModelException):
             IssuedCurrency(currency, issuer)
+
+    def test_kwargs_req_on_plain_dataclass(self):
+        @require_kwargs_on_init
+        @dataclass
+        class Plain:
+            value: int = 0
+
+        self.assertEqual(Plain(value=1).value, 1)
+        self.assertTrue(hasattr(Plain(), "__dict__"))
+        with self.assertRaises(XRPLModelException):
+            Plain(1)
+
+    def test_models_are_slotted(self):
+        payment = Payment(account=issuer, destination=destination, amount="10")
+        self.assertFalse(hasattr(payment, "__dict__"))
+        with self.assertRaises(AttributeError):
+            object.__setattr__(payment, "not_a_field", 1)
+        # a default redeclared by a subclass still reads and initializes
+        self.assertEqual(payment.flags, 0)
+        self.assertEqual(
+            UNLModify(
+                ledger_sequence=1,
+                unl_modify_disabling=1,
+                unl_modify_validator="EDB6FC8E803EE8EDC2793F1EC917B2EE41D35255618DEB91"
+                "D3F9B1FC89B75D4539",
+                flags=5,
+            ).flags,
+            5,
+        )
+
+    def test_slotted_models_copy_and_pickle(self):
+        payment = Payment(account=issuer, destination=destination, amount="10")
+        self.assertEqual(pickle.loads(pickle.dumps(payment)), payment)
+        self.assertEqual(copy.copy(payment), payment)
+        self.assertEqual(copy.deepcopy(payment), payment)
+        self.assertEqual(replace(payment, amount="20").amount, "20")
+
+        request = GenericRequest(method="custom", id=1, param="value")
+        self.assertEqual(
+            pickle.loads(pickle.dumps(request)).to_dict(), request.to_dict()
+        )
+
+    def test_methods_defined_from_source_strings_are_kept(self):
+        namespace = {}
+        exec("def __eq__(self, other):\n    return True\n", namespace)
+
+        @require_kwargs_on_init
+        @dataclass(frozen=True)
+        class Custom(BaseModel):
+            value: int = 0
+            __eq__ = namespace["__eq__"]
+
+        self.assertEqual(Custom(value=1), Custom(value=2))
+        with self.assertRaises(XRPLModelException):
+            Custom(1)
+
+    @skipUnless(os.environ.get("XRPL_BENCHMARKS"), "set XRPL_BENCHMARKS=1 to run")
+    def test_memory_per_model(self):
+        # measured with instance dictionaries, before the fields were slotted
+        sizes_with_dict = {Payment: 308, OfferCreate: 284}
+        amount = IssuedCurrencyAmount(currency="USD", issuer=issuer, value="10")
+        makers = {
+            Payment: lambda i: Payment(
+                account=issuer,
+                destination=destination,
+                amount=str(i),
+                sequence=i,
+                fee="10",
+            ),
+            OfferCreate: lambda i: OfferCreate(
+                account=issuer,
+                taker_gets=str(i),
+                taker_pays=amount,
+                sequence=i,
+                fee="10",
+            ),
+        }
+        count = 20_000
+        for model, make in makers.items():
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            models = [make(i) for i in range(count)]
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            allocated = sum(
+                stat.size_diff for stat in after.compare_to(before, "filename")
+            )
+            # without the list, and the strings and integers of the fields
+            values = sum(sys.getsizeof(str(i)) + sys.getsizeof(i) for i in range(count))
+            size = (allocated - sys.getsizeof(models) - values) / count
+            print(
+                f"{model.__name__}: {size:.0f} bytes per instance, "
+                f"{sizes_with_dict[model]} with an instance dictionary"
+            )
+            self.assertLess(size, sizes_with_dict[model])
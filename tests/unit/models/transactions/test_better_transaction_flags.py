@@ -1,7 +1,17 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
 from xrpl import models
 from xrpl.models.exceptions import XRPLModelException
+from xrpl.models.flags import (
+    TX_FLAGS,
+    _has_interface_flag,
+    _load_numpy,
+    decode_flag_columns,
+    decode_flags,
+    interface_to_flag_int,
+    interface_to_flag_list,
+)
+from xrpl.models.transactions.types import TransactionType
 from xrpl.transaction.main import safe_sign_transaction
 from xrpl.wallet.main import Wallet
 
@@ -415,3 +425,62 @@ class TestBetterTransactionFlags(TestCase):
             first=signed_actual,
             second=signed_expected,
         )
+
+    def test_interface_to_flag_int(self):
+        for tx_type, flags in TX_FLAGS.items():
+            interface = {flag: index % 2 == 0 for index, flag in enumerate(flags)}
+            expected = 0
+            for flag in interface_to_flag_list(tx_type, interface):
+                expected |= flag
+            self.assertEqual(interface_to_flag_int(tx_type, interface), expected)
+        self.assertEqual(
+            interface_to_flag_int(TransactionType.OFFER_CANCEL, {"tf_x": True}),
+            0,
+        )
+
+    def test_has_flag_matches_flag_list(self):
+        for tx_type in [*TX_FLAGS, "OfferCancel"]:
+            flags = TX_FLAGS.get(tx_type, {})
+            for interface in ({}, {flag: True for flag in flags}, {"tf_x": True}):
+                flag_list = interface_to_flag_list(tx_type, interface)
+                for flag in [0, *flags.values(), 0x80000000]:
+                    self.assertEqual(
+                        _has_interface_flag(tx_type, interface, flag),
+                        flag in flag_list,
+                    )
+
+    def test_decode_flags(self):
+        self.assertEqual(
+            decode_flags(
+                TransactionType.PAYMENT,
+                models.PaymentFlag.TF_PARTIAL_PAYMENT
+                | models.PaymentFlag.TF_LIMIT_QUALITY,
+            ),
+            {"tf_partial_payment", "tf_limit_quality"},
+        )
+        self.assertEqual(decode_flags("OfferCreate", 0), set())
+        self.assertEqual(decode_flags("OfferCancel", 0x00010000), set())
+        for tx_type, flags in TX_FLAGS.items():
+            interface = {flag: True for flag in flags}
+            self.assertEqual(
+                decode_flags(tx_type, interface_to_flag_int(tx_type, interface)),
+                set(flags),
+            )
+
+    def test_decode_flag_columns(self):
+        columns = decode_flag_columns(
+            "OfferCreate",
+            [0, models.OfferCreateFlag.TF_SELL, 0x000A0000],
+        )
+        self.assertEqual(set(columns), set(TX_FLAGS["OfferCreate"]))
+        self.assertEqual(list(columns["tf_sell"]), [False, True, True])
+        self.assertEqual(list(columns["tf_immediate_or_cancel"]), [False, False, True])
+        self.assertEqual(list(columns["tf_passive"]), [False, False, False])
+        self.assertEqual(decode_flag_columns("OfferCancel", [1, 2]), {})
+
+    @skipIf(_load_numpy() is None, "NumPy is not installed")
+    def test_decode_flag_columns_with_numpy(self):
+        numpy = _load_numpy()
+        columns = decode_flag_columns("OfferCreate", numpy.array([0, 0x000A0000]))
+        self.assertIsInstance(columns["tf_sell"], numpy.ndarray)
+        self.assertEqual(columns["tf_sell"].tolist(), [False, True])
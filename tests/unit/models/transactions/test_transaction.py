@@ -1,8 +1,24 @@
 from unittest import TestCase
 
+from xrpl.core.addresscodec import classic_address_to_xaddress
+from xrpl.core.binarycodec import decode, encode
+from xrpl.core.binarycodec.definitions import get_transaction_type_code
+from xrpl.models.amounts import IssuedCurrencyAmount
 from xrpl.models.exceptions import XRPLModelException
-from xrpl.models.transactions import OfferCreate
+from xrpl.models.requests import PathStep
+from xrpl.models.transactions import (
+    AMMBid,
+    AuthAccount,
+    Memo,
+    OfferCreate,
+    Payment,
+    Signer,
+    SignerEntry,
+    SignerListSet,
+)
+from xrpl.models.transactions.pseudo_transactions import UNLModify
 from xrpl.models.transactions.transaction import Transaction
+from xrpl.models.transactions.types import PseudoTransactionType
 from xrpl.models.transactions.types.transaction_type import TransactionType
 
 _ACCOUNT = "r9LqNeG6qHxjeUocjvVki2XR35weJ9mZgQ"
@@ -10,6 +26,52 @@ _FEE = "0.00001"
 _SEQUENCE = 19048
 _TICKET_SEQUENCE = 20510
 _ACCOUNT_TXN_ID = "66F3D6158CAB6E53405F8C264DB39F07D8D0454433A63DDFB98218ED1BC99B60"
+_DESTINATION = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+_USD = IssuedCurrencyAmount(currency="USD", issuer=_DESTINATION, value="10")
+
+_ENCODABLE_TRANSACTIONS = [
+    Payment(
+        account=_ACCOUNT,
+        destination=_DESTINATION,
+        amount=_USD,
+        send_max="100",
+        paths=[[PathStep(account=_DESTINATION)], [PathStep(currency="XRP")]],
+        memos=[Memo(memo_data="AB")],
+        signers=[
+            Signer(account=_DESTINATION, txn_signature="AB", signing_pub_key="CD")
+        ],
+        fee="12",
+        sequence=_SEQUENCE,
+    ),
+    OfferCreate(
+        account=_ACCOUNT,
+        taker_gets="10",
+        taker_pays=_USD,
+        flags={"TF_SELL": True},
+    ),
+    AMMBid(
+        account=_ACCOUNT,
+        amm_id=_ACCOUNT_TXN_ID,
+        auth_accounts=[AuthAccount(account=_DESTINATION)],
+    ),
+    SignerListSet(
+        account=_ACCOUNT,
+        signer_quorum=1,
+        signer_entries=[SignerEntry(account=_DESTINATION, signer_weight=1)],
+    ),
+    Payment(
+        account=classic_address_to_xaddress(_ACCOUNT, 5, False),
+        destination=_DESTINATION,
+        amount="10",
+    ),
+    UNLModify(
+        ledger_sequence=1600000,
+        unl_modify_disabling=1,
+        unl_modify_validator=(
+            "ED6629D456285AE3613B285F65BBFF168D695BA3921F309949AFCD2CA7AFEC16FE"
+        ),
+    ),
+]
 
 
 class TestTransaction(TestCase):
@@ -122,3 +184,62 @@ class TestTransaction(TestCase):
                 ticket_sequence=_TICKET_SEQUENCE,
                 transaction_type=TransactionType.ACCOUNT_DELETE,
             )
+
+    def test_to_bytes_matches_encode(self):
+        for transaction in _ENCODABLE_TRANSACTIONS:
+            with self.subTest(transaction=transaction.transaction_type):
+                self.assertEqual(transaction.to_binary(), encode(transaction.to_xrpl()))
+                self.assertEqual(
+                    transaction.to_bytes(), bytes.fromhex(transaction.to_binary())
+                )
+
+    def test_from_blob_matches_from_xrpl(self):
+        for transaction in _ENCODABLE_TRANSACTIONS:
+            blob = transaction.to_binary()
+            with self.subTest(transaction=transaction.transaction_type):
+                self.assertEqual(Transaction.from_blob(blob).to_binary(), blob)
+                self.assertEqual(
+                    Transaction.from_blob(bytes.fromhex(blob), validate=False),
+                    Transaction.from_xrpl(decode(blob)),
+                )
+
+    def test_from_blob_validates_by_default(self):
+        # an XRP payment to the sender itself is invalid
+        blob = encode(
+            {
+                "TransactionType": "Payment",
+                "Account": _ACCOUNT,
+                "Destination": _ACCOUNT,
+                "Amount": "10",
+            }
+        )
+        with self.assertRaises(XRPLModelException):
+            Transaction.from_blob(blob)
+        payment = Payment.from_blob(blob, validate=False)
+        self.assertEqual(payment.destination, _ACCOUNT)
+        with self.assertRaises(XRPLModelException):
+            OfferCreate.from_blob(blob, validate=False)
+
+    def test_transaction_type_registry(self):
+        for transaction_type in [*TransactionType, *PseudoTransactionType]:
+            with self.subTest(transaction_type=transaction_type):
+                transaction_class = Transaction.get_transaction_type(
+                    transaction_type.value
+                )
+                self.assertEqual(transaction_class.__name__, transaction_type.value)
+                self.assertIs(
+                    Transaction.get_transaction_type_by_code(
+                        get_transaction_type_code(transaction_type.value)
+                    ),
+                    transaction_class,
+                )
+        with self.assertRaises(XRPLModelException):
+            Transaction.get_transaction_type("NotATransaction")
+        with self.assertRaises(XRPLModelException):
+            Transaction.get_transaction_type_by_code(-2)
+
+    def test_subclasses_do_not_replace_registered_types(self):
+        class _CustomPayment(Payment):
+            pass
+
+        self.assertIs(Transaction.get_transaction_type("Payment"), Payment)
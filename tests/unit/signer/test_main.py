@@ -0,0 +1,86 @@
+import asyncio
+import json
+import os
+import tempfile
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+except ImportError:
+    from aiounittest import AsyncTestCase as IsolatedAsyncioTestCase
+
+from xrpl.asyncio.transaction import safe_sign_transaction
+from xrpl.core.binarycodec import encode
+from xrpl.models.transactions import AccountSet
+from xrpl.signer import SigningWorker
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.create()
+
+_TRANSACTIONS = [
+    AccountSet(account=_WALLET.classic_address, sequence=sequence, fee="10")
+    for sequence in range(1, 4)
+]
+
+
+class TestSigningWorker(IsolatedAsyncioTestCase):
+    async def test_signs_batch_like_safe_sign_transaction(self):
+        worker = SigningWorker([_WALLET])
+
+        response = await worker.handle(
+            {
+                "id": 7,
+                "transactions": [
+                    transaction.to_xrpl() for transaction in _TRANSACTIONS
+                ],
+            }
+        )
+
+        self.assertEqual(response["id"], 7)
+        for transaction, result in zip(_TRANSACTIONS, response["results"]):
+            expected = await safe_sign_transaction(transaction, _WALLET)
+            self.assertEqual(result["tx_blob"], encode(expected.to_xrpl()))
+            self.assertEqual(result["hash"], expected.get_hash())
+
+    async def test_errors_fail_only_their_transaction(self):
+        worker = SigningWorker([_WALLET])
+        unknown = AccountSet(account=Wallet.create().classic_address, fee="10")
+        expensive = AccountSet(account=_WALLET.classic_address, fee="3000000")
+
+        response = await worker.sign_batch(
+            [
+                unknown.to_xrpl(),
+                _TRANSACTIONS[0].to_xrpl(),
+                expensive.to_xrpl(),
+                {"TransactionType": "AccountSet"},
+            ]
+        )
+
+        results = response["results"]
+        self.assertIn("error", results[0])
+        self.assertIn("tx_blob", results[1])
+        self.assertIn("error", results[2])
+        self.assertIn("error", results[3])
+        metrics = await worker.handle({"command": "metrics"})
+        self.assertEqual(metrics["batches"], 1)
+        self.assertEqual(metrics["signed"], 1)
+        self.assertEqual(metrics["failed"], 3)
+
+    async def test_serves_a_unix_socket(self):
+        worker = SigningWorker([_WALLET])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "signer.sock")
+            server = asyncio.ensure_future(worker.serve(path=path))
+            while not os.path.exists(path):
+                await asyncio.sleep(0.01)
+            reader, writer = await asyncio.open_unix_connection(path)
+
+            request = {"transactions": [_TRANSACTIONS[0].to_xrpl()]}
+            writer.write(b"not json\n" + json.dumps(request).encode() + b"\n")
+            invalid = json.loads(await reader.readline())
+            signed = json.loads(await reader.readline())
+
+            writer.close()
+            server.cancel()
+            self.assertIn("error", invalid)
+            self.assertEqual(len(signed["results"]), 1)
+            self.assertIn("hash", signed["results"][0])
@@ -0,0 +1,66 @@
+from json import JSONDecodeError
+from unittest import TestCase
+
+from xrpl import XRPLException, json_backend
+from xrpl.models.requests import Fee
+
+
+class TestJsonBackend(TestCase):
+    def setUp(self):
+        self.original_backend = json_backend.get_json_backend()
+
+    def tearDown(self):
+        json_backend.set_json_backend(self.original_backend)
+
+    def test_defaults_to_fastest_installed(self):
+        json_backend.set_json_backend()
+        try:
+            import orjson  # noqa: F401
+
+            self.assertEqual(json_backend.get_json_backend(), "orjson")
+        except ImportError:
+            self.assertNotEqual(json_backend.get_json_backend(), "")
+
+    def test_round_trip_every_installed_backend(self):
+        document = {"result": {"drops": {"base_fee": "10"}, "ledger_index": 5}}
+        for name in ["json", "orjson", "msgspec", "ujson"]:
+            try:
+                json_backend.set_json_backend(name)
+            except XRPLException:
+                continue
+            with self.subTest(backend=name):
+                encoded = json_backend.dumps(document)
+                self.assertIsInstance(encoded, str)
+                self.assertEqual(json_backend.loads(encoded), document)
+                self.assertEqual(json_backend.loads(encoded.encode()), document)
+
+    def test_falls_back_to_stdlib_for_wide_integers(self):
+        json_backend.set_json_backend()
+        wide = 2**70 + 1
+        self.assertEqual(json_backend.dumps({"a": wide}), f'{{"a": {wide}}}')
+
+    def test_wide_integers_decode_exactly(self):
+        for name in ["json", "orjson", "msgspec", "ujson"]:
+            try:
+                json_backend.set_json_backend(name)
+            except XRPLException:
+                continue
+            with self.subTest(backend=name):
+                wide = 123456789012345678901234567890
+                self.assertEqual(json_backend.loads(f'{{"a": {wide}}}'), {"a": wide})
+                self.assertEqual(
+                    json_backend.loads(f'{{"a": [-{wide}]}}'.encode()), {"a": [-wide]}
+                )
+
+    def test_invalid_document_raises_json_decode_error(self):
+        json_backend.set_json_backend()
+        with self.assertRaises(JSONDecodeError):
+            json_backend.loads(b"<html>")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(XRPLException):
+            json_backend.set_json_backend("simplejson5")
+        self.assertEqual(json_backend.get_json_backend(), self.original_backend)
+
+    def test_from_xrpl_accepts_bytes(self):
+        self.assertEqual(Fee.from_xrpl(b'{"method": "fee"}'), Fee())
@@ -11,6 +11,7 @@ from xrpl.account.transaction_history import (
     get_account_transactions,
     get_latest_transaction,
 )
+from xrpl.asyncio.account.sequence_manager import SequenceManager
 
 __all__ = [
     "get_next_valid_seq_number",
@@ -21,4 +22,5 @@ __all__ = [
     "get_account_transactions",
     "does_account_exist",
     "get_latest_transaction",
+    "SequenceManager",
 ]
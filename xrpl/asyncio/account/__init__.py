@@ -6,6 +6,7 @@ from xrpl.asyncio.account.main import (
     get_balance,
     get_next_valid_seq_number,
 )
+from xrpl.asyncio.account.sequence_manager import SequenceManager
 from xrpl.asyncio.account.transaction_history import (
     get_account_payment_transactions,
     get_account_transactions,
@@ -21,4 +22,5 @@ __all__ = [
     "get_account_transactions",
     "does_account_exist",
     "get_latest_transaction",
+    "SequenceManager",
 ]
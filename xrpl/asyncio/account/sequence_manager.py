@@ -0,0 +1,174 @@
+"""Hands out sequence numbers for one account without asking the ledger every time."""
+from __future__ import annotations
+
+from asyncio import wrap_future
+from concurrent.futures import Future
+from threading import Lock
+from time import monotonic
+from typing import Optional, Set
+
+from typing_extensions import Final
+
+from xrpl.asyncio.account.main import get_next_valid_seq_number
+from xrpl.asyncio.clients import Client
+from xrpl.constants import XRPLException
+
+# the engine results with which a transaction is rejected for its sequence number
+_SEQUENCE_RESULTS: Final[Set[str]] = {"tefPAST_SEQ", "terPRE_SEQ"}
+
+# the classes of engine results with which a transaction is rejected without
+# using up its sequence number
+_UNUSED_SEQUENCE_PREFIXES: Final = ("tef", "tel", "tem")
+
+
+class SequenceManager:
+    """
+    Hands out sequence numbers for one account. The next sequence number is fetched
+    from the ledger once, then incremented locally for every transaction, so that
+    many transactions from the account can be prepared and submitted concurrently
+    without waiting for each other to be validated::
+
+        manager = SequenceManager(wallet.classic_address)
+        await asyncio.gather(
+            *(
+                safe_sign_and_submit_transaction(
+                    payment, wallet, client, sequence_manager=manager
+                )
+                for payment in payments
+            )
+        )
+
+    The sequence number is fetched again after ``resync``, which
+    ``safe_sign_and_submit_transaction`` calls when a submission is rejected with
+    ``tefPAST_SEQ`` or ``terPRE_SEQ``, and after ``max_age`` seconds if set. A number
+    whose transaction is never submitted, or is rejected without using it, is given
+    back with ``release``.
+    """
+
+    def __init__(
+        self: SequenceManager, account: str, *, max_age: Optional[float] = None
+    ) -> None:
+        """
+        Initializes a sequence manager.
+
+        Args:
+            account: The classic address of the account.
+            max_age: How long, in seconds, a fetched sequence number is used before
+                it is fetched again. None (the default) means until ``resync``.
+        """
+        self.account = account
+        self.max_age = max_age
+        self._next_sequence: Optional[int] = None
+        self._fetched_at = 0.0
+        # bumped by every resync, so that a fetch that started before it is ignored
+        self._generation = 0
+        # the account_info lookup that concurrent callers wait on. It is a
+        # concurrent Future, as the sync helpers each run their own event loop.
+        self._fetch: Optional[Future[int]] = None
+        # the sync helpers may share a manager between threads
+        self._lock = Lock()
+
+    async def next_sequence(self: SequenceManager, client: Client) -> int:
+        """
+        Returns the next sequence number to use for a transaction from the account,
+        fetching it from the ledger if needed. Concurrent callers get consecutive
+        numbers.
+
+        Args:
+            client: The network client used to fetch the sequence number.
+
+        Returns:
+            The sequence number.
+
+        Raises:
+            XRPLException: if another caller's lookup of the sequence number, which
+                this caller waited for, failed.
+        """
+        while True:
+            with self._lock:
+                sequence = self._get_fresh_sequence()
+                if sequence is not None:
+                    self._next_sequence = sequence + 1
+                    return sequence
+                fetch = self._fetch
+                if fetch is None:
+                    # this caller fetches, and the others wait for its result
+                    fetch = self._fetch = Future()
+                    generation = self._generation
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                await wrap_future(fetch)
+                continue
+
+            fetched: Optional[int] = None
+            try:
+                fetched = await get_next_valid_seq_number(self.account, client)
+            finally:
+                with self._lock:
+                    self._fetch = None
+                    if fetched is not None and generation == self._generation:
+                        self._next_sequence = fetched + 1
+                        self._fetched_at = monotonic()
+                if fetched is None:
+                    fetch.set_exception(
+                        XRPLException("Could not fetch the sequence number.")
+                    )
+                else:
+                    fetch.set_result(fetched)
+            if generation == self._generation:
+                return fetched
+
+    def resync(self: SequenceManager) -> None:
+        """Makes the next caller fetch the sequence number from the ledger again."""
+        with self._lock:
+            self._next_sequence = None
+            self._generation += 1
+
+    def release(self: SequenceManager, sequence: int) -> None:
+        """
+        Gives back a sequence number whose transaction was not submitted, or was
+        rejected without using it. If it was the last number handed out, the next
+        caller gets it again. Otherwise later numbers are already in use and the
+        manager resyncs.
+
+        Args:
+            sequence: The sequence number to give back.
+        """
+        with self._lock:
+            if self._next_sequence is None:
+                return
+            if self._next_sequence == sequence + 1:
+                self._next_sequence = sequence
+                return
+            self._next_sequence = None
+            self._generation += 1
+
+    def check_result(
+        self: SequenceManager, engine_result: str, sequence: Optional[int] = None
+    ) -> bool:
+        """
+        Resyncs if a submission was rejected because of its sequence number, and
+        gives the sequence number back if the submission was rejected without
+        using it.
+
+        Args:
+            engine_result: The ``engine_result`` of the submission.
+            sequence: The sequence number of the submitted transaction.
+
+        Returns:
+            Whether the manager resynced.
+        """
+        if engine_result in _SEQUENCE_RESULTS:
+            self.resync()
+            return True
+        if sequence is not None and engine_result.startswith(_UNUSED_SEQUENCE_PREFIXES):
+            self.release(sequence)
+        return False
+
+    def _get_fresh_sequence(self: SequenceManager) -> Optional[int]:
+        if self.max_age is not None and monotonic() - self._fetched_at > self.max_age:
+            return None
+        return self._next_sequence
@@ -1,20 +1,27 @@
 """Asynchronous network clients for interacting with the XRPL."""
+from xrpl.asyncio.clients.async_client_pool import AsyncClientPool
 from xrpl.asyncio.clients.async_json_rpc_client import AsyncJsonRpcClient
 from xrpl.asyncio.clients.async_websocket_client import AsyncWebsocketClient
 from xrpl.asyncio.clients.client import Client
 from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.asyncio.clients.reconnect import ConnectionState, ReconnectPolicy
 from xrpl.asyncio.clients.utils import (
     json_to_response,
     request_to_json_rpc,
     request_to_websocket,
     websocket_to_response,
 )
+from xrpl.asyncio.clients.websocket_base import QueueOverflowPolicy
 
 __all__ = [
+    "AsyncClientPool",
     "AsyncJsonRpcClient",
     "AsyncWebsocketClient",
     "Client",
+    "ConnectionState",
     "json_to_response",
+    "QueueOverflowPolicy",
+    "ReconnectPolicy",
     "request_to_json_rpc",
     "XRPLRequestFailureException",
     "request_to_websocket",
@@ -0,0 +1,23 @@
+"""An async client that spreads requests over several rippled nodes."""
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.clients.client_pool_base import ClientPoolBase
+
+
+class AsyncClientPool(AsyncClient, ClientPoolBase):
+    """
+    An async client that spreads requests over several rippled nodes. It routes
+    each request to the fastest node that is synced and up to date, and fails over
+    to the next one if that node cannot answer::
+
+        async with AsyncWebsocketClient(url_1) as websocket_client:
+            pool = AsyncClientPool(
+                [websocket_client, AsyncJsonRpcClient(url_2)], submit_fan_out=2
+            )
+            print(await get_fee(pool))
+
+    Use async clients for the nodes. A sync websocket client blocks while it waits
+    for a response, so health check timeouts and submission fan-out cannot work
+    with it.
+    """
+
+    pass
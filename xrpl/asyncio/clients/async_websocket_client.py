@@ -3,12 +3,17 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from types import TracebackType
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type, Union
 
 from xrpl.asyncio.clients.async_client import AsyncClient
 from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
-from xrpl.asyncio.clients.websocket_base import WebsocketBase
+from xrpl.asyncio.clients.websocket_base import (
+    _STREAM_QUEUE_TYPE,
+    StreamBook,
+    WebsocketBase,
+)
 from xrpl.models.requests.request import Request
+from xrpl.models.requests.subscribe import StreamParameter
 from xrpl.models.response import Response
 
 
@@ -112,6 +117,22 @@ class AsyncWebsocketClient(AsyncClient, WebsocketBase):
             # remember to run your entire program within a
             # `asyncio.run` call.
             asyncio.run(main())
+
+    If several parts of your program are interested in different kinds of
+    messages, each can read only the messages it cares about, without scanning
+    everything the socket receives::
+
+        async def on_ledger(client):
+            async for ledger in client.stream(StreamParameter.LEDGER):
+                # only `ledgerClosed` messages arrive here
+
+        async def on_payments_to_me(client):
+            async for tx in client.stream(
+                StreamParameter.TRANSACTIONS, account=MY_ADDRESS
+            ):
+                # only transactions affecting MY_ADDRESS arrive here
+
+    Alternatively, register a callback with ``client.on("transaction", callback)``.
     """
 
     async def open(self: AsyncWebsocketClient) -> None:
@@ -150,6 +171,45 @@ class AsyncWebsocketClient(AsyncClient, WebsocketBase):
         while self.is_open():
             yield await self._do_pop_message()
 
+    def stream(
+        self: AsyncWebsocketClient,
+        stream: Union[StreamParameter, str],
+        *,
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate on received messages of one stream. Each call gets its own queue,
+        registered as soon as ``stream`` is called, so several consumers can read
+        the same stream independently, and no message received after the call is
+        missed. Messages routed to at least one stream iterator or callback are not
+        put on the generic message queue. Iteration stops when the client is
+        closed; call ``aclose`` on the iterator to stop reading earlier.
+
+        Arguments:
+            stream: The stream, or the ``type`` of the messages, to read. Both
+                ``TRANSACTIONS`` and ``TRANSACTIONS_PROPOSED`` deliver messages of
+                type ``transaction``.
+            account: Only yield transaction messages that affect this account, as
+                for an ``accounts`` subscription.
+            book: Only yield transaction messages that affect this order book, as
+                for a ``books`` subscription.
+            max_queue_size: The maximum number of messages buffered for this
+                iterator. Defaults to the client's ``max_queue_size``, which is
+                unbounded unless set. The client's overflow policy applies.
+
+        Returns:
+            An iterator on the received messages of the stream.
+
+        Raises:
+            XRPLWebsocketException: if this client is not open.
+        """
+        if not self.is_open():
+            raise XRPLWebsocketException("Websocket is not open")
+        queue = self._add_stream_queue(stream, account, book, max_queue_size)
+        return _StreamIterator(self, stream, queue, account, book)
+
     async def send(self: AsyncWebsocketClient, request: Request) -> None:
         """
         Submit the request represented by the request to the
@@ -187,3 +247,56 @@ class AsyncWebsocketClient(AsyncClient, WebsocketBase):
         if not self.is_open():
             raise XRPLWebsocketException("Websocket is not open")
         return await self._do_request_impl(request)
+
+
+class _StreamIterator:
+    """
+    Iterates on the queue of a stream, which is unregistered when the iteration
+    ends or the iterator is closed.
+    """
+
+    def __init__(
+        self: _StreamIterator,
+        client: AsyncWebsocketClient,
+        stream: Union[StreamParameter, str],
+        queue: _STREAM_QUEUE_TYPE,
+        account: Optional[str],
+        book: Optional[StreamBook],
+    ) -> None:
+        self._client = client
+        self._stream = stream
+        self._queue = queue
+        self._account = account
+        self._book = book
+        self._closed = False
+
+    def __aiter__(self: _StreamIterator) -> _StreamIterator:
+        return self
+
+    async def __anext__(self: _StreamIterator) -> Dict[str, Any]:
+        message = None
+        if not self._closed and self._client.is_open():
+            try:
+                message = await self._client._do_pop_stream_message(self._queue)
+            except BaseException:
+                self._close()
+                raise
+        if message is None:
+            self._close()
+            raise StopAsyncIteration
+        return message
+
+    async def aclose(self: _StreamIterator) -> None:
+        """Stops reading the stream, and unregisters its queue."""
+        self._close()
+
+    def _close(self: _StreamIterator) -> None:
+        if not self._closed:
+            self._closed = True
+            self._client._close_stream_queue(
+                self._stream, self._queue, self._account, self._book
+            )
+
+    def __del__(self: _StreamIterator) -> None:
+        # like an abandoned async generator, an abandoned iterator stops reading
+        self._close()
@@ -0,0 +1,260 @@
+"""A common interface for clients that spread requests over several nodes."""
+from __future__ import annotations
+
+from asyncio import Task, TimeoutError, create_task, gather, wait_for
+from dataclasses import dataclass
+from time import monotonic
+from typing import List, Optional, Set, Union
+
+from httpx import HTTPError
+from typing_extensions import Final
+
+from xrpl.asyncio.clients.client import Client
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.constants import XRPLException
+from xrpl.models.requests.request import Request
+from xrpl.models.requests.server_info import ServerInfo
+from xrpl.models.requests.submit import Submit
+from xrpl.models.requests.submit_multisigned import SubmitMultisigned
+from xrpl.models.response import Response
+
+# the server states in which a node is in sync with the network
+_SYNCED_STATES: Final[Set[str]] = {"full", "proposing", "validating"}
+
+# errors with which a node says it cannot serve a request right now, so that
+# another node should be tried
+_NODE_ERRORS: Final[Set[str]] = {
+    "amendmentBlocked",
+    "noClosed",
+    "noCurrent",
+    "noNetwork",
+    "tooBusy",
+}
+
+# the failures of a request that mean the node, not the request, is the problem
+_NODE_EXCEPTIONS = (HTTPError, OSError, TimeoutError, XRPLException)
+
+
+@dataclass
+class NodeHealth:
+    """
+    What a client pool knows about one of its nodes.
+
+    :meta private:
+    """
+
+    client: Client
+    """The client connected to the node."""
+
+    healthy: bool = True
+    """Whether the node is synced, up to date and answering requests."""
+
+    latency: Optional[float] = None
+    """The moving average of the node's response time, in seconds."""
+
+    validated_ledger: Optional[int] = None
+    """The index of the latest ledger the node has validated."""
+
+    server_state: Optional[str] = None
+    """The ``server_state`` the node last reported."""
+
+
+class ClientPoolBase(Client):
+    """
+    A common interface for clients that spread requests over several nodes.
+
+    :meta private:
+    """
+
+    def __init__(
+        self: ClientPoolBase,
+        clients: List[Client],
+        *,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        max_ledger_lag: int = 2,
+        latency_smoothing: float = 0.3,
+        submit_fan_out: int = 1,
+    ) -> None:
+        """
+        Initializes a client pool.
+
+        Arguments:
+            clients: The clients connected to the nodes of the pool. Websocket
+                clients must be opened by the caller.
+            health_check_interval: How often, in seconds, the pool checks the
+                ``server_info`` of every node. The first request waits for the first
+                check. Later checks are started by the first request made after the
+                interval has passed and run in the background, while requests are
+                routed on the last known state. The default is 30.
+            health_check_timeout: How long, in seconds, a node has to answer a
+                health check. The default is 5.
+            max_ledger_lag: How many validated ledgers a node may lag behind the
+                most up-to-date node before it is skipped. The default is 2.
+            latency_smoothing: The weight of the newest sample in the moving
+                average of each node's latency, between 0 and 1. The default is 0.3.
+            submit_fan_out: The number of nodes each transaction submission is sent
+                to. The default is 1.
+
+        Raises:
+            XRPLException: If no clients are given.
+        """
+        if not clients:
+            raise XRPLException("A client pool needs at least one client.")
+        super().__init__(clients[0].url)
+        self.nodes = [NodeHealth(client) for client in clients]
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.max_ledger_lag = max_ledger_lag
+        self.latency_smoothing = latency_smoothing
+        self.submit_fan_out = submit_fan_out
+        self._next_health_check = 0.0
+        self._checked = False
+        self._health_check_task: Optional[Task[None]] = None
+
+    async def check_health(self: ClientPoolBase) -> None:
+        """
+        Checks the ``server_info`` of every node and updates which nodes are healthy.
+        Nodes that are not synced, or lag behind the others on the validated ledger,
+        are skipped until a later check finds them healthy again.
+        """
+        self._next_health_check = monotonic() + self.health_check_interval
+        await gather(*(self._check_node(node) for node in self.nodes))
+
+        latest = max(
+            (node.validated_ledger or 0 for node in self.nodes if node.healthy),
+            default=0,
+        )
+        for node in self.nodes:
+            if node.healthy and (node.validated_ledger or 0) < (
+                latest - self.max_ledger_lag
+            ):
+                node.healthy = False
+        self._checked = True
+
+    def _start_health_check(self: ClientPoolBase) -> None:
+        """Checks the health of the nodes in the background."""
+        # keep a reference, so that the task is not garbage collected
+        self._health_check_task = create_task(self.check_health())
+
+    async def _check_node(self: ClientPoolBase, node: NodeHealth) -> None:
+        try:
+            response = await wait_for(
+                self._timed_request(node, ServerInfo()), self.health_check_timeout
+            )
+        except _NODE_EXCEPTIONS:
+            node.healthy = False
+            return
+
+        info = response.result.get("info", {})
+        node.server_state = info.get("server_state")
+        node.validated_ledger = info.get("validated_ledger", {}).get("seq")
+        node.healthy = (
+            response.is_successful()
+            and node.server_state in _SYNCED_STATES
+            and node.validated_ledger is not None
+        )
+
+    async def _timed_request(
+        self: ClientPoolBase, node: NodeHealth, request: Request
+    ) -> Response:
+        start = monotonic()
+        response = await node.client.request_impl(request)
+        elapsed = monotonic() - start
+        if node.latency is None:
+            node.latency = elapsed
+        else:
+            node.latency += self.latency_smoothing * (elapsed - node.latency)
+        return response
+
+    def _get_ranked_nodes(self: ClientPoolBase) -> List[NodeHealth]:
+        """
+        Returns the nodes in the order requests should try them: healthy nodes from
+        the fastest to the slowest, then the others as a last resort.
+        """
+        return sorted(
+            self.nodes,
+            key=lambda node: (
+                not node.healthy,
+                node.latency if node.latency is not None else 0.0,
+            ),
+        )
+
+    async def request_impl(self: ClientPoolBase, request: Request) -> Response:
+        """
+        ``request_impl`` implementation for client pools. Sends the request to the
+        fastest healthy node, failing over to the next one if the node cannot
+        answer. Submissions go to ``submit_fan_out`` nodes at once.
+
+        Arguments:
+            request: An object representing information about a rippled request.
+
+        Returns:
+            The response from the server, as a Response object.
+
+        :meta private:
+        """
+        if not self._checked:
+            await self.check_health()
+        elif monotonic() >= self._next_health_check:
+            self._next_health_check = monotonic() + self.health_check_interval
+            self._start_health_check()
+
+        nodes = self._get_ranked_nodes()
+        if self.submit_fan_out > 1 and isinstance(request, (Submit, SubmitMultisigned)):
+            return await self._fan_out(nodes[: self.submit_fan_out], request)
+
+        last_error: Optional[Union[Exception, Response]] = None
+        for node in nodes:
+            try:
+                response = await self._timed_request(node, request)
+            except _NODE_EXCEPTIONS as error:
+                node.healthy = False
+                last_error = error
+                continue
+            if _is_node_error(response):
+                node.healthy = False
+                last_error = response
+                continue
+            return response
+        return _raise_or_return(last_error)
+
+    async def _fan_out(
+        self: ClientPoolBase, nodes: List[NodeHealth], request: Request
+    ) -> Response:
+        """
+        Sends a request to several nodes at once. Returns the response of the
+        fastest-ranked node that accepted it, or else the first response received.
+        """
+        results = await gather(
+            *(self._timed_request(node, request) for node in nodes),
+            return_exceptions=True,
+        )
+        last_error: Optional[Union[Exception, Response]] = None
+        for node, result in zip(nodes, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, _NODE_EXCEPTIONS):
+                    raise result
+                node.healthy = False
+                last_error = last_error or result
+            elif result.is_successful():
+                return result
+            elif not isinstance(last_error, Response):
+                last_error = result
+        return _raise_or_return(last_error)
+
+
+def _is_node_error(response: Response) -> bool:
+    return not response.is_successful() and response.result.get("error") in (
+        _NODE_ERRORS
+    )
+
+
+def _raise_or_return(last_error: Optional[Union[Exception, Response]]) -> Response:
+    if isinstance(last_error, Response):
+        return last_error
+    if last_error is None:
+        raise XRPLRequestFailureException(
+            {"error": "noNode", "error_message": "No node answered the request."}
+        )
+    raise last_error
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from json import JSONDecodeError
+from typing import Dict
 
 from httpx import AsyncClient
 from typing_extensions import Final
 
+from xrpl import json_backend
 from xrpl.asyncio.clients.client import Client
 from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
 from xrpl.asyncio.clients.utils import json_to_response, request_to_json_rpc
@@ -13,6 +15,7 @@ from xrpl.models.requests.request import Request
 from xrpl.models.response import Response
 
 _TIMEOUT: Final[float] = 10.0
+_HEADERS: Final[Dict[str, str]] = {"Content-Type": "application/json"}
 
 
 class JsonRpcBase(Client):
@@ -40,10 +43,11 @@ class JsonRpcBase(Client):
         async with AsyncClient(timeout=_TIMEOUT) as http_client:
             response = await http_client.post(
                 self.url,
-                json=request_to_json_rpc(request),
+                content=json_backend.dumps(request_to_json_rpc(request)),
+                headers=_HEADERS,
             )
             try:
-                return json_to_response(response.json())
+                return json_to_response(json_backend.loads(response.content))
             except JSONDecodeError:
                 raise XRPLRequestFailureException(
                     {
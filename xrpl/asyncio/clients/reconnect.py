@@ -0,0 +1,123 @@
+"""Options and helpers for reconnecting websocket clients."""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from enum import Enum
+from random import random
+from typing import List, Optional
+
+from typing_extensions import Final
+
+from xrpl.models.requests.subscribe import Subscribe
+from xrpl.models.requests.unsubscribe import Unsubscribe
+
+CONNECTION_STATE_MESSAGE_TYPE: Final[str] = "connectionState"
+"""
+The ``type`` of the messages a reconnecting websocket client emits when its
+connection state changes. Listen to them with ``client.on`` or ``client.stream``.
+A client without a reconnect policy only sends the ``disconnected`` message to
+these listeners, not to its generic message queue.
+"""
+
+
+class ConnectionState(str, Enum):
+    """Represents the connection states of a websocket client."""
+
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+    DISCONNECTED = "disconnected"
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """
+    How a websocket client reconnects after its connection drops.
+
+    After reconnecting, the client replays its active subscriptions and emits a
+    ``connectionState`` message with ``state`` set to ``connected``, the
+    ``last_ledger_index`` seen before the connection dropped and the current
+    ``ledger_index``, so that consumers can backfill the ledgers in between.
+    """
+
+    max_attempts: Optional[int] = None
+    """
+    The number of consecutive failed attempts after which the client gives up.
+    None (the default) means the client never gives up.
+    """
+
+    base_delay: float = 0.5
+    """The delay in seconds before the first attempt. Doubles with every attempt."""
+
+    max_delay: float = 30.0
+    """The maximum delay in seconds between two attempts."""
+
+    retry_requests: bool = False
+    """
+    Whether requests waiting for a response when the connection dropped are sent
+    again after reconnecting. If False (the default), they fail with an
+    ``XRPLWebsocketException``.
+    """
+
+    def get_delay(self: ReconnectPolicy, attempt: int) -> float:
+        """
+        Returns the delay before a reconnection attempt: an exponential backoff
+        with jitter, so that many clients do not reconnect all at once.
+
+        Args:
+            attempt: The number of the attempt, starting at 0.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self.max_delay, self.base_delay * 2.0**attempt)
+        return delay * (0.5 + random() / 2)
+
+
+def remove_unsubscribed(
+    subscriptions: List[Subscribe], unsubscribe: Unsubscribe
+) -> List[Subscribe]:
+    """
+    Returns the given subscriptions without what an Unsubscribe request cancels.
+
+    Args:
+        subscriptions: The active subscriptions.
+        unsubscribe: The Unsubscribe request.
+
+    Returns:
+        The subscriptions that remain active.
+
+    :meta private:
+    """
+    streams = unsubscribe.streams or []
+    accounts = unsubscribe.accounts or []
+    accounts_proposed = unsubscribe.accounts_proposed or []
+    books = [(book.taker_gets, book.taker_pays) for book in unsubscribe.books or []]
+
+    remaining = []
+    for subscription in subscriptions:
+        subscription = replace(
+            subscription,
+            streams=[s for s in subscription.streams or [] if s not in streams] or None,
+            accounts=[a for a in subscription.accounts or [] if a not in accounts]
+            or None,
+            accounts_proposed=[
+                a
+                for a in subscription.accounts_proposed or []
+                if a not in accounts_proposed
+            ]
+            or None,
+            books=[
+                book
+                for book in subscription.books or []
+                if (book.taker_gets, book.taker_pays) not in books
+            ]
+            or None,
+        )
+        if (
+            subscription.streams
+            or subscription.accounts
+            or subscription.accounts_proposed
+            or subscription.books
+        ):
+            remaining.append(subscription)
+    return remaining
@@ -45,7 +45,7 @@ def json_to_response(json: Dict[str, Any]) -> Response:
     #  differentiate based on that?
     # TODO: should we pull fields "status" OUT of result dict?
     response_type = ResponseType.RESPONSE
-    return Response(status=status, result=result, type=response_type)
+    return Response._from_server(status, result, type=response_type)
 
 
 def request_to_websocket(request_object: Request) -> Dict[str, Any]:
@@ -88,4 +88,4 @@ def websocket_to_response(response_dict: Dict[str, Any]) -> Response:
     #  differentiate based on that?
     # TODO: should we pull fields "status" OUT of result dict?
     response_type = ResponseType.RESPONSE
-    return Response(status=status, result=result, id=request_id, type=response_type)
+    return Response._from_server(status, result, request_id, response_type)
@@ -1,18 +1,53 @@
 """A client for interacting with the rippled WebSocket API."""
 from __future__ import annotations
 
-import json
-from asyncio import Future, Queue, Task, create_task, get_running_loop
+from asyncio import (
+    Event,
+    Future,
+    Queue,
+    Task,
+    TimeoutError,
+    create_task,
+    get_running_loop,
+    iscoroutinefunction,
+    sleep,
+)
+from dataclasses import replace
+from enum import Enum
 from random import randrange
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from typing_extensions import Final
+from websockets.exceptions import ConnectionClosed, WebSocketException
 from websockets.legacy.client import WebSocketClientProtocol, connect
 
+from xrpl import json_backend
 from xrpl.asyncio.clients.client import Client
 from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
+from xrpl.asyncio.clients.reconnect import (
+    CONNECTION_STATE_MESSAGE_TYPE,
+    ConnectionState,
+    ReconnectPolicy,
+    remove_unsubscribed,
+)
 from xrpl.asyncio.clients.utils import request_to_websocket, websocket_to_response
+from xrpl.models.currencies import Currency
+from xrpl.models.requests.ledger import Ledger
 from xrpl.models.requests.request import Request
+from xrpl.models.requests.subscribe import StreamParameter, Subscribe, SubscribeBook
+from xrpl.models.requests.unsubscribe import Unsubscribe
 from xrpl.models.response import Response
 
 _REQ_ID_MAX: Final[int] = 1_000_000
@@ -21,12 +56,54 @@ _REQ_ID_MAX: Final[int] = 1_000_000
 if TYPE_CHECKING:
     _REQUESTS_TYPE = Dict[str, Future[Dict[str, Any]]]
     _MESSAGES_TYPE = Queue[Dict[str, Any]]
+    _STREAM_QUEUE_TYPE = Queue[Optional[Dict[str, Any]]]
     _HANDLER_TYPE = Task[None]
 else:
     _REQUESTS_TYPE = Dict[str, Future]
     _MESSAGES_TYPE = Queue
+    _STREAM_QUEUE_TYPE = Queue
     _HANDLER_TYPE = Task
 
+StreamCallback = Callable[[Dict[str, Any]], Any]
+"""
+A function called with every message routed to it. May be a coroutine function.
+
+:meta private:
+"""
+
+StreamBook = Union[SubscribeBook, Tuple[Currency, Currency]]
+"""
+An order book to route messages for, either as a ``SubscribeBook`` or as a
+``(taker_gets, taker_pays)`` pair.
+
+:meta private:
+"""
+
+# the `type` of the messages rippled sends for each subscription stream
+_STREAM_MESSAGE_TYPES: Final[Dict[StreamParameter, str]] = {
+    StreamParameter.CONSENSUS: "consensusPhase",
+    StreamParameter.LEDGER: "ledgerClosed",
+    StreamParameter.MANIFESTS: "manifestReceived",
+    StreamParameter.PEER_STATUS: "peerStatusChange",
+    StreamParameter.TRANSACTIONS: "transaction",
+    StreamParameter.TRANSACTIONS_PROPOSED: "transaction",
+    StreamParameter.SERVER: "serverStatus",
+    StreamParameter.VALIDATIONS: "validationReceived",
+}
+
+# fields of transactions and ledger entries that name an affected account
+_ACCOUNT_FIELDS: Final[Tuple[str, ...]] = ("Account", "Destination", "Owner")
+_LIMIT_FIELDS: Final[Tuple[str, ...]] = ("HighLimit", "LowLimit")
+
+# (kind, value) keys for account- and book-keyed subscribers
+_RouteKey = Tuple[str, str]
+
+# put on the generic message queue to wake up its consumer after the handler stops
+_WAKE_UP_MESSAGE: Final[Dict[str, Any]] = {}
+
+# the message types whose `ledger_index` tells how far a stream consumer has read
+_LEDGER_MESSAGE_TYPES: Final[Set[str]] = {"ledgerClosed", "transaction"}
+
 
 def _inject_request_id(request: Request) -> Request:
     """
@@ -41,6 +118,111 @@ def _inject_request_id(request: Request) -> Request:
     return Request.from_dict(request_dict)
 
 
+def _get_message_type(stream: Union[StreamParameter, str]) -> str:
+    if isinstance(stream, StreamParameter):
+        return _STREAM_MESSAGE_TYPES[stream]
+    return stream
+
+
+def _currency_key(value: Union[str, Dict[str, Any]]) -> str:
+    # amounts and currencies are keyed the same way: XRP, or currency/issuer
+    if isinstance(value, dict) and "issuer" in value:
+        return f"{value['currency']}/{value['issuer']}"
+    return "XRP"
+
+
+def _get_book_keys(book: StreamBook) -> List[str]:
+    if isinstance(book, SubscribeBook):
+        taker_gets = _currency_key(book.taker_gets.to_dict())
+        taker_pays = _currency_key(book.taker_pays.to_dict())
+        if book.both:
+            return [f"{taker_gets}:{taker_pays}", f"{taker_pays}:{taker_gets}"]
+    else:
+        taker_gets = _currency_key(book[0].to_dict())
+        taker_pays = _currency_key(book[1].to_dict())
+    return [f"{taker_gets}:{taker_pays}"]
+
+
+def _get_affected_nodes(message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    fields = [message.get("transaction", {})]
+    for node in message.get("meta", {}).get("AffectedNodes", []):
+        for node_fields in node.values():
+            fields.append(node_fields.get("FinalFields", {}))
+            fields.append(node_fields.get("NewFields", {}))
+    return fields
+
+
+def _get_route_keys(message: Dict[str, Any]) -> Set[_RouteKey]:
+    """Returns the accounts and order books a transaction message affects."""
+    keys: Set[_RouteKey] = set()
+    for fields in _get_affected_nodes(message):
+        for field in _ACCOUNT_FIELDS:
+            if isinstance(fields.get(field), str):
+                keys.add(("account", fields[field]))
+        for field in _LIMIT_FIELDS:
+            if field in fields:
+                keys.add(("account", fields[field]["issuer"]))
+        if "TakerGets" in fields and "TakerPays" in fields:
+            taker_gets = _currency_key(fields["TakerGets"])
+            taker_pays = _currency_key(fields["TakerPays"])
+            keys.add(("book", f"{taker_gets}:{taker_pays}"))
+    return keys
+
+
+class _StreamSubscriber:
+    """A consumer of routed messages: either a queue or a callback."""
+
+    def __init__(
+        self: _StreamSubscriber,
+        queue: Optional[_STREAM_QUEUE_TYPE] = None,
+        callback: Optional[StreamCallback] = None,
+        consume: bool = True,
+    ) -> None:
+        self.queue = queue
+        self.callback = callback
+        # whether the messages it gets are kept off the generic message queue
+        self.consume = consume
+
+
+def _get_subscriber_keys(
+    account: Optional[str], book: Optional[StreamBook]
+) -> List[Optional[_RouteKey]]:
+    keys: List[Optional[_RouteKey]] = []
+    if account is not None:
+        keys.append(("account", account))
+    if book is not None:
+        keys.extend(("book", key) for key in _get_book_keys(book))
+    return keys if keys else [None]
+
+
+def _end_stream_queue(queue: _STREAM_QUEUE_TYPE, keep_messages: bool = False) -> None:
+    # empty the queue, or make room in it, and wake up its consumer with the
+    # end-of-stream marker
+    while not queue.empty() and (not keep_messages or queue.full()):
+        queue.get_nowait()
+        queue.task_done()
+    queue.put_nowait(None)
+
+
+class QueueOverflowPolicy(str, Enum):
+    """
+    Represents what a websocket client does with an incoming message when its
+    message queue is full.
+    """
+
+    BLOCK = "block"
+    """Stop reading from the socket until the consumer frees up space."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued message to make room for the new one."""
+
+    DROP_NEWEST = "drop_newest"
+    """Discard the incoming message."""
+
+    RAISE = "raise"
+    """Stop reading from the socket and raise on the next read from the queue."""
+
+
 class WebsocketBase(Client):
     """
     A client for interacting with the rippled WebSocket API.
@@ -48,13 +230,51 @@ class WebsocketBase(Client):
     :meta private:
     """
 
-    def __init__(self: WebsocketBase, url: str) -> None:
+    def __init__(
+        self: WebsocketBase,
+        url: str,
+        *,
+        max_queue_size: int = 0,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        queue_request_responses: bool = True,
+        reconnect: Optional[ReconnectPolicy] = None,
+    ) -> None:
         """
         Initializes a websocket client.
 
         Arguments:
             url: The URL of the rippled node to submit requests to.
+            max_queue_size: The maximum number of messages held in the message
+                queue. A value of 0 (the default) means the queue is unbounded.
+            overflow_policy: What to do with an incoming message when the message
+                queue is full. The default is to stop reading from the socket until
+                there is room in the queue.
+            queue_request_responses: Whether responses to ``request`` calls are
+                also put on the message queue after being returned to the caller.
+                Responses to ``send`` calls are always queued. The default is True.
+            reconnect: If provided, how to reconnect when the connection drops.
+                By default, the client does not reconnect.
         """
+        self._reconnect_policy = reconnect
+        self._connection_state = ConnectionState.DISCONNECTED
+        # set while the socket is connected, so that sends can wait out a reconnect
+        self._connected: Optional[Event] = None
+        self._subscriptions: List[Subscribe] = []
+        self._in_flight_requests: Dict[str, Request] = {}
+        self._last_ledger_index: Optional[int] = None
+        self._resubscribe_task: Optional[Task[None]] = None
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._queue_request_responses = queue_request_responses
+        self._dropped_messages = 0
+        self._overflow_exception: Optional[XRPLWebsocketException] = None
+        self._awaited_requests: Set[str] = set()
+        # message type -> route key (None for unkeyed) -> subscribers
+        self._stream_subscribers: Dict[
+            str, Dict[Optional[_RouteKey], List[_StreamSubscriber]]
+        ] = {}
+        # the running coroutine callbacks
+        self._callback_tasks: Set[Task[None]] = set()
         self._open_requests: _REQUESTS_TYPE = {}
         self._websocket: Optional[WebSocketClientProtocol] = None
         self._handler_task: Optional[_HANDLER_TYPE] = None
@@ -65,9 +285,44 @@ class WebsocketBase(Client):
         self._messages: Optional[_MESSAGES_TYPE] = None
         super().__init__(url)
 
+    @property
+    def dropped_messages(self: WebsocketBase) -> int:
+        """
+        The number of incoming messages discarded because the message queue was
+        full, since this client was created.
+
+        Returns:
+            The number of dropped messages.
+        """
+        return self._dropped_messages
+
+    @property
+    def subscriptions(self: WebsocketBase) -> List[Subscribe]:
+        """
+        The subscriptions the client has made, less what it has unsubscribed
+        from since. They are replayed when a client with a reconnect policy
+        reconnects.
+
+        Returns:
+            The ``Subscribe`` requests of the active subscriptions.
+        """
+        return list(self._subscriptions)
+
+    @property
+    def connection_state(self: WebsocketBase) -> ConnectionState:
+        """
+        The state of the connection. A client with a reconnect policy is
+        ``RECONNECTING`` while it is trying to restore a dropped connection.
+
+        Returns:
+            The state of the connection.
+        """
+        return self._connection_state
+
     def is_open(self: WebsocketBase) -> bool:
         """
-        Returns whether the client is currently open.
+        Returns whether the client is currently open. A client that is
+        reconnecting is still open.
 
         Returns:
             True if the client is currently open, False otherwise.
@@ -76,16 +331,23 @@ class WebsocketBase(Client):
             self._handler_task is not None
             and self._messages is not None
             and self._websocket is not None
-            and self._websocket.open
+            and (
+                self._websocket.open
+                or self._connection_state == ConnectionState.RECONNECTING
+            )
         )
 
     async def _do_open(self: WebsocketBase) -> None:
         """Connects the client to the Web Socket API at its URL."""
         # open the connection
         self._websocket = await connect(self.url)
+        self._connected = Event()
+        self._connected.set()
+        self._connection_state = ConnectionState.CONNECTED
 
         # make a message queue
-        self._messages = Queue()
+        self._messages = Queue(maxsize=self._max_queue_size)
+        self._overflow_exception = None
 
         # start the handler
         self._handler_task = create_task(self._handler())
@@ -95,11 +357,22 @@ class WebsocketBase(Client):
         # cancel the handler
         cast(_HANDLER_TYPE, self._handler_task).cancel()
         self._handler_task = None
+        if self._resubscribe_task is not None:
+            self._resubscribe_task.cancel()
+            self._resubscribe_task = None
+        for task in self._callback_tasks:
+            task.cancel()
+        self._callback_tasks = set()
+        self._connection_state = ConnectionState.DISCONNECTED
+        self._subscriptions = []
+        self._last_ledger_index = None
 
         # cancel any pending request Futures
         for future in self._open_requests.values():
             future.cancel()
         self._open_requests = {}
+        self._awaited_requests = set()
+        self._in_flight_requests = {}
 
         # clear the message queue
         for _ in range(cast(_MESSAGES_TYPE, self._messages).qsize()):
@@ -107,6 +380,13 @@ class WebsocketBase(Client):
             cast(_MESSAGES_TYPE, self._messages).task_done()
         self._messages = None
 
+        # end any stream iterators, keeping callbacks registered
+        for routes in self._stream_subscribers.values():
+            for subscribers in routes.values():
+                for subscriber in subscribers:
+                    if subscriber.queue is not None:
+                        _end_stream_queue(subscriber.queue)
+
         # close the connection
         await cast(WebSocketClientProtocol, self._websocket).close()
 
@@ -116,26 +396,429 @@ class WebsocketBase(Client):
         messages we check whether there is an outstanding future we need to resolve,
         and if so do so.
 
-        Then we store the already-parsed JSON in our own queue for generic iteration.
+        Then we route the already-parsed JSON to any stream subscribers for its
+        message type, or otherwise store it in our own queue for generic iteration,
+        applying the overflow policy if a queue is full.
+
+        If the connection drops and the client has a reconnect policy, the handler
+        reconnects and keeps going. Otherwise, it fails any pending requests.
 
         As long as a given client remains open, this handler will be running as a Task.
         """
-        async for response in cast(WebSocketClientProtocol, self._websocket):
-            response_dict = json.loads(response)
+        while True:
+            try:
+                async for response in cast(WebSocketClientProtocol, self._websocket):
+                    if not await self._handle_message(json_backend.loads(response)):
+                        return
+            except ConnectionClosed:
+                pass
+
+            if self._reconnect_policy is not None and await self._reconnect(
+                self._reconnect_policy
+            ):
+                continue
+
+            self._connection_state = ConnectionState.DISCONNECTED
+            # wake up the sends waiting for a reconnect, so that they fail
+            cast(Event, self._connected).set()
+            self._fail_open_requests()
+            await self._emit_connection_state({})
+            for routes in self._stream_subscribers.values():
+                for subscribers in routes.values():
+                    for subscriber in subscribers:
+                        if subscriber.queue is not None:
+                            _end_stream_queue(subscriber.queue, keep_messages=True)
+            return
+
+    async def _handle_message(self: WebsocketBase, message: Dict[str, Any]) -> bool:
+        """
+        Resolves, routes or enqueues one message.
+
+        Returns False if the handler should stop reading from the socket.
+        """
+        message_type = message.get("type", "")
+        if message_type in _LEDGER_MESSAGE_TYPES and "ledger_index" in message:
+            self._last_ledger_index = max(
+                message["ledger_index"], self._last_ledger_index or 0
+            )
+
+        # if this response corresponds to request, fulfill the Future
+        if "id" in message and message["id"] in self._open_requests:
+            future = self._open_requests[message["id"]]
+            if not future.done():
+                future.set_result(message)
+            self._in_flight_requests.pop(message["id"], None)
+            if (
+                not self._queue_request_responses
+                and message["id"] in self._awaited_requests
+            ):
+                # the caller of `request` already has this response
+                return True
+
+        routes = self._stream_subscribers.get(message_type)
+        if routes:
+            delivered = await self._route_message(message, routes)
+            if delivered is None:
+                return False
+            if delivered:
+                return True
+
+        # enqueue the response for the message queue
+        return await self._enqueue_message(
+            cast(_MESSAGES_TYPE, self._messages), message
+        )
+
+    def _fail_open_requests(self: WebsocketBase) -> None:
+        """Fails the requests waiting for a response on a dropped connection."""
+        exception = XRPLWebsocketException("Websocket connection closed")
+        for request_id, future in self._open_requests.items():
+            if future.done():
+                continue
+            if request_id in self._awaited_requests:
+                future.set_exception(exception)
+            else:
+                # no one is waiting for the response to a `send`
+                future.cancel()
+        self._in_flight_requests = {}
+
+    async def _reconnect(self: WebsocketBase, policy: ReconnectPolicy) -> bool:
+        """
+        Reconnects with exponential backoff, then replays the subscriptions in the
+        background while the handler resumes reading.
 
-            # if this response corresponds to request, fulfill the Future
-            if "id" in response_dict and response_dict["id"] in self._open_requests:
-                self._open_requests[response_dict["id"]].set_result(response_dict)
+        Returns whether the connection was restored.
+        """
+        cast(Event, self._connected).clear()
+        self._connection_state = ConnectionState.RECONNECTING
+        if not policy.retry_requests:
+            self._fail_open_requests()
+
+        attempt = 0
+        while policy.max_attempts is None or attempt < policy.max_attempts:
+            await self._emit_connection_state({"attempt": attempt + 1})
+            await sleep(policy.get_delay(attempt))
+            try:
+                self._websocket = await connect(self.url)
+            except (OSError, TimeoutError, WebSocketException):
+                attempt += 1
+                continue
+
+            # replay what was active when the connection dropped. Requests made
+            # from now on are sent on the new connection by their callers.
+            replay: List[Request] = [
+                *self._subscriptions,
+                *self._in_flight_requests.values(),
+            ]
+            self._connection_state = ConnectionState.CONNECTED
+            cast(Event, self._connected).set()
+            self._resubscribe_task = create_task(
+                self._resubscribe(self._last_ledger_index, replay)
+            )
+            return True
 
-            # enqueue the response for the message queue
-            cast(_MESSAGES_TYPE, self._messages).put_nowait(response_dict)
+        return False
+
+    async def _resubscribe(
+        self: WebsocketBase,
+        last_ledger_index: Optional[int],
+        replay: Sequence[Request],
+    ) -> None:
+        """
+        Replays the subscriptions and in-flight requests on a new connection, then
+        reports the ledgers that may have been missed.
+        """
+        ledger_index = None
+        try:
+            for request in replay:
+                if isinstance(request, Subscribe):
+                    response = await self._do_request(request)
+                    ledger_index = response.result.get("ledger_index", ledger_index)
+                else:
+                    await self._do_send_no_future(request)
+            if ledger_index is None:
+                response = await self._do_request(Ledger(ledger_index="validated"))
+                ledger_index = response.result.get("ledger_index")
+        except (XRPLWebsocketException, ConnectionClosed):
+            # the connection dropped again, and the handler is handling it
+            return
+
+        await self._emit_connection_state(
+            {"last_ledger_index": last_ledger_index, "ledger_index": ledger_index}
+        )
+
+    async def _emit_connection_state(
+        self: WebsocketBase, details: Dict[str, Any]
+    ) -> None:
+        message = {
+            "type": CONNECTION_STATE_MESSAGE_TYPE,
+            "state": self._connection_state.value,
+            **details,
+        }
+        if self._reconnect_policy is not None:
+            await self._handle_message(message)
+            return
+        # a client that does not reconnect leaves its message queue as it was, and
+        # only tells the listeners of the connection state that it dropped
+        routes = self._stream_subscribers.get(CONNECTION_STATE_MESSAGE_TYPE)
+        if routes:
+            await self._route_message(message, routes)
+
+    def _track_subscriptions(self: WebsocketBase, request: Request) -> None:
+        """
+        Keeps the list of active subscriptions, to replay after reconnecting and to
+        check what the client is subscribed to.
+        """
+        if isinstance(request, Subscribe):
+            self._subscriptions.append(replace(request, id=None))
+        elif isinstance(request, Unsubscribe):
+            self._subscriptions = remove_unsubscribed(self._subscriptions, request)
+
+    async def _route_message(
+        self: WebsocketBase,
+        message: Dict[str, Any],
+        routes: Dict[Optional[_RouteKey], List[_StreamSubscriber]],
+    ) -> Optional[bool]:
+        """
+        Delivers a message to the subscribers of its type whose account or book it
+        matches, and to all unkeyed subscribers.
+
+        Returns whether the message was delivered to a subscriber that consumes it,
+        or None if the handler should stop reading from the socket.
+        """
+        subscribers = list(routes.get(None, []))
+        if len(routes) > 1 or None not in routes:
+            # only inspect the message when someone is filtering on it
+            for key in _get_route_keys(message):
+                subscribers.extend(routes.get(key, []))
+
+        # a subscriber registered under several matching keys gets the message once
+        subscribers = list({id(sub): sub for sub in subscribers}.values())
+        for subscriber in subscribers:
+            if subscriber.queue is not None:
+                if not await self._enqueue_message(subscriber.queue, message):
+                    return None
+            elif iscoroutinefunction(subscriber.callback):
+                task = create_task(cast(StreamCallback, subscriber.callback)(message))
+                # keep a reference, so that the task is not garbage collected
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._on_callback_done)
+            else:
+                get_running_loop().call_soon(
+                    cast(StreamCallback, subscriber.callback), message
+                )
+        return any(subscriber.consume for subscriber in subscribers)
+
+    def _on_callback_done(self: WebsocketBase, task: Task[None]) -> None:
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # report the error like an exception raised by a sync callback
+            get_running_loop().call_exception_handler(
+                {
+                    "message": "Exception in websocket stream callback",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+    def _add_stream_subscriber(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        subscriber: _StreamSubscriber,
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+    ) -> None:
+        routes = self._stream_subscribers.setdefault(_get_message_type(stream), {})
+        for key in _get_subscriber_keys(account, book):
+            routes.setdefault(key, []).append(subscriber)
+
+    def _remove_stream_subscriber(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        matches: Callable[[_StreamSubscriber], bool],
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+    ) -> None:
+        message_type = _get_message_type(stream)
+        routes = self._stream_subscribers.get(message_type, {})
+        for key in _get_subscriber_keys(account, book):
+            remaining = [sub for sub in routes.get(key, []) if not matches(sub)]
+            if remaining:
+                routes[key] = remaining
+            else:
+                routes.pop(key, None)
+        if not routes:
+            self._stream_subscribers.pop(message_type, None)
+
+    async def _open_stream_queue(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> _STREAM_QUEUE_TYPE:
+        """
+        Registers a new stream queue. This is a coroutine so that the sync client
+        creates the queue on the client's event loop.
+        """
+        return self._add_stream_queue(stream, account, book, max_queue_size)
+
+    def _add_stream_queue(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> _STREAM_QUEUE_TYPE:
+        queue: _STREAM_QUEUE_TYPE = Queue(
+            maxsize=self._max_queue_size if max_queue_size is None else max_queue_size
+        )
+        self._add_stream_subscriber(
+            stream, _StreamSubscriber(queue=queue), account, book
+        )
+        return queue
+
+    def _close_stream_queue(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        queue: _STREAM_QUEUE_TYPE,
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+    ) -> None:
+        self._remove_stream_subscriber(
+            stream, lambda sub: sub.queue is queue, account, book
+        )
+
+    async def _do_pop_stream_message(
+        self: WebsocketBase, queue: _STREAM_QUEUE_TYPE
+    ) -> Optional[Dict[str, Any]]:
+        if self._overflow_exception is not None:
+            raise self._overflow_exception
+        msg = await queue.get()
+        queue.task_done()
+        if self._overflow_exception is not None:
+            raise self._overflow_exception
+        return msg
+
+    async def _enqueue_message(
+        self: WebsocketBase, messages: Queue[Any], message: Dict[str, Any]
+    ) -> bool:
+        """
+        Puts a message on a message queue according to the overflow policy.
+
+        Returns False if the handler should stop reading from the socket.
+        """
+        if self._overflow_policy == QueueOverflowPolicy.BLOCK:
+            await messages.put(message)
+            return True
+
+        if not messages.full():
+            messages.put_nowait(message)
+            return True
+
+        if self._overflow_policy == QueueOverflowPolicy.DROP_NEWEST:
+            self._dropped_messages += 1
+            return True
+
+        if self._overflow_policy == QueueOverflowPolicy.DROP_OLDEST:
+            messages.get_nowait()
+            messages.task_done()
+            self._dropped_messages += 1
+            messages.put_nowait(message)
+            return True
+
+        # QueueOverflowPolicy.RAISE
+        self._dropped_messages += 1
+        self._overflow_exception = XRPLWebsocketException(
+            f"Message queue is full ({messages.maxsize} messages)."
+        )
+        for future in self._open_requests.values():
+            if not future.done():
+                future.set_exception(self._overflow_exception)
+        self._wake_up_consumers()
+        return False
+
+    def _wake_up_consumers(self: WebsocketBase) -> None:
+        """
+        Wakes up every consumer waiting on a message queue, so that it sees that the
+        handler has stopped.
+        """
+        for routes in self._stream_subscribers.values():
+            for subscribers in routes.values():
+                for subscriber in subscribers:
+                    if subscriber.queue is not None:
+                        _end_stream_queue(subscriber.queue)
+        messages = cast(_MESSAGES_TYPE, self._messages)
+        if not messages.full():
+            messages.put_nowait(_WAKE_UP_MESSAGE)
+
+    def on(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        callback: StreamCallback,
+        *,
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+        consume: bool = True,
+    ) -> None:
+        """
+        Registers a callback for every incoming message of a stream. Messages
+        routed to at least one stream iterator, or callback registered with
+        ``consume``, are not put on the generic message queue.
+
+        Callbacks are scheduled on the client's event loop, so they must not block.
+        Coroutine functions are run as Tasks. Callbacks stay registered when the
+        client is closed and reopened.
+
+        Arguments:
+            stream: The stream, or the ``type`` of the messages, to listen to. Both
+                ``TRANSACTIONS`` and ``TRANSACTIONS_PROPOSED`` deliver messages of
+                type ``transaction``.
+            callback: The function to call with each message.
+            account: Only deliver transaction messages that affect this account, as
+                for an ``accounts`` subscription.
+            book: Only deliver transaction messages that affect this order book, as
+                for a ``books`` subscription.
+            consume: Whether the messages delivered to the callback are kept off
+                the generic message queue. The default is True. Pass False to
+                watch a stream without taking its messages from the consumers of
+                the generic message queue.
+        """
+        self._add_stream_subscriber(
+            stream, _StreamSubscriber(callback=callback, consume=consume), account, book
+        )
+
+    def off(
+        self: WebsocketBase,
+        stream: Union[StreamParameter, str],
+        callback: StreamCallback,
+        *,
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+    ) -> None:
+        """
+        Removes a callback registered with ``on``.
+
+        Arguments:
+            stream: The stream the callback was registered for.
+            callback: The registered function.
+            account: The account the callback was registered for, if any.
+            book: The order book the callback was registered for, if any.
+        """
+        self._remove_stream_subscriber(
+            stream, lambda sub: sub.callback == callback, account, book
+        )
 
     def _set_up_future(self: WebsocketBase, request: Request) -> None:
         """
         Only to be called from the public send and request_impl functions.
         Given a request with an ID, ensure that that ID is backed by an open
         Future in self._open_requests.
+
+        Raises the overflow exception if the handler has stopped on a full queue,
+        as no response would ever be read.
         """
+        if self._overflow_exception is not None:
+            raise self._overflow_exception
         if request.id is None:
             return
         request_str = str(request.id)
@@ -149,8 +832,14 @@ class WebsocketBase(Client):
         self._open_requests[request_str] = get_running_loop().create_future()
 
     async def _do_send_no_future(self: WebsocketBase, request: Request) -> None:
+        connected = cast(Event, self._connected)
+        if not connected.is_set():
+            # wait for a reconnect to finish
+            await connected.wait()
+        if self._connection_state == ConnectionState.DISCONNECTED:
+            raise XRPLWebsocketException("Websocket connection closed")
         await cast(WebSocketClientProtocol, self._websocket).send(
-            json.dumps(
+            json_backend.dumps(
                 request_to_websocket(request),
             ),
         )
@@ -159,11 +848,16 @@ class WebsocketBase(Client):
         # we need to set up a future here, even if no one cares about it, so
         # that if a user submits a few requests with the same ID they fail.
         self._set_up_future(request)
+        self._track_subscriptions(request)
         await self._do_send_no_future(request)
 
     async def _do_pop_message(self: WebsocketBase) -> Dict[str, Any]:
+        if self._overflow_exception is not None:
+            raise self._overflow_exception
         msg = await cast(_MESSAGES_TYPE, self._messages).get()
         cast(_MESSAGES_TYPE, self._messages).task_done()
+        if self._overflow_exception is not None:
+            raise self._overflow_exception
         return msg
 
     async def _do_request_impl(self: WebsocketBase, request: Request) -> Response:
@@ -180,16 +874,41 @@ class WebsocketBase(Client):
             XRPLWebsocketException: If there is already an open request by the
                 request's ID, or if this WebsocketBase is not open.
         """
+        response = await self._do_request(request)
+        if response.is_successful():
+            self._track_subscriptions(request)
+        return response
+
+    async def _do_request(self: WebsocketBase, request: Request) -> Response:
         # if no ID on this request, generate and inject one, and ensure it
         # is backed by a future
         request_with_id = _inject_request_id(request)
         request_str = str(request_with_id.id)
         self._set_up_future(request_with_id)
+        self._awaited_requests.add(request_str)
+        if self._reconnect_policy is not None and self._reconnect_policy.retry_requests:
+            self._in_flight_requests[request_str] = request_with_id
 
         # fire-and-forget the send, and await the Future
-        create_task(self._do_send_no_future(request_with_id))
-        raw_response = await self._open_requests[request_str]
-
-        # remove the resolved Future, hopefully getting it garbage colleted
-        del self._open_requests[request_str]
+        create_task(self._send_for_request(request_with_id))
+        try:
+            raw_response = await self._open_requests[request_str]
+        finally:
+            # remove the resolved Future, hopefully getting it garbage colleted
+            self._open_requests.pop(request_str, None)
+            self._awaited_requests.discard(request_str)
+            self._in_flight_requests.pop(request_str, None)
         return websocket_to_response(raw_response)
+
+    async def _send_for_request(self: WebsocketBase, request: Request) -> None:
+        """Sends a request, failing its Future if it cannot be sent."""
+        try:
+            await self._do_send_no_future(request)
+        except (XRPLWebsocketException, ConnectionClosed) as error:
+            future = self._open_requests.get(str(request.id))
+            if future is not None and not future.done():
+                future.set_exception(
+                    error
+                    if isinstance(error, XRPLWebsocketException)
+                    else XRPLWebsocketException("Websocket connection closed")
+                )
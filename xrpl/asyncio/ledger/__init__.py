@@ -1,4 +1,5 @@
 """Async methods for obtaining information about the status of the XRP Ledger."""
+from xrpl.asyncio.ledger.fee_oracle import FeeOracle
 from xrpl.asyncio.ledger.main import (
     get_fee,
     get_latest_open_ledger_sequence,
@@ -9,4 +10,5 @@ __all__ = [
     "get_latest_validated_ledger_sequence",
     "get_fee",
     "get_latest_open_ledger_sequence",
+    "FeeOracle",
 ]
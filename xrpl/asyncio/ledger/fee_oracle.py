@@ -0,0 +1,186 @@
+"""Caches the fees of the XRP Ledger, which only change from one ledger to the next."""
+from __future__ import annotations
+
+from asyncio import CancelledError, wrap_future
+from concurrent.futures import Future
+from functools import partial
+from threading import Lock
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, cast
+from weakref import WeakKeyDictionary
+
+from typing_extensions import Final
+
+from xrpl.asyncio.clients import Client, XRPLRequestFailureException
+from xrpl.asyncio.clients.websocket_base import WebsocketBase
+from xrpl.asyncio.ledger.main import _select_fee
+from xrpl.constants import XRPLException
+from xrpl.models.requests import Fee, ServerState, StreamParameter
+
+# the keys of the cached values
+_FEE: Final[str] = "fee"
+_RESERVE_INCREMENT: Final[str] = "reserve_increment"
+
+
+class _ClientCache:
+    """The cached values of one client, and the lookups in progress."""
+
+    def __init__(self: _ClientCache) -> None:
+        # the cached values, with the time at which they expire
+        self.values: Dict[str, Tuple[float, Any]] = {}
+        self.lookups: Dict[str, Future[Any]] = {}
+
+
+class FeeOracle:
+    """
+    Caches the ``fee`` and ``server_state`` results of each client for ``ttl``
+    seconds, about the time it takes the network to close a ledger, so that
+    transactions prepared together share one lookup instead of making one each::
+
+        oracle = FeeOracle()
+        await asyncio.gather(
+            *(autofill(payment, client, fee_oracle=oracle) for payment in payments)
+        )
+
+    Concurrent callers wait for the same lookup. The cache of a websocket client can
+    also be refreshed by its ``ledger`` stream with ``watch``.
+    """
+
+    def __init__(self: FeeOracle, *, ttl: float = 4.0) -> None:
+        """
+        Initializes a fee oracle.
+
+        Args:
+            ttl: How long, in seconds, a looked up value is used before it is looked
+                up again. The default is 4, the usual time between ledgers.
+        """
+        self.ttl = ttl
+        self._caches: WeakKeyDictionary[Client, _ClientCache] = WeakKeyDictionary()
+        # the sync helpers may share an oracle between threads
+        self._lock = Lock()
+
+    async def get_fee(
+        self: FeeOracle,
+        client: Client,
+        *,
+        max_fee: Optional[float] = 2,
+        fee_type: str = "open",
+    ) -> str:
+        """
+        Returns the current transaction fee, as `get_fee` does, from the cached
+        ``fee`` result of the client.
+
+        Args:
+            client: the network client used to make network calls.
+            max_fee: The maximum fee in XRP that the user wants to pay. If None, there
+                is no ceiling for the fee. The default is 2 XRP.
+            fee_type: The type of fee to return: "open", "minimum" or "dynamic". The
+                default is "open".
+
+        Returns:
+            The transaction fee, in drops.
+        """
+        result = await self._get(client, _FEE, partial(_fetch_fee_result, client))
+        return _select_fee(result, max_fee, fee_type)
+
+    async def get_reserve_increment(self: FeeOracle, client: Client) -> int:
+        """
+        Returns the owner reserve, which is also the fee of an AccountDelete
+        transaction, from the cached ``server_state`` result of the client.
+
+        Args:
+            client: the network client used to make network calls.
+
+        Returns:
+            The owner reserve, in drops.
+        """
+        return cast(
+            int,
+            await self._get(
+                client, _RESERVE_INCREMENT, partial(_fetch_reserve_increment, client)
+            ),
+        )
+
+    def watch(self: FeeOracle, client: WebsocketBase) -> None:
+        """
+        Refreshes the cache of a websocket client whenever a ledger closes. The
+        client must be subscribed to the ``ledger`` stream. The ``ledgerClosed``
+        messages still reach the other consumers of the client.
+
+        Args:
+            client: The websocket client.
+        """
+        client.on(
+            StreamParameter.LEDGER,
+            partial(self._on_ledger_closed, client),
+            consume=False,
+        )
+
+    def clear(self: FeeOracle) -> None:
+        """Drops every cached value, so that the next callers look them up again."""
+        with self._lock:
+            for cache in self._caches.values():
+                cache.values.clear()
+
+    def _on_ledger_closed(
+        self: FeeOracle, client: Client, message: Dict[str, Any]
+    ) -> None:
+        with self._lock:
+            cache = self._caches.setdefault(client, _ClientCache())
+            # the load-scaled fees are only known from a new fee lookup
+            cache.values.pop(_FEE, None)
+            if "reserve_inc" in message:
+                cache.values[_RESERVE_INCREMENT] = (
+                    monotonic() + self.ttl,
+                    int(message["reserve_inc"]),
+                )
+
+    async def _get(
+        self: FeeOracle, client: Client, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        with self._lock:
+            cache = self._caches.setdefault(client, _ClientCache())
+            cached = cache.values.get(key)
+            if cached is not None and cached[0] > monotonic():
+                return cached[1]
+            lookup = cache.lookups.get(key)
+            if lookup is None:
+                # this caller looks the value up, and the others wait for it
+                lookup = cache.lookups[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return await wrap_future(lookup)
+
+        try:
+            value = await fetch()
+        except BaseException as error:
+            # also when this caller is cancelled, so that the next callers do not
+            # wait for a lookup that will never end
+            with self._lock:
+                del cache.lookups[key]
+            if isinstance(error, CancelledError) or not isinstance(error, Exception):
+                error = XRPLException(f"The lookup of the {key} was cancelled.")
+            lookup.set_exception(error)
+            raise
+        with self._lock:
+            del cache.lookups[key]
+            cache.values[key] = (monotonic() + self.ttl, value)
+        lookup.set_result(value)
+        return value
+
+
+async def _fetch_fee_result(client: Client) -> Dict[str, Any]:
+    response = await client.request_impl(Fee())
+    if not response.is_successful():
+        raise XRPLRequestFailureException(response.result)
+    return response.result
+
+
+async def _fetch_reserve_increment(client: Client) -> int:
+    response = await client.request_impl(ServerState())
+    if not response.is_successful():
+        raise XRPLRequestFailureException(response.result)
+    return int(response.result["state"]["validated_ledger"]["reserve_inc"])
@@ -1,6 +1,6 @@
 """High-level ledger methods with the XRPL ledger."""
 
-from typing import Optional, cast
+from typing import Any, Dict, Optional, cast
 
 from xrpl.asyncio.clients import Client, XRPLRequestFailureException
 from xrpl.asyncio.ledger.utils import calculate_fee_dynamically
@@ -78,7 +78,11 @@ async def get_fee(
     if not response.is_successful():
         raise XRPLRequestFailureException(response.result)
 
-    result = response.result
+    return _select_fee(response.result, max_fee, fee_type)
+
+
+def _select_fee(result: Dict[str, Any], max_fee: Optional[float], fee_type: str) -> str:
+    """Returns the fee of the given type from a ``fee`` result, up to `max_fee`."""
     drops = result["drops"]
     if fee_type == "open":
         fee = cast(str, drops["open_ledger_fee"])
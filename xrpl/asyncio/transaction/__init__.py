@@ -5,6 +5,7 @@ from xrpl.asyncio.transaction.main import (
     safe_sign_and_autofill_transaction,
     safe_sign_and_submit_transaction,
     safe_sign_transaction,
+    sign_many,
     submit_transaction,
     transaction_json_to_binary_codec_form,
 )
@@ -12,6 +13,9 @@ from xrpl.asyncio.transaction.reliable_submission import (
     XRPLReliableSubmissionException,
     send_reliable_submission,
 )
+from xrpl.asyncio.transaction.signed_transaction import SignedTransaction
+from xrpl.asyncio.transaction.submission_tracker import SubmissionTracker
+from xrpl.asyncio.transaction.ticket_pool import TicketPool
 
 __all__ = [
     "autofill",
@@ -19,8 +23,12 @@ __all__ = [
     "safe_sign_transaction",
     "safe_sign_and_autofill_transaction",
     "safe_sign_and_submit_transaction",
+    "sign_many",
     "submit_transaction",
     "transaction_json_to_binary_codec_form",
     "send_reliable_submission",
     "XRPLReliableSubmissionException",
+    "SignedTransaction",
+    "SubmissionTracker",
+    "TicketPool",
 ]
@@ -1,12 +1,22 @@
 """High-level transaction methods with XRPL transactions."""
 import math
-from typing import Any, Dict, Optional, cast
+from asyncio import gather
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from hashlib import sha512
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Union, cast
 
 from typing_extensions import Final
 
-from xrpl.asyncio.account import get_next_valid_seq_number
+from xrpl.asyncio.account import SequenceManager, get_next_valid_seq_number
 from xrpl.asyncio.clients import Client, XRPLRequestFailureException
-from xrpl.asyncio.ledger import get_fee, get_latest_validated_ledger_sequence
+from xrpl.asyncio.ledger import (
+    FeeOracle,
+    get_fee,
+    get_latest_validated_ledger_sequence,
+)
+from xrpl.asyncio.transaction.signed_transaction import SignedTransaction
 from xrpl.constants import XRPLException
 from xrpl.core.addresscodec import is_valid_xaddress, xaddress_to_classic_address
 from xrpl.core.binarycodec import encode, encode_for_signing
@@ -14,7 +24,10 @@ from xrpl.core.keypairs.main import sign
 from xrpl.models.requests import ServerState, SubmitOnly
 from xrpl.models.response import Response
 from xrpl.models.transactions import EscrowFinish
-from xrpl.models.transactions.transaction import Transaction
+from xrpl.models.transactions.transaction import (
+    _TRANSACTION_HASH_PREFIX,
+    Transaction,
+)
 from xrpl.models.transactions.transaction import (
     transaction_json_to_binary_codec_form as model_transaction_to_binary_codec,
 )
@@ -24,6 +37,9 @@ from xrpl.wallet.main import Wallet
 
 _LEDGER_OFFSET: Final[int] = 20
 
+# the network fee in drops when no client is given to look it up
+_REFERENCE_FEE: Final[int] = 10
+
 # TODO: make this dynamic based on the current ledger fee
 _ACCOUNT_DELETE_FEE: Final[int] = int(xrp_to_drops(2))
 
@@ -34,6 +50,9 @@ async def safe_sign_and_submit_transaction(
     client: Client,
     autofill: bool = True,
     check_fee: bool = True,
+    *,
+    sequence_manager: Optional[SequenceManager] = None,
+    fee_oracle: Optional[FeeOracle] = None,
 ) -> Response:
     """
     Signs a transaction (locally, without trusting external rippled nodes) and submits
@@ -46,17 +65,40 @@ async def safe_sign_and_submit_transaction(
         autofill: whether to autofill the relevant fields. Defaults to True.
         check_fee: whether to check if the fee is higher than the expected transaction
             type fee. Defaults to True.
+        sequence_manager: the SequenceManager of the account, to autofill the
+            sequence number from. It resyncs if the submission is rejected for its
+            sequence number.
+        fee_oracle: the FeeOracle to take the network fee from, instead of asking
+            the server for every transaction.
 
     Returns:
         The response from the ledger.
+
+    Raises:
+        XRPLRequestFailureException: if the rippled API call fails.
     """
+    managed = autofill and _is_managed(transaction, sequence_manager, None)
     if autofill:
-        transaction = await safe_sign_and_autofill_transaction(
-            transaction, wallet, client, check_fee
+        signed = await _autofill_and_sign(
+            transaction, wallet, client, check_fee, sequence_manager, fee_oracle
         )
     else:
-        transaction = await safe_sign_transaction(transaction, wallet, check_fee)
-    return await submit_transaction(transaction, client)
+        if check_fee:
+            await _check_fee(transaction)
+        signed = _sign(transaction, wallet)
+    if not managed:
+        return await submit_transaction(signed, client)
+
+    manager = cast(SequenceManager, sequence_manager)
+    sequence = cast(int, signed.transaction_json["Sequence"])
+    try:
+        response = await submit_transaction(signed, client)
+    except XRPLRequestFailureException:
+        # a rejected request was not applied, so its sequence number is unused
+        manager.release(sequence)
+        raise
+    manager.check_result(response.result.get("engine_result", ""), sequence)
+    return response
 
 
 async def safe_sign_transaction(
@@ -78,12 +120,87 @@ async def safe_sign_transaction(
     """
     if check_fee:
         await _check_fee(transaction)
-    transaction_json = _prepare_transaction(transaction, wallet)
+    return _sign(transaction, wallet).transaction
+
+
+def sign_many(
+    transactions: Iterable[Transaction],
+    wallet: Wallet,
+    *,
+    check_fee: bool = True,
+    workers: int = 1,
+) -> List[SignedTransaction]:
+    """
+    Signs many transactions locally with one wallet. Unlike `safe_sign_transaction`,
+    no signed Transaction is built for each transaction: the signed blobs, ready to
+    submit, and their hashes are returned directly as SignedTransactions.
+
+    With more than one worker, the transactions are signed in a process pool, as
+    signing is CPU-bound. On platforms that start processes with ``spawn``, such as
+    Windows and macOS, the calling script must then be guarded by
+    ``if __name__ == "__main__":``.
+
+    Args:
+        transactions: the transactions to be signed. They must already be
+            autofilled.
+        wallet: the wallet with which to sign the transactions.
+        check_fee: whether to check if the fees are higher than the expected
+            transaction type fees. Defaults to True.
+        workers: how many processes sign the transactions. Defaults to 1, which signs
+            them in this process.
+
+    Returns:
+        The signed transactions, in the order of the transactions.
+    """
+    transactions = list(transactions)
+    if check_fee:
+        for transaction in transactions:
+            # without a client, the expected fee needs no lookup
+            _check_fee_limit(
+                transaction,
+                _get_fee_per_transaction_type(
+                    transaction, _REFERENCE_FEE, _ACCOUNT_DELETE_FEE
+                ),
+            )
+    prepared = [
+        _prepare_transaction(transaction, wallet) for transaction in transactions
+    ]
+    sign_prepared = partial(_sign_prepared, private_key=wallet.private_key)
+    if workers <= 1 or len(prepared) < 2:
+        return [sign_prepared(transaction_json) for transaction_json in prepared]
+    with ProcessPoolExecutor(workers) as executor:
+        # send the transactions in a few large chunks, to limit the pickling
+        chunk_size = max(1, len(prepared) // (workers * 4))
+        return list(executor.map(sign_prepared, prepared, chunksize=chunk_size))
+
+
+def _sign(transaction: Transaction, wallet: Wallet) -> SignedTransaction:
+    return _sign_prepared(_prepare_transaction(transaction, wallet), wallet.private_key)
+
+
+def _sign_prepared(
+    transaction_json: Dict[str, Any], private_key: str
+) -> SignedTransaction:
+    """
+    Signs a transaction prepared by `_prepare_transaction`. Its signed blob is
+    serialized once, and hashed from the same bytes.
+    """
     serialized_for_signing = encode_for_signing(transaction_json)
-    serialized_bytes = bytes.fromhex(serialized_for_signing)
-    signature = sign(serialized_bytes, wallet.private_key)
-    transaction_json["TxnSignature"] = signature
-    return Transaction.from_xrpl(transaction_json)
+    transaction_json["TxnSignature"] = sign(
+        bytes.fromhex(serialized_for_signing), private_key
+    )
+    transaction_blob = encode(transaction_json)
+    return SignedTransaction(
+        transaction_json, transaction_blob, _hash_transaction_blob(transaction_blob)
+    )
+
+
+def _hash_transaction_blob(transaction_blob: str) -> str:
+    """Hashes a signed transaction blob as the ledger does."""
+    hashed = sha512(
+        _TRANSACTION_HASH_PREFIX.to_bytes(4, "big") + bytes.fromhex(transaction_blob)
+    )
+    return hashed.digest().hex().upper()[:64]
 
 
 async def safe_sign_and_autofill_transaction(
@@ -91,6 +208,9 @@ async def safe_sign_and_autofill_transaction(
     wallet: Wallet,
     client: Client,
     check_fee: bool = True,
+    *,
+    sequence_manager: Optional[SequenceManager] = None,
+    fee_oracle: Optional[FeeOracle] = None,
 ) -> Transaction:
     """
     Signs a transaction locally, without trusting external rippled nodes. Autofills
@@ -102,30 +222,77 @@ async def safe_sign_and_autofill_transaction(
         client: a network client.
         check_fee: whether to check if the fee is higher than the expected transaction
             type fee. Defaults to True.
+        sequence_manager: the SequenceManager of the account, to autofill the
+            sequence number from.
+        fee_oracle: the FeeOracle to take the network fee from, instead of asking
+            the server for every transaction.
 
     Returns:
         The signed transaction.
     """
+    return (
+        await _autofill_and_sign(
+            transaction, wallet, client, check_fee, sequence_manager, fee_oracle
+        )
+    ).transaction
+
+
+async def _autofill_and_sign(
+    transaction: Transaction,
+    wallet: Wallet,
+    client: Client,
+    check_fee: bool,
+    sequence_manager: Optional[SequenceManager],
+    fee_oracle: Optional[FeeOracle],
+) -> SignedTransaction:
     # We do the transaction fee check here as we have the Client available.
     # The fee check will be done if transaction.fee exists. Otherwise the fee
-    # will be auto-filled in autofill()
+    # will be auto-filled in autofill(). Both use the same network fee, which is
+    # looked up together with the other autofilled fields. A managed sequence number
+    # is only taken once the check has passed, so that a failed check does not use
+    # it up.
+    managed = _is_managed(transaction, sequence_manager, None)
+    context = await _fetch_autofill_context(
+        transaction,
+        client,
+        _AutofillContext(),
+        check_fee=check_fee,
+        fetch_sequence=not managed,
+        fee_oracle=fee_oracle,
+    )
     if check_fee:
-        await _check_fee(transaction, client)
+        await _check_fee(transaction, client, context)
+    if managed:
+        context = await _fetch_autofill_context(
+            transaction,
+            client,
+            context,
+            sequence_manager=sequence_manager,
+            fee_oracle=fee_oracle,
+        )
 
-    return await safe_sign_transaction(
-        await autofill(transaction, client), wallet, False
+    autofilled = await _fill_transaction(
+        transaction, client, context, sequence_manager if managed else None
     )
+    signed = None
+    try:
+        signed = _sign(autofilled, wallet)
+    finally:
+        if signed is None and managed:
+            # the sequence number will not be used
+            cast(SequenceManager, sequence_manager).release(cast(int, context.sequence))
+    return signed
 
 
 async def submit_transaction(
-    transaction: Transaction,
+    transaction: Union[Transaction, SignedTransaction],
     client: Client,
 ) -> Response:
     """
     Submits a transaction to the ledger.
 
     Args:
-        transaction: the Transaction to be submitted.
+        transaction: the signed Transaction, or SignedTransaction, to be submitted.
         client: the network client with which to submit the transaction.
 
     Returns:
@@ -134,7 +301,10 @@ async def submit_transaction(
     Raises:
         XRPLRequestFailureException: if the rippled API call fails.
     """
-    transaction_blob = encode(transaction.to_xrpl())
+    if isinstance(transaction, SignedTransaction):
+        transaction_blob = transaction.tx_blob
+    else:
+        transaction_blob = transaction.to_binary()
     response = await client.request_impl(SubmitOnly(tx_blob=transaction_blob))
     if response.is_successful():
         return response
@@ -180,31 +350,182 @@ def _prepare_transaction(
     return transaction_json
 
 
-async def autofill(transaction: Transaction, client: Client) -> Transaction:
+async def autofill(
+    transaction: Transaction,
+    client: Client,
+    *,
+    sequence: Optional[int] = None,
+    net_fee: Optional[str] = None,
+    ledger_index: Optional[int] = None,
+    sequence_manager: Optional[SequenceManager] = None,
+    fee_oracle: Optional[FeeOracle] = None,
+) -> Transaction:
     """
     Autofills fields in a transaction. This will set `sequence`, `fee`, and
     `last_ledger_sequence` according to the current state of the server this Client is
     connected to. It also converts all X-Addresses to classic addresses.
 
+    The lookups for the missing fields are made concurrently. Values already fetched
+    by the caller, for example once for a batch of transactions, can be passed in to
+    skip them.
+
     Args:
         transaction: the transaction to be signed.
         client: a network client.
+        sequence: the next sequence number of the account, if already known.
+        net_fee: the network fee in drops, as returned by `get_fee`, if already
+            known. The transaction fee is calculated from it.
+        ledger_index: the latest validated ledger index, if already known.
+        sequence_manager: the SequenceManager of the account, to take the sequence
+            number from instead of asking the server for every transaction.
+        fee_oracle: the FeeOracle to take the network fee from, instead of asking
+            the server for every transaction.
 
     Returns:
         The autofilled transaction.
+
+    Raises:
+        XRPLException: if the transaction is not from the account of the
+            sequence manager.
     """
-    transaction_json = transaction.to_dict()
-    if "sequence" not in transaction_json:
-        sequence = await get_next_valid_seq_number(transaction_json["account"], client)
-        transaction_json["sequence"] = sequence
-    if "fee" not in transaction_json:
-        transaction_json["fee"] = await _calculate_fee_per_transaction_type(
-            transaction, client
+    managed = _is_managed(transaction, sequence_manager, sequence)
+    context = await _fetch_autofill_context(
+        transaction,
+        client,
+        _AutofillContext(sequence, net_fee, ledger_index),
+        sequence_manager=sequence_manager if managed else None,
+        fee_oracle=fee_oracle,
+    )
+    return await _fill_transaction(
+        transaction, client, context, sequence_manager if managed else None
+    )
+
+
+@dataclass(frozen=True)
+class _AutofillContext:
+    """The values from the ledger that autofilling a transaction uses."""
+
+    sequence: Optional[int] = None
+    net_fee: Optional[str] = None
+    ledger_index: Optional[int] = None
+    account_delete_fee: Optional[int] = None
+
+
+def _is_managed(
+    transaction: Transaction,
+    sequence_manager: Optional[SequenceManager],
+    sequence: Optional[int],
+) -> bool:
+    """
+    Returns whether the sequence number of the transaction is to be taken from the
+    sequence manager, raising if the manager is for another account.
+    """
+    if (
+        sequence_manager is None
+        or transaction.sequence is not None
+        or transaction.ticket_sequence is not None
+        or sequence is not None
+    ):
+        return False
+    if _get_classic_address(transaction.account) != sequence_manager.account:
+        raise XRPLException(
+            "The transaction is not from the account of the sequence manager."
         )
-    if "last_ledger_sequence" not in transaction_json:
-        ledger_sequence = await get_latest_validated_ledger_sequence(client)
-        transaction_json["last_ledger_sequence"] = ledger_sequence + _LEDGER_OFFSET
-    return Transaction.from_dict(transaction_json)
+    return True
+
+
+async def _fill_transaction(
+    transaction: Transaction,
+    client: Client,
+    context: _AutofillContext,
+    sequence_manager: Optional[SequenceManager],
+) -> Transaction:
+    """
+    Fills in the missing fields from the looked up values. If that fails, the
+    sequence number taken from the sequence manager, if any, is given back.
+    """
+    autofilled = None
+    try:
+        transaction_json = transaction.to_dict()
+        if "sequence" not in transaction_json:
+            # a transaction that uses a Ticket has a sequence number of 0
+            transaction_json["sequence"] = (
+                0 if transaction.ticket_sequence is not None else context.sequence
+            )
+        if "fee" not in transaction_json:
+            transaction_json["fee"] = await _calculate_fee_per_transaction_type(
+                transaction, client, context
+            )
+        if "last_ledger_sequence" not in transaction_json:
+            transaction_json["last_ledger_sequence"] = (
+                cast(int, context.ledger_index) + _LEDGER_OFFSET
+            )
+        autofilled = Transaction.from_dict(transaction_json)
+    finally:
+        if autofilled is None and sequence_manager is not None:
+            # the sequence number will not be used
+            sequence_manager.release(cast(int, context.sequence))
+    return autofilled
+
+
+async def _fetch_autofill_context(
+    transaction: Transaction,
+    client: Client,
+    context: _AutofillContext,
+    *,
+    check_fee: bool = False,
+    sequence_manager: Optional[SequenceManager] = None,
+    fetch_sequence: bool = True,
+    fee_oracle: Optional[FeeOracle] = None,
+) -> _AutofillContext:
+    """
+    Concurrently looks up what autofilling the transaction needs and is not in the
+    given context: the sequence number, the network fee, the AccountDelete fee and
+    the latest validated ledger index. Fields the transaction already has are not
+    looked up. The fees are also looked up for `check_fee`.
+
+    The fees are taken from the fee oracle, and the sequence number from the sequence
+    manager, if they are given. If
+    another lookup fails, a number taken from the manager is given back.
+    """
+    needs_fee = transaction.fee is None or check_fee
+    lookups: Dict[str, Awaitable[Any]] = {}
+    if (
+        transaction.sequence is None
+        and transaction.ticket_sequence is None
+        and context.sequence is None
+    ):
+        if sequence_manager is not None:
+            lookups["sequence"] = sequence_manager.next_sequence(client)
+        elif fetch_sequence:
+            lookups["sequence"] = get_next_valid_seq_number(transaction.account, client)
+    if needs_fee and context.net_fee is None:
+        lookups["net_fee"] = (
+            fee_oracle.get_fee(client) if fee_oracle is not None else get_fee(client)
+        )
+    if (
+        needs_fee
+        and transaction.transaction_type == TransactionType.ACCOUNT_DELETE
+        and context.account_delete_fee is None
+    ):
+        lookups["account_delete_fee"] = (
+            fee_oracle.get_reserve_increment(client)
+            if fee_oracle is not None
+            else _fetch_account_delete_fee(client)
+        )
+    if transaction.last_ledger_sequence is None and context.ledger_index is None:
+        lookups["ledger_index"] = get_latest_validated_ledger_sequence(client)
+
+    results: Dict[str, Any] = dict(
+        zip(lookups, await gather(*lookups.values(), return_exceptions=True))
+    )
+    for result in results.values():
+        if isinstance(result, BaseException):
+            managed_sequence = results.get("sequence")
+            if sequence_manager is not None and isinstance(managed_sequence, int):
+                sequence_manager.release(managed_sequence)
+            raise result
+    return replace(context, **results)
 
 
 def _validate_account_xaddress(
@@ -231,6 +552,12 @@ def _validate_account_xaddress(
         json[tag_field] = tag
 
 
+def _get_classic_address(address: str) -> str:
+    if is_valid_xaddress(address):
+        return xaddress_to_classic_address(address)[0]
+    return address
+
+
 def _convert_to_classic_address(json: Dict[str, Any], field: str) -> None:
     """
     Mutates JSON-like dictionary to convert the given field from an X-Address (if
@@ -258,20 +585,31 @@ def transaction_json_to_binary_codec_form(dictionary: Dict[str, Any]) -> Dict[st
     return model_transaction_to_binary_codec(dictionary)
 
 
-async def _check_fee(transaction: Transaction, client: Optional[Client] = None) -> None:
+async def _check_fee(
+    transaction: Transaction,
+    client: Optional[Client] = None,
+    context: Optional[_AutofillContext] = None,
+) -> None:
     """
     Checks if the Transaction fee is lower than the expected Transaction type fee.
 
     Args:
         transaction: The transaction to check.
         client: Client instance to use to look up network load
+        context: The fees already looked up, if any.
 
     Raises:
         XRPLException: if the transaction fee is higher than the expected fee.
     """
     # Calculate the expected fee from the network load and transaction type
-    expected_fee = await _calculate_fee_per_transaction_type(transaction, client)
+    expected_fee = await _calculate_fee_per_transaction_type(
+        transaction, client, context
+    )
+    _check_fee_limit(transaction, expected_fee)
 
+
+def _check_fee_limit(transaction: Transaction, expected_fee: str) -> None:
+    """Raises if the transaction fee is higher than the expected fee."""
     if transaction.fee and int(transaction.fee) > int(expected_fee):
         raise XRPLException(
             "Fee value: "
@@ -285,7 +623,9 @@ async def _check_fee(transaction: Transaction, client: Optional[Client] = None)
 
 
 async def _calculate_fee_per_transaction_type(
-    transaction: Transaction, client: Optional[Client] = None
+    transaction: Transaction,
+    client: Optional[Client] = None,
+    context: Optional[_AutofillContext] = None,
 ) -> str:
     """
     Calculate the total fee in drops for a transaction based on:
@@ -297,17 +637,40 @@ async def _calculate_fee_per_transaction_type(
     Args:
         transaction: the Transaction to be submitted.
         client: the network client with which to submit the transaction.
+        context: the fees already looked up, if any.
 
     Returns:
         The expected Transaction fee in drops
     """
+    context = context or _AutofillContext()
     # Reference Transaction (Most transactions)
-    if client is None:
-        net_fee = 10  # 10 drops
+    if context.net_fee is not None:
+        reference_fee = int(context.net_fee)
+    elif client is None:
+        reference_fee = _REFERENCE_FEE
     else:
-        net_fee = int(await get_fee(client))  # Usually 0.00001 XRP (10 drops)
+        reference_fee = int(await get_fee(client))  # Usually 0.00001 XRP (10 drops)
 
-    base_fee = net_fee
+    account_delete_fee = None
+    if transaction.transaction_type == TransactionType.ACCOUNT_DELETE:
+        if context.account_delete_fee is not None:
+            account_delete_fee = context.account_delete_fee
+        elif client is None:
+            account_delete_fee = _ACCOUNT_DELETE_FEE
+        else:
+            account_delete_fee = await _fetch_account_delete_fee(client)
+
+    return _get_fee_per_transaction_type(transaction, reference_fee, account_delete_fee)
+
+
+def _get_fee_per_transaction_type(
+    transaction: Transaction, reference_fee: int, account_delete_fee: Optional[int]
+) -> str:
+    """
+    Calculates the fee in drops for a transaction from the reference fee, and from
+    the fee of an AccountDelete transaction if it is one.
+    """
+    base_fee = reference_fee
 
     # EscrowFinish Transaction with Fulfillment
     # https://xrpl.org/escrowfinish.html#escrowfinish-fields
@@ -316,19 +679,16 @@ async def _calculate_fee_per_transaction_type(
         if escrow_finish.fulfillment is not None:
             fulfillment_bytes = escrow_finish.fulfillment.encode("ascii")
             # 10 drops × (33 + (Fulfillment size in bytes / 16))
-            base_fee = math.ceil(net_fee * (33 + (len(fulfillment_bytes) / 16)))
+            base_fee = math.ceil(reference_fee * (33 + (len(fulfillment_bytes) / 16)))
 
     # AccountDelete Transaction
-    if transaction.transaction_type == TransactionType.ACCOUNT_DELETE:
-        if client is None:
-            base_fee = _ACCOUNT_DELETE_FEE
-        else:
-            base_fee = await _fetch_account_delete_fee(client)
+    if account_delete_fee is not None:
+        base_fee = account_delete_fee
 
     # Multi-signed Transaction
     # 10 drops × (1 + Number of Signatures Provided)
     if transaction.signers and len(transaction.signers) > 0:
-        base_fee = net_fee * (1 + len(transaction.signers)) + base_fee
+        base_fee = reference_fee * (1 + len(transaction.signers)) + base_fee
 
     # Round Up base_fee and return it as a String
     return str(math.ceil(base_fee))
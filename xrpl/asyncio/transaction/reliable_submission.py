@@ -1,19 +1,53 @@
 """High-level reliable submission methods with XRPL transactions."""
 
 import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from typing_extensions import Final
 
-from xrpl.asyncio.clients import Client
+from xrpl.asyncio.clients import (
+    AsyncWebsocketClient,
+    Client,
+    XRPLRequestFailureException,
+)
 from xrpl.asyncio.ledger import get_latest_validated_ledger_sequence
 from xrpl.asyncio.transaction.ledger import get_transaction_from_hash
 from xrpl.asyncio.transaction.main import submit_transaction
+from xrpl.asyncio.transaction.signed_transaction import SignedTransaction
 from xrpl.constants import XRPLException
+from xrpl.models.requests import StreamParameter, Subscribe, Unsubscribe
 from xrpl.models.response import Response
 from xrpl.models.transactions.transaction import Transaction
 
 _LEDGER_CLOSE_TIME: Final[int] = 4
 
+# how long to wait before the first poll of the transaction; later polls wait twice
+# as long as the one before, up to the ledger close time
+_FIRST_POLL_DELAY: Final[float] = 1.0
+
+# how many ledger close times to wait for a stream message before polling instead
+_STREAM_TIMEOUT_LEDGERS: Final[int] = 2
+
+# a subscription made for reliable submissions: ("ledger", "") or ("account", address)
+_Watch = Tuple[str, str]
+
+
+class _WatchUsers:
+    """The reliable submissions that use a subscription of a client."""
+
+    def __init__(self: "_WatchUsers") -> None:
+        self.count = 0
+        # whether the subscription was made for them, rather than by the caller
+        self.subscribed = False
+
+
+# for each websocket client, the users of each subscription, so that concurrent
+# submissions share it and it is only cancelled once none of them needs it
+_watches: "WeakKeyDictionary[AsyncWebsocketClient, Dict[_Watch, _WatchUsers]]" = (
+    WeakKeyDictionary()
+)
+
 
 class XRPLReliableSubmissionException(XRPLException):
     """General XRPL Reliable Submission Exception."""
@@ -21,18 +55,18 @@ class XRPLReliableSubmissionException(XRPLException):
     pass
 
 
-async def _wait_for_final_transaction_outcome(
-    transaction_hash: str, client: Client, prelim_result: str
-) -> Response:
+async def _check_outcome(
+    transaction_hash: str,
+    client: Client,
+    prelim_result: str,
+    last_ledger_sequence: int,
+    latest_ledger_sequence: Optional[int] = None,
+) -> Optional[Response]:
     """
-    The core logic of reliable submission.  Polls the ledger until the result of the
-    transaction can be considered final, meaning it has either been included in a
-    validated ledger, or the transaction's lastLedgerSequence has been surpassed by the
-    latest ledger sequence (meaning it will never be included in a validated ledger).
+    Returns the response of the transaction if it is in a validated ledger, raises if
+    it can no longer be included in one, and returns None if its outcome is not yet
+    final. The latest validated ledger sequence is looked up if not given.
     """
-    await asyncio.sleep(_LEDGER_CLOSE_TIME)
-    # new persisted transaction
-
     # query transaction by hash
     transaction_response = await get_transaction_from_hash(transaction_hash, client)
 
@@ -41,14 +75,12 @@ async def _wait_for_final_transaction_outcome(
         # result is in a validated ledger, outcome is final
         return transaction_response
 
-    last_ledger_sequence = result["LastLedgerSequence"]
-    latest_ledger_sequence = await get_latest_validated_ledger_sequence(client)
+    if latest_ledger_sequence is None:
+        latest_ledger_sequence = await get_latest_validated_ledger_sequence(client)
 
     if last_ledger_sequence > latest_ledger_sequence:
         # outcome is not yet final
-        return await _wait_for_final_transaction_outcome(
-            transaction_hash, client, prelim_result
-        )
+        return None
 
     raise XRPLReliableSubmissionException(
         f"The latest ledger sequence {latest_ledger_sequence} is greater than the "
@@ -57,13 +89,169 @@ async def _wait_for_final_transaction_outcome(
     )
 
 
+async def _wait_for_final_transaction_outcome(
+    transaction_hash: str, client: Client, prelim_result: str, last_ledger_sequence: int
+) -> Response:
+    """
+    The core logic of reliable submission.  Polls the ledger until the result of the
+    transaction can be considered final, meaning it has either been included in a
+    validated ledger, or the transaction's lastLedgerSequence has been surpassed by the
+    latest ledger sequence (meaning it will never be included in a validated ledger).
+
+    The first poll is made after a second, and the polls back off to one per ledger
+    close time.
+    """
+    delay = _FIRST_POLL_DELAY
+    while True:
+        await asyncio.sleep(delay)
+        response = await _check_outcome(
+            transaction_hash, client, prelim_result, last_ledger_sequence
+        )
+        if response is not None:
+            return response
+        delay = min(delay * 2, _LEDGER_CLOSE_TIME)
+
+
+async def _watch_for_final_transaction_outcome(
+    transaction: Union[Transaction, SignedTransaction], client: AsyncWebsocketClient
+) -> Response:
+    """
+    Submits a transaction and waits for its outcome on the ``ledger`` stream and the
+    ``accounts`` stream of its account. The transaction is looked up once its
+    validated result arrives, or once a ledger past its lastLedgerSequence closes.
+    If no stream message arrives for a while, the ledger is polled instead.
+    """
+    transaction_hash = transaction.get_hash()
+    last_ledger_sequence = transaction.last_ledger_sequence or 0
+    # None when the transaction is validated, or the index of each closed ledger
+    events: "asyncio.Queue[Optional[int]]" = asyncio.Queue()
+
+    def on_transaction(message: Dict[str, Any]) -> None:
+        if (
+            message.get("validated")
+            and message.get("transaction", {}).get("hash") == transaction_hash
+        ):
+            events.put_nowait(None)
+
+    def on_ledger_closed(message: Dict[str, Any]) -> None:
+        events.put_nowait(message["ledger_index"])
+
+    # the messages also go to the caller's own consumers of the client
+    client.on(
+        StreamParameter.TRANSACTIONS,
+        on_transaction,
+        account=transaction.account,
+        consume=False,
+    )
+    client.on(StreamParameter.LEDGER, on_ledger_closed, consume=False)
+    watches: List[_Watch] = [("ledger", ""), ("account", transaction.account)]
+    try:
+        await _add_watches(client, watches)
+        prelim_result = _get_prelim_result(
+            await submit_transaction(transaction, client)
+        )
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    events.get(), _LEDGER_CLOSE_TIME * _STREAM_TIMEOUT_LEDGERS
+                )
+            except asyncio.TimeoutError:
+                # the streams are quiet, so look the outcome up directly
+                response = await _check_outcome(
+                    transaction_hash, client, prelim_result, last_ledger_sequence
+                )
+            else:
+                if event is not None and event < last_ledger_sequence:
+                    continue
+                response = await _check_outcome(
+                    transaction_hash,
+                    client,
+                    prelim_result,
+                    last_ledger_sequence,
+                    event,
+                )
+            if response is not None:
+                return response
+    finally:
+        client.off(
+            StreamParameter.TRANSACTIONS, on_transaction, account=transaction.account
+        )
+        client.off(StreamParameter.LEDGER, on_ledger_closed)
+        await _remove_watches(client, watches)
+
+
+async def _add_watches(client: AsyncWebsocketClient, watches: List[_Watch]) -> None:
+    """Subscribes to what is not subscribed to yet by the client."""
+    client_watches = _watches.setdefault(client, {})
+    missing = []
+    for watch in watches:
+        users = client_watches.setdefault(watch, _WatchUsers())
+        users.count += 1
+        if users.count == 1 and not _is_subscribed(client, watch):
+            users.subscribed = True
+            missing.append(watch)
+    if missing:
+        await _request_watches(client, Subscribe, missing)
+
+
+async def _remove_watches(client: AsyncWebsocketClient, watches: List[_Watch]) -> None:
+    """Cancels the subscriptions made for reliable submissions that none needs."""
+    client_watches = _watches.get(client, {})
+    unused = []
+    for watch in watches:
+        users = client_watches[watch]
+        users.count -= 1
+        if users.count == 0:
+            if users.subscribed:
+                unused.append(watch)
+            del client_watches[watch]
+    if unused and client.is_open():
+        await _request_watches(client, Unsubscribe, unused)
+
+
+async def _request_watches(
+    client: AsyncWebsocketClient, request_type: Any, watches: List[_Watch]
+) -> None:
+    streams = [StreamParameter.LEDGER for kind, _ in watches if kind == "ledger"]
+    accounts = [account for kind, account in watches if kind == "account"]
+    response = await client.request_impl(
+        request_type(streams=streams or None, accounts=accounts or None)
+    )
+    if not response.is_successful():
+        raise XRPLRequestFailureException(response.result)
+
+
+def _is_subscribed(client: AsyncWebsocketClient, watch: _Watch) -> bool:
+    kind, account = watch
+    for subscription in client.subscriptions:
+        if kind == "ledger" and StreamParameter.LEDGER in (subscription.streams or []):
+            return True
+        if kind == "account" and account in (subscription.accounts or []):
+            return True
+    return False
+
+
+def _get_prelim_result(submit_response: Response) -> str:
+    prelim_result: str = submit_response.result["engine_result"]
+    if prelim_result[0:3] == "tem":
+        raise XRPLReliableSubmissionException(
+            submit_response.result["engine_result_message"]
+        )
+    return prelim_result
+
+
 async def send_reliable_submission(
-    transaction: Transaction, client: Client
+    transaction: Union[Transaction, SignedTransaction], client: Client
 ) -> Response:
     """
     Asynchronously submits a transaction and verifies that it has been included in a
     validated ledger (or has errored/will not be included for some reason).
 
+    With an open ``AsyncWebsocketClient``, the outcome is taken from the ``ledger``
+    stream and the ``accounts`` stream of the transaction's account, which are
+    subscribed to while waiting, so it is known as soon as the transaction is
+    validated. With other clients, the ledger is polled.
+
     `See Reliable Transaction Submission
     <https://xrpl.org/reliable-transaction-submission.html>`_
 
@@ -71,8 +259,8 @@ async def send_reliable_submission(
     close automatically.
 
     Args:
-        transaction: the signed transaction to submit to the ledger. Requires a
-            `last_ledger_sequence` param.
+        transaction: the signed Transaction, or SignedTransaction, to submit to the
+            ledger. Requires a `last_ledger_sequence` param.
         client: the network client used to submit the transaction to a rippled node.
 
     Returns:
@@ -86,14 +274,13 @@ async def send_reliable_submission(
         raise XRPLReliableSubmissionException(
             "Transaction must have a `last_ledger_sequence` param."
         )
+    if isinstance(client, AsyncWebsocketClient) and client.is_open():
+        return await _watch_for_final_transaction_outcome(transaction, client)
+
     transaction_hash = transaction.get_hash()
     submit_response = await submit_transaction(transaction, client)
-    prelim_result = submit_response.result["engine_result"]
-    if prelim_result[0:3] == "tem":
-        raise XRPLReliableSubmissionException(
-            submit_response.result["engine_result_message"]
-        )
+    prelim_result = _get_prelim_result(submit_response)
 
     return await _wait_for_final_transaction_outcome(
-        transaction_hash, client, prelim_result
+        transaction_hash, client, prelim_result, transaction.last_ledger_sequence
     )
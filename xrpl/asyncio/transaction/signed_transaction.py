@@ -0,0 +1,77 @@
+"""A signed transaction that is only serialized once."""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, cast
+
+from xrpl.models.transactions.transaction import Transaction
+
+
+class SignedTransaction:
+    """
+    A signed transaction, with the blob to submit and the hash already computed from
+    it, so that submitting and tracking the transaction does not serialize it again.
+    The Transaction model is only built if it is asked for.
+
+    ``submit_transaction``, ``send_reliable_submission`` and ``SubmissionTracker``
+    accept a SignedTransaction wherever they accept a signed Transaction.
+    """
+
+    def __init__(
+        self: SignedTransaction,
+        transaction_json: Dict[str, Any],
+        tx_blob: str,
+        hash: str,
+    ) -> None:
+        """
+        Initializes a signed transaction.
+
+        Args:
+            transaction_json: The signed transaction, in the JSON format of the XRPL.
+            tx_blob: The serialized signed transaction, as hex.
+            hash: The hash of the transaction.
+        """
+        self.transaction_json = transaction_json
+        self.tx_blob = tx_blob
+        self.hash = hash
+        self._transaction: Optional[Transaction] = None
+
+    @property
+    def transaction(self: SignedTransaction) -> Transaction:
+        """
+        The signed transaction, as a Transaction model. It is built on first use.
+
+        Returns:
+            The signed Transaction.
+        """
+        if self._transaction is None:
+            self._transaction = Transaction.from_xrpl(self.transaction_json)
+        return self._transaction
+
+    @property
+    def account(self: SignedTransaction) -> str:
+        """
+        The account that sent the transaction.
+
+        Returns:
+            The classic address of the account.
+        """
+        return cast(str, self.transaction_json["Account"])
+
+    @property
+    def last_ledger_sequence(self: SignedTransaction) -> Optional[int]:
+        """
+        The last ledger the transaction can be validated in, if it has one.
+
+        Returns:
+            The ``LastLedgerSequence`` of the transaction.
+        """
+        return cast(Optional[int], self.transaction_json.get("LastLedgerSequence"))
+
+    def get_hash(self: SignedTransaction) -> str:
+        """
+        Returns the hash of the transaction, like ``Transaction.get_hash``.
+
+        Returns:
+            The hash of the transaction.
+        """
+        return self.hash
@@ -0,0 +1,279 @@
+"""Submits many transactions and follows them all with one scan of each ledger."""
+from __future__ import annotations
+
+from asyncio import (
+    Event,
+    Future,
+    Queue,
+    Semaphore,
+    Task,
+    create_task,
+    get_running_loop,
+    sleep,
+)
+from functools import partial
+from typing import AsyncIterator, Dict, Optional, Set, Tuple, Union, cast
+
+from xrpl.asyncio.clients import Client, XRPLRequestFailureException
+from xrpl.asyncio.ledger import get_latest_validated_ledger_sequence
+from xrpl.asyncio.transaction.main import submit_transaction
+from xrpl.asyncio.transaction.reliable_submission import (
+    XRPLReliableSubmissionException,
+    _check_outcome,
+    _get_prelim_result,
+)
+from xrpl.asyncio.transaction.signed_transaction import SignedTransaction
+from xrpl.constants import XRPLException
+from xrpl.models.requests import Ledger
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions.transaction import Transaction
+
+
+class _Tracked:
+    """A tracked transaction and the future of its outcome."""
+
+    def __init__(
+        self: _Tracked,
+        transaction: Union[Transaction, SignedTransaction],
+        future: Future[Response],
+    ) -> None:
+        self.transaction = transaction
+        self.future = future
+        self.last_ledger_sequence = transaction.last_ledger_sequence or 0
+        # the engine result of the submission, once it is known
+        self.prelim_result = ""
+
+
+class SubmissionTracker:
+    """
+    Submits many signed transactions and follows their outcomes together. Instead of
+    looking up every transaction on its own, as ``send_reliable_submission`` does,
+    the tracker reads each newly validated ledger once, with its transactions, and
+    settles every tracked transaction found in it::
+
+        tracker = SubmissionTracker(client)
+        futures = [tracker.track(payment) for payment in signed_payments]
+        async for payment, outcome in tracker.completed():
+            ...
+
+    A transaction that is not in a validated ledger once its ``LastLedgerSequence``
+    has passed fails with ``XRPLReliableSubmissionException``.
+    """
+
+    def __init__(
+        self: SubmissionTracker,
+        client: Client,
+        *,
+        max_concurrent_submissions: int = 10,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """
+        Initializes a submission tracker.
+
+        Args:
+            client: The network client with which to submit the transactions and read
+                the ledgers.
+            max_concurrent_submissions: How many submissions may be in flight at once.
+                The default is 10.
+            poll_interval: How often, in seconds, to check for a newly validated
+                ledger. The default is 1.
+        """
+        self.client = client
+        self.max_concurrent_submissions = max_concurrent_submissions
+        self.poll_interval = poll_interval
+        self._pending: Dict[str, _Tracked] = {}
+        self._tasks: Set[Task[None]] = set()
+        self._scanner: Optional[Task[None]] = None
+        # set once the current scan knows the first ledger to read
+        self._scan_started: Optional[Event] = None
+        # created on first use, so that they belong to the running event loop
+        self._submissions: Optional[Semaphore] = None
+        self._completed: Optional[Queue[_Tracked]] = None
+
+    @property
+    def pending(self: SubmissionTracker) -> int:
+        """
+        The number of tracked transactions whose outcome is not final yet.
+
+        Returns:
+            The number of pending transactions.
+        """
+        return len(self._pending)
+
+    def track(
+        self: SubmissionTracker, transaction: Union[Transaction, SignedTransaction]
+    ) -> Future[Response]:
+        """
+        Submits a signed transaction and tracks its outcome. Must be called from a
+        coroutine.
+
+        Args:
+            transaction: The signed Transaction, or SignedTransaction. Requires a
+                `last_ledger_sequence` param.
+
+        Returns:
+            A future of the transaction's response from a validated ledger. It fails
+            if the transaction fails, is malformed, or is not validated in time.
+
+        Raises:
+            XRPLReliableSubmissionException: if the transaction is missing a
+                `last_ledger_sequence` param.
+        """
+        if transaction.last_ledger_sequence is None:
+            raise XRPLReliableSubmissionException(
+                "Transaction must have a `last_ledger_sequence` param."
+            )
+        if self._submissions is None or self._completed is None:
+            self._submissions = Semaphore(self.max_concurrent_submissions)
+            self._completed = Queue()
+
+        transaction_hash = transaction.get_hash()
+        future: Future[Response] = get_running_loop().create_future()
+        tracked = _Tracked(transaction, future)
+        self._pending[transaction_hash] = tracked
+        future.add_done_callback(partial(self._on_done, transaction_hash, tracked))
+
+        if self._scanner is None:
+            self._scan_started = Event()
+            self._scanner = create_task(self._scan(self._scan_started))
+        task = create_task(self._submit(tracked, cast(Event, self._scan_started)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return future
+
+    async def completed(
+        self: SubmissionTracker,
+    ) -> AsyncIterator[Tuple[Union[Transaction, SignedTransaction], Future[Response]]]:
+        """
+        Yields each tracked transaction with the future of its outcome, in the order
+        the outcomes become final, until no transaction is pending.
+
+        Yields:
+            The transaction and its settled future.
+        """
+        completed = self._completed
+        if completed is None:
+            return
+        while self._pending or not completed.empty():
+            tracked = await completed.get()
+            yield tracked.transaction, tracked.future
+
+    async def close(self: SubmissionTracker) -> None:
+        """
+        Stops tracking. The outcomes that are not final yet fail with
+        ``XRPLException``.
+        """
+        for task in [*self._tasks, *([self._scanner] if self._scanner else [])]:
+            task.cancel()
+        self._fail_pending(XRPLException("The submission tracker was closed."))
+
+    def _on_done(
+        self: SubmissionTracker,
+        transaction_hash: str,
+        tracked: _Tracked,
+        _future: Future[Response],
+    ) -> None:
+        if self._pending.get(transaction_hash) is tracked:
+            del self._pending[transaction_hash]
+        if self._completed is not None:
+            self._completed.put_nowait(tracked)
+
+    def _fail_pending(self: SubmissionTracker, error: Exception) -> None:
+        for tracked in list(self._pending.values()):
+            if not tracked.future.done():
+                tracked.future.set_exception(error)
+
+    async def _submit(
+        self: SubmissionTracker, tracked: _Tracked, scan_started: Event
+    ) -> None:
+        # a transaction submitted before the scan knows where to start could be
+        # validated in a ledger the scan skips
+        await scan_started.wait()
+        async with cast(Semaphore, self._submissions):
+            if tracked.future.done():
+                return
+            try:
+                tracked.prelim_result = _get_prelim_result(
+                    await submit_transaction(tracked.transaction, self.client)
+                )
+            except Exception as error:
+                if not tracked.future.done():
+                    tracked.future.set_exception(error)
+
+    async def _scan(self: SubmissionTracker, started: Event) -> None:
+        """Reads every validated ledger while transactions are pending."""
+        try:
+            next_ledger = await get_latest_validated_ledger_sequence(self.client) + 1
+            started.set()
+            while self._pending:
+                latest = await get_latest_validated_ledger_sequence(self.client)
+                while next_ledger <= latest and self._pending:
+                    await self._scan_ledger(next_ledger)
+                    next_ledger += 1
+                if self._pending:
+                    await sleep(self.poll_interval)
+        except Exception as error:
+            # without the scan, no pending outcome could become final
+            self._fail_pending(error)
+        finally:
+            started.set()
+            self._scanner = None
+
+    async def _scan_ledger(self: SubmissionTracker, ledger_index: int) -> None:
+        """Settles the tracked transactions validated in, or expired by, a ledger."""
+        response = await self.client.request_impl(
+            Ledger(ledger_index=ledger_index, transactions=True, expand=True)
+        )
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+
+        for transaction in response.result["ledger"].get("transactions", []):
+            tracked = self._pending.get(transaction.get("hash", ""))
+            if tracked is None or tracked.future.done():
+                continue
+            # the same shape as the response of a `tx` request
+            result = {**transaction, "ledger_index": ledger_index, "validated": True}
+            result["meta"] = result.pop("metaData", None)
+            tracked.future.set_result(
+                Response(status=ResponseStatus.SUCCESS, result=result)
+            )
+
+        for transaction_hash, tracked in list(self._pending.items()):
+            if tracked.last_ledger_sequence <= ledger_index:
+                await self._expire(transaction_hash, tracked, ledger_index)
+
+    async def _expire(
+        self: SubmissionTracker,
+        transaction_hash: str,
+        tracked: _Tracked,
+        ledger_index: int,
+    ) -> None:
+        """
+        Settles a transaction whose LastLedgerSequence has passed. It is looked up
+        once more, in case it was validated before the scan started.
+        """
+        try:
+            response = await _check_outcome(
+                transaction_hash,
+                self.client,
+                tracked.prelim_result,
+                tracked.last_ledger_sequence,
+                ledger_index,
+            )
+        except XRPLException as error:
+            failure: XRPLException = error
+            if (
+                isinstance(error, XRPLRequestFailureException)
+                and error.error == "txnNotFound"
+            ):
+                # the server no longer knows the transaction, so it was not validated
+                failure = XRPLReliableSubmissionException(
+                    "The transaction was not validated by its last ledger sequence "
+                    f"{tracked.last_ledger_sequence}. Prelim result: "
+                    f"{tracked.prelim_result}"
+                )
+            if not tracked.future.done():
+                tracked.future.set_exception(failure)
+            return
+        if response is not None and not tracked.future.done():
+            tracked.future.set_result(response)
@@ -0,0 +1,280 @@
+"""Leases an account's Tickets to transactions that are submitted concurrently."""
+from __future__ import annotations
+
+from asyncio import Task, create_task, get_running_loop, shield
+from bisect import insort
+from typing import Any, List, Optional, Set
+
+from typing_extensions import Final
+
+from xrpl.asyncio.clients import Client, XRPLRequestFailureException
+from xrpl.asyncio.transaction.main import (
+    safe_sign_and_autofill_transaction,
+    safe_sign_and_submit_transaction,
+)
+from xrpl.asyncio.transaction.reliable_submission import send_reliable_submission
+from xrpl.constants import XRPLException
+from xrpl.models.requests import AccountObjects
+from xrpl.models.requests.account_objects import AccountObjectType
+from xrpl.models.response import Response
+from xrpl.models.transactions import TicketCreate
+from xrpl.models.transactions.transaction import Transaction
+from xrpl.wallet.main import Wallet
+
+# the most Tickets an account can own at once
+_MAX_TICKETS: Final[int] = 250
+
+# the engine results with which a transaction is rejected without using its Ticket
+_UNUSED_TICKET_PREFIXES: Final = ("tef", "tel", "tem")
+
+# the engine result of a transaction whose Ticket does not exist (any more)
+_NO_TICKET: Final[str] = "tefNO_TICKET"
+
+
+class TicketPool:
+    """
+    Leases an account's `Tickets <https://xrpl.org/tickets.html>`_ to transactions,
+    so that many transactions from the account can be submitted concurrently and in
+    any order, instead of one after another with consecutive sequence numbers::
+
+        pool = TicketPool(wallet)
+        await asyncio.gather(*(pool.submit(payment, client) for payment in payments))
+
+    The account's outstanding Tickets are looked up with ``account_objects`` on the
+    first lease. When fewer than ``refill_below`` Tickets are left, a ``TicketCreate``
+    transaction creates ``refill_count`` more in the background. Callers only wait
+    for it if no Ticket is left.
+
+    A Ticket whose transaction is never submitted, or is rejected without using it,
+    is given back with ``release``. ``submit`` does that itself. Once the account
+    seems to own the 250 Tickets it can, they are looked up again, so that the
+    Tickets that transactions have used since no longer count.
+    """
+
+    def __init__(
+        self: TicketPool,
+        wallet: Wallet,
+        *,
+        refill_below: int = 5,
+        refill_count: int = 20,
+    ) -> None:
+        """
+        Initializes a ticket pool.
+
+        Args:
+            wallet: The wallet of the account, which signs the ``TicketCreate``
+                transactions.
+            refill_below: The number of available Tickets below which more are
+                created. The default is 5.
+            refill_count: How many Tickets each refill creates, up to the 250 an
+                account can own. The default is 20.
+        """
+        self.wallet = wallet
+        self.refill_below = refill_below
+        self.refill_count = refill_count
+        # the Tickets that can be leased, lowest first
+        self._available: List[int] = []
+        # the Tickets that are leased or used, so that a lookup of the account's
+        # Tickets does not hand them out again
+        self._taken: Set[int] = set()
+        self._discovered = False
+        self._refill: Optional[Task[int]] = None
+
+    @property
+    def available(self: TicketPool) -> int:
+        """
+        The number of Tickets that can be leased without waiting.
+
+        Returns:
+            The number of available Tickets.
+        """
+        return len(self._available)
+
+    async def discover(self: TicketPool, client: Client) -> None:
+        """
+        Looks up the Tickets the account owns, going through every page of
+        ``account_objects``. Tickets that are leased are not made available again.
+
+        Args:
+            client: The network client used to look up the Tickets.
+        """
+        tickets = await _fetch_tickets(self.wallet.classic_address, client)
+        # Tickets that are no longer in the ledger cannot be handed out again anyway
+        self._taken &= tickets
+        self._available = sorted(tickets - self._taken)
+        self._discovered = True
+
+    async def lease(self: TicketPool, client: Client) -> int:
+        """
+        Returns a Ticket for a transaction from the account, waiting for more to be
+        created if none is left.
+
+        Args:
+            client: The network client used to look up and create the Tickets.
+
+        Returns:
+            The sequence number of the Ticket.
+
+        Raises:
+            XRPLException: if no Ticket is left and no more could be created.
+        """
+        while not self._available:
+            if await shield(self._start_refill(client)) == 0 and not self._available:
+                raise XRPLException("No Ticket is left and none could be created.")
+        ticket = self._available.pop(0)
+        self._taken.add(ticket)
+        if len(self._available) < self.refill_below:
+            self._start_refill(client)
+        return ticket
+
+    def release(self: TicketPool, ticket: int) -> None:
+        """
+        Gives back a Ticket whose transaction was not submitted, or was rejected
+        without using it, so that it is leased again.
+
+        Args:
+            ticket: The sequence number of the Ticket.
+        """
+        if ticket in self._taken:
+            self._taken.discard(ticket)
+            insort(self._available, ticket)
+
+    def check_result(self: TicketPool, engine_result: str, ticket: int) -> None:
+        """
+        Gives a Ticket back if its transaction was rejected without using it.
+
+        Args:
+            engine_result: The ``engine_result`` of the submission.
+            ticket: The sequence number of the Ticket of the submitted transaction.
+        """
+        if engine_result != _NO_TICKET and engine_result.startswith(
+            _UNUSED_TICKET_PREFIXES
+        ):
+            self.release(ticket)
+
+    async def submit(
+        self: TicketPool,
+        transaction: Transaction,
+        client: Client,
+        check_fee: bool = True,
+    ) -> Response:
+        """
+        Signs and submits a transaction from the account with a leased Ticket in place
+        of its sequence number. The Ticket is given back if the transaction is not
+        submitted, or is rejected without using it.
+
+        Args:
+            transaction: The transaction to submit. Its other missing fields are
+                autofilled.
+            client: The network client with which to submit the transaction.
+            check_fee: Whether to check if the fee is higher than the expected
+                transaction type fee. Defaults to True.
+
+        Returns:
+            The response from the ledger.
+        """
+        ticket = await self.lease(client)
+        response = None
+        try:
+            response = await safe_sign_and_submit_transaction(
+                _with_ticket(transaction, ticket), self.wallet, client, True, check_fee
+            )
+        finally:
+            if response is None:
+                self.release(ticket)
+        self.check_result(response.result.get("engine_result", ""), ticket)
+        return response
+
+    def _start_refill(self: TicketPool, client: Client) -> Task[int]:
+        if self._refill is None:
+            self._refill = create_task(self._fill(client))
+            self._refill.add_done_callback(self._on_refill_done)
+        return self._refill
+
+    def _on_refill_done(self: TicketPool, task: Task[int]) -> None:
+        self._refill = None
+        if task.cancelled() or task.exception() is None:
+            return
+        # a refill started in the background has no caller to raise to
+        get_running_loop().call_exception_handler(
+            {
+                "message": "Creating Tickets failed.",
+                "exception": task.exception(),
+                "task": task,
+            }
+        )
+
+    async def _fill(self: TicketPool, client: Client) -> int:
+        """
+        Makes Tickets available, looking them up on the first call, or when the
+        account seems to own as many as it can, and creating more if too few are
+        left. Returns how many were added.
+        """
+        if not self._discovered:
+            await self.discover(client)
+            if len(self._available) >= self.refill_below:
+                return len(self._available)
+
+        count = self._get_creatable_count()
+        if count <= 0 and self._taken:
+            # the leased Tickets that transactions have used since are no longer
+            # in the ledger
+            await self.discover(client)
+            if len(self._available) >= self.refill_below:
+                return len(self._available)
+            count = self._get_creatable_count()
+        if count <= 0:
+            return 0
+        created = await self._create_tickets(client, count)
+        for ticket in created:
+            insort(self._available, ticket)
+        return len(created)
+
+    def _get_creatable_count(self: TicketPool) -> int:
+        return min(
+            self.refill_count, _MAX_TICKETS - len(self._available) - len(self._taken)
+        )
+
+    async def _create_tickets(
+        self: TicketPool, client: Client, count: int
+    ) -> List[int]:
+        ticket_create = await safe_sign_and_autofill_transaction(
+            TicketCreate(account=self.wallet.classic_address, ticket_count=count),
+            self.wallet,
+            client,
+        )
+        response = await send_reliable_submission(ticket_create, client)
+        result = response.result.get("meta", {}).get("TransactionResult")
+        if result != "tesSUCCESS":
+            raise XRPLException(f"The TicketCreate transaction failed with {result}.")
+        # the Tickets take the sequence numbers right after the TicketCreate's
+        sequence = ticket_create.sequence or 0
+        return list(range(sequence + 1, sequence + 1 + count))
+
+
+async def _fetch_tickets(account: str, client: Client) -> Set[int]:
+    tickets: Set[int] = set()
+    marker: Optional[Any] = None
+    while True:
+        response = await client.request_impl(
+            AccountObjects(
+                account=account,
+                type=AccountObjectType.TICKET,
+                ledger_index="validated",
+                marker=marker,
+            )
+        )
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+        tickets.update(
+            ticket["TicketSequence"] for ticket in response.result["account_objects"]
+        )
+        marker = response.result.get("marker")
+        if marker is None:
+            return tickets
+
+
+def _with_ticket(transaction: Transaction, ticket: int) -> Transaction:
+    return Transaction.from_dict(
+        {**transaction.to_dict(), "sequence": 0, "ticket_sequence": ticket}
+    )
@@ -1,20 +1,27 @@
 """Synchronous network clients for interacting with the XRPL."""
 from xrpl.asyncio.clients.client import Client
 from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.asyncio.clients.reconnect import ConnectionState, ReconnectPolicy
 from xrpl.asyncio.clients.utils import (
     json_to_response,
     request_to_json_rpc,
     request_to_websocket,
     websocket_to_response,
 )
+from xrpl.asyncio.clients.websocket_base import QueueOverflowPolicy
+from xrpl.clients.client_pool import ClientPool
 from xrpl.clients.json_rpc_client import JsonRpcClient
 from xrpl.clients.websocket_client import WebsocketClient
 
 __all__ = [
     "Client",
+    "ClientPool",
+    "ConnectionState",
     "JsonRpcClient",
     "request_to_json_rpc",
     "json_to_response",
+    "QueueOverflowPolicy",
+    "ReconnectPolicy",
     "request_to_websocket",
     "XRPLRequestFailureException",
     "websocket_to_response",
@@ -0,0 +1,74 @@
+"""A sync client that spreads requests over several rippled nodes."""
+from __future__ import annotations
+
+import asyncio
+from threading import Thread
+from typing import List
+
+from xrpl.asyncio.clients.client import Client
+from xrpl.asyncio.clients.client_pool_base import ClientPoolBase
+from xrpl.asyncio.clients.json_rpc_base import JsonRpcBase
+from xrpl.clients.sync_client import SyncClient
+from xrpl.constants import XRPLException
+
+
+class ClientPool(SyncClient, ClientPoolBase):
+    """
+    A sync client that spreads requests over several rippled nodes. It routes
+    each request to the fastest node that is synced and up to date, and fails over
+    to the next one if that node cannot answer::
+
+        pool = ClientPool([JsonRpcClient(url_1), JsonRpcClient(url_2)])
+        print(get_fee(pool))
+
+    The nodes must be JSON-RPC clients. A sync websocket client blocks while it
+    waits for a response, so the pool could neither time out its health checks
+    nor fan out submissions to it. Use an ``AsyncClientPool`` for websocket nodes.
+    """
+
+    def __init__(
+        self: ClientPool,
+        clients: List[Client],
+        *,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        max_ledger_lag: int = 2,
+        latency_smoothing: float = 0.3,
+        submit_fan_out: int = 1,
+    ) -> None:
+        """
+        Initializes a client pool.
+
+        Arguments:
+            clients: The JSON-RPC clients connected to the nodes of the pool.
+            health_check_interval: How often, in seconds, the pool checks the
+                ``server_info`` of every node. The first request waits for the first
+                check. Later checks run in a background thread, while requests are
+                routed on the last known state. The default is 30.
+            health_check_timeout: How long, in seconds, a node has to answer a
+                health check. The default is 5.
+            max_ledger_lag: How many validated ledgers a node may lag behind the
+                most up-to-date node before it is skipped. The default is 2.
+            latency_smoothing: The weight of the newest sample in the moving
+                average of each node's latency, between 0 and 1. The default is 0.3.
+            submit_fan_out: The number of nodes each transaction submission is sent
+                to. The default is 1.
+
+        Raises:
+            XRPLException: If a client is not a JSON-RPC client.
+        """
+        if not all(isinstance(client, JsonRpcBase) for client in clients):
+            raise XRPLException("The nodes of a ClientPool must be JSON-RPC clients.")
+        super().__init__(
+            clients,
+            health_check_interval=health_check_interval,
+            health_check_timeout=health_check_timeout,
+            max_ledger_lag=max_ledger_lag,
+            latency_smoothing=latency_smoothing,
+            submit_fan_out=submit_fan_out,
+        )
+
+    def _start_health_check(self: ClientPool) -> None:
+        # each sync request runs its own event loop, which would cancel a task
+        # still running when the request returns
+        Thread(target=asyncio.run, args=(self.check_health(),), daemon=True).start()
@@ -8,9 +8,16 @@ from types import TracebackType
 from typing import Any, Dict, Iterator, Optional, Type, Union, cast
 
 from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
-from xrpl.asyncio.clients.websocket_base import WebsocketBase
+from xrpl.asyncio.clients.reconnect import ReconnectPolicy
+from xrpl.asyncio.clients.websocket_base import (
+    _STREAM_QUEUE_TYPE,
+    QueueOverflowPolicy,
+    StreamBook,
+    WebsocketBase,
+)
 from xrpl.clients.sync_client import SyncClient
 from xrpl.models.requests.request import Request
+from xrpl.models.requests.subscribe import StreamParameter
 from xrpl.models.response import Response
 
 
@@ -65,7 +72,14 @@ class WebsocketClient(SyncClient, WebsocketBase):
     """
 
     def __init__(
-        self: WebsocketClient, url: str, timeout: Optional[Union[int, float]] = None
+        self: WebsocketClient,
+        url: str,
+        timeout: Optional[Union[int, float]] = None,
+        *,
+        max_queue_size: int = 0,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        queue_request_responses: bool = True,
+        reconnect: Optional[ReconnectPolicy] = None,
     ) -> None:
         """
         Constructs a WebsocketClient.
@@ -75,11 +89,27 @@ class WebsocketClient(SyncClient, WebsocketBase):
             timeout: Maximum seconds to wait for a new message when
                 iterating. A value of 0 or None will result in no limit.
                 If this limit is met, iteration will stop.
+            max_queue_size: The maximum number of messages held in the message
+                queue. A value of 0 (the default) means the queue is unbounded.
+            overflow_policy: What to do with an incoming message when the message
+                queue is full. The default is to stop reading from the socket until
+                there is room in the queue.
+            queue_request_responses: Whether responses to ``request`` calls are
+                also put on the message queue after being returned to the caller.
+                Responses to ``send`` calls are always queued. The default is True.
+            reconnect: If provided, how to reconnect when the connection drops.
+                By default, the client does not reconnect.
         """
         self.timeout = timeout
         self._loop: Optional[AbstractEventLoop] = None
         self._thread: Optional[Thread] = None
-        super().__init__(url)
+        super().__init__(
+            url,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+            queue_request_responses=queue_request_responses,
+            reconnect=reconnect,
+        )
 
     def is_open(self: WebsocketClient) -> bool:
         """
@@ -177,6 +207,49 @@ class WebsocketClient(SyncClient, WebsocketBase):
                 # stop listening but don't need to cancel it
                 break
 
+    def stream(
+        self: WebsocketClient,
+        stream: Union[StreamParameter, str],
+        *,
+        account: Optional[str] = None,
+        book: Optional[StreamBook] = None,
+        max_queue_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate on received messages of one stream. Each call gets its own queue,
+        registered as soon as ``stream`` is called, so several consumers can read
+        the same stream independently, and no message received after the call is
+        missed. Messages routed to at least one stream iterator or callback are not
+        put on the generic message queue. Like iterating on the client, this stops
+        if no message is received within `self.timeout` seconds; call ``close`` on
+        the iterator to stop reading earlier.
+
+        Arguments:
+            stream: The stream, or the ``type`` of the messages, to read. Both
+                ``TRANSACTIONS`` and ``TRANSACTIONS_PROPOSED`` deliver messages of
+                type ``transaction``.
+            account: Only yield transaction messages that affect this account, as
+                for an ``accounts`` subscription.
+            book: Only yield transaction messages that affect this order book, as
+                for a ``books`` subscription.
+            max_queue_size: The maximum number of messages buffered for this
+                iterator. Defaults to the client's ``max_queue_size``, which is
+                unbounded unless set. The client's overflow policy applies.
+
+        Returns:
+            An iterator on the received messages of the stream.
+
+        Raises:
+            XRPLWebsocketException: if this client is not open.
+        """
+        if not self.is_open():
+            raise XRPLWebsocketException("Websocket is not open")
+        queue = run_coroutine_threadsafe(
+            self._open_stream_queue(stream, account, book, max_queue_size),
+            cast(AbstractEventLoop, self._loop),
+        ).result()
+        return _StreamIterator(self, stream, queue, account, book)
+
     def send(self: WebsocketClient, request: Request) -> None:
         """
         Submit the request represented by the request to the
@@ -232,3 +305,72 @@ class WebsocketClient(SyncClient, WebsocketBase):
             self._do_request_impl(request),
             cast(AbstractEventLoop, self._loop),
         ).result()
+
+
+class _StreamIterator:
+    """
+    Iterates on the queue of a stream, which is unregistered when the iteration
+    ends or the iterator is closed.
+    """
+
+    def __init__(
+        self: _StreamIterator,
+        client: WebsocketClient,
+        stream: Union[StreamParameter, str],
+        queue: _STREAM_QUEUE_TYPE,
+        account: Optional[str],
+        book: Optional[StreamBook],
+    ) -> None:
+        self._client = client
+        self._loop = cast(AbstractEventLoop, client._loop)
+        self._stream = stream
+        self._queue = queue
+        self._account = account
+        self._book = book
+        self._closed = False
+
+    def __iter__(self: _StreamIterator) -> _StreamIterator:
+        return self
+
+    def __next__(self: _StreamIterator) -> Dict[str, Any]:
+        message = None
+        if not self._closed and self._client.is_open():
+            future = run_coroutine_threadsafe(
+                self._client._do_pop_stream_message(self._queue), self._loop
+            )
+            try:
+                message = future.result(self._client.timeout)
+            except TimeoutError:
+                future.cancel()
+            except CancelledError:
+                pass
+            except BaseException:
+                self.close()
+                raise
+        if message is None:
+            self.close()
+            raise StopIteration
+        return message
+
+    def close(self: _StreamIterator) -> None:
+        """Stops reading the stream, and unregisters its queue."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._client.is_open():
+            # the queues belong to the client's event loop
+            self._loop.call_soon_threadsafe(
+                self._client._close_stream_queue,
+                self._stream,
+                self._queue,
+                self._account,
+                self._book,
+            )
+        else:
+            self._client._close_stream_queue(
+                self._stream, self._queue, self._account, self._book
+            )
+
+    def __del__(self: _StreamIterator) -> None:
+        # like an abandoned generator, an abandoned iterator stops reading
+        self.close()
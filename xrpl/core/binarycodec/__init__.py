@@ -7,6 +7,7 @@ from xrpl.core.binarycodec.main import (
     decode,
     encode,
     encode_for_multisigning,
+    encode_for_multisigning_prefix,
     encode_for_signing,
     encode_for_signing_claim,
 )
@@ -15,6 +16,7 @@ __all__ = [
     "decode",
     "encode",
     "encode_for_multisigning",
+    "encode_for_multisigning_prefix",
     "encode_for_signing",
     "encode_for_signing_claim",
     "XRPLBinaryCodecException",
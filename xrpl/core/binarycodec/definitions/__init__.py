@@ -3,6 +3,7 @@ from xrpl.core.binarycodec.definitions.definitions import (
     get_field_header_from_name,
     get_field_instance,
     get_field_name_from_header,
+    get_field_names,
     get_ledger_entry_type_code,
     get_ledger_entry_type_name,
     get_transaction_result_code,
@@ -23,6 +24,7 @@ __all__ = [
     "get_field_header_from_name",
     "get_field_name_from_header",
     "get_field_instance",
+    "get_field_names",
     "get_ledger_entry_type_code",
     "get_ledger_entry_type_name",
     "get_transaction_result_code",
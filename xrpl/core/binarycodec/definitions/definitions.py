@@ -2,7 +2,7 @@
 
 import json
 import os
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, cast
 
 from xrpl.core.binarycodec.definitions.field_header import FieldHeader
 from xrpl.core.binarycodec.definitions.field_info import FieldInfo
@@ -181,6 +181,16 @@ def get_field_instance(field_name: str) -> FieldInstance:
     )
 
 
+def get_field_names() -> List[str]:
+    """
+    Return the names of all the fields in the definitions.
+
+    Returns:
+        The names of all the fields, such as ``Account`` and ``TransactionType``.
+    """
+    return list(_FIELD_INFO_MAP)
+
+
 def get_transaction_type_code(transaction_type: str) -> int:
     """
     Return an integer representing the given transaction type string in an enum.
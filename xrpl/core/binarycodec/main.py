@@ -96,6 +96,25 @@ def encode_for_multisigning(json: Dict[str, Any], signing_account: str) -> str:
     )
 
 
+def encode_for_multisigning_prefix(json: Dict[str, Any]) -> str:
+    """
+    Encode the part of a transaction's multi-signing payload that every signer
+    shares. A signer's payload is this prefix followed by the signer's AccountID,
+    so that a transaction signed by many signers only needs to be encoded once.
+
+    Args:
+        json: A JSON-like dictionary representation of a transaction.
+
+    Returns:
+        A hex string of the encoded transaction, without a signing account.
+    """
+    return _serialize_json(
+        json,
+        prefix=_TRANSACTION_MULTISIG_PREFIX,
+        signing_only=True,
+    )
+
+
 def decode(buffer: str) -> Dict[str, Any]:
     """
     Decode a transaction from binary format to a JSON-like dictionary
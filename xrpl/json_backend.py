@@ -0,0 +1,165 @@
+"""
+Pluggable JSON encoding and decoding for the network clients and models.
+
+By default the fastest installed library out of `orjson`, `msgspec` and `ujson`
+is used, falling back to the standard library ``json`` module. Anything the
+selected library refuses to encode or decode is retried with the standard library.
+
+Some libraries decode integers wider than 64 bits as floats, losing precision.
+Documents containing a number with 20 or more digits are therefore always decoded
+with the standard library.
+"""
+import json
+import re
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from typing_extensions import Final
+
+from xrpl.constants import XRPLException
+
+_Loads = Callable[[Union[str, bytes]], Any]
+_Dumps = Callable[[Any], str]
+
+_STDLIB: Final[str] = "json"
+_PREFERENCE_ORDER: Final[List[str]] = ["orjson", "msgspec", "ujson"]
+
+# the exceptions after which the standard library is tried instead
+_FALLBACK_ERRORS: Final[Tuple[Type[Exception], ...]] = (
+    ValueError,
+    TypeError,
+    OverflowError,
+)
+
+# a number that may not fit in 64 bits. Digits inside strings match too, which
+# only costs a slower decode.
+_WIDE_INTEGER: Final = re.compile(r"[\[:,]\s*-?\d{20}")
+_WIDE_INTEGER_BYTES: Final = re.compile(rb"[\[:,]\s*-?\d{20}")
+
+
+def _load_orjson() -> Tuple[_Loads, _Dumps]:
+    orjson = import_module("orjson")
+    return orjson.loads, lambda value: orjson.dumps(value).decode("utf-8")
+
+
+def _load_msgspec() -> Tuple[_Loads, _Dumps]:
+    msgspec_json = import_module("msgspec.json")
+    decode_error = import_module("msgspec").DecodeError
+
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return msgspec_json.decode(data)
+        except decode_error as e:
+            raise ValueError(str(e)) from e
+
+    return loads, lambda value: msgspec_json.encode(value).decode("utf-8")
+
+
+def _load_ujson() -> Tuple[_Loads, _Dumps]:
+    ujson = import_module("ujson")
+    return ujson.loads, ujson.dumps
+
+
+_LOADERS: Final[Dict[str, Callable[[], Tuple[_Loads, _Dumps]]]] = {
+    "orjson": _load_orjson,
+    "msgspec": _load_msgspec,
+    "ujson": _load_ujson,
+}
+
+_backend_name = _STDLIB
+_backend_loads: Optional[_Loads] = None
+_backend_dumps: Optional[_Dumps] = None
+
+
+def set_json_backend(name: Optional[str] = None) -> None:
+    """
+    Selects the library used to encode and decode JSON.
+
+    Args:
+        name: One of "orjson", "msgspec", "ujson" or "json" (the standard
+            library). If None, the fastest installed library is selected.
+
+    Raises:
+        XRPLException: if the library is unknown or not installed.
+    """
+    global _backend_name, _backend_loads, _backend_dumps
+
+    if name is None:
+        for candidate in _PREFERENCE_ORDER:
+            try:
+                set_json_backend(candidate)
+                return
+            except XRPLException:
+                pass
+        name = _STDLIB
+
+    if name == _STDLIB:
+        _backend_name, _backend_loads, _backend_dumps = _STDLIB, None, None
+        return
+
+    if name not in _LOADERS:
+        raise XRPLException(
+            f"{name} is not a supported JSON library. Supported libraries are "
+            f"{', '.join([*_PREFERENCE_ORDER, _STDLIB])}."
+        )
+    try:
+        _backend_loads, _backend_dumps = _LOADERS[name]()
+    except ImportError:
+        raise XRPLException(f"JSON library {name} is not installed.")
+    _backend_name = name
+
+
+def get_json_backend() -> str:
+    """
+    Returns the name of the library used to encode and decode JSON.
+
+    Returns:
+        The name of the selected JSON library.
+    """
+    return _backend_name
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decodes a JSON document. Bytes are passed to the selected library as-is,
+    without first being decoded to a string.
+
+    Args:
+        data: The JSON document, as a string or UTF-8 bytes.
+
+    Returns:
+        The decoded value.
+    """
+    if _backend_loads is not None and not _has_wide_integer(data):
+        try:
+            return _backend_loads(data)
+        except _FALLBACK_ERRORS:
+            pass
+    return json.loads(data)
+
+
+def _has_wide_integer(data: Union[str, bytes]) -> bool:
+    if isinstance(data, bytes):
+        return _WIDE_INTEGER_BYTES.search(data) is not None
+    return _WIDE_INTEGER.search(data) is not None
+
+
+def dumps(value: Any) -> str:
+    """
+    Encodes a value as a JSON document.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The JSON document.
+    """
+    if _backend_dumps is not None:
+        try:
+            return _backend_dumps(value)
+        except _FALLBACK_ERRORS:
+            pass
+    return json.dumps(value)
+
+
+set_json_backend()
@@ -2,6 +2,7 @@
 from xrpl.models import amounts, currencies, requests, transactions
 from xrpl.models.amounts import *  # noqa: F401, F403
 from xrpl.models.auth_account import AuthAccount
+from xrpl.models.base_model import set_trusted_construction, trusted_construction
 from xrpl.models.currencies import *  # noqa: F401, F403
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.path import Path, PathStep
@@ -25,4 +26,6 @@ __all__ = [
     "Path",
     "PathStep",
     "Response",
+    "set_trusted_construction",
+    "trusted_construction",
 ]
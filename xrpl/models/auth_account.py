@@ -46,19 +46,25 @@ class AuthAccount(BaseModel):
         )
 
     @classmethod
-    def from_dict(cls: Type[AuthAccount], value: Dict[str, Any]) -> AuthAccount:
+    def from_dict(
+        cls: Type[AuthAccount], value: Dict[str, Any], *, validate: bool = True
+    ) -> AuthAccount:
         """
         Construct a new AuthAccount from a dictionary of parameters.
 
         Args:
             value: The value to construct the AuthAccount from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new AuthAccount object, constructed using the given parameters.
         """
         if len(value) == 1 and "auth_account" in value:
-            return super(AuthAccount, cls).from_dict(value["auth_account"])
-        return super(AuthAccount, cls).from_dict(value)
+            return super(AuthAccount, cls).from_dict(
+                value["auth_account"], validate=validate
+            )
+        return super(AuthAccount, cls).from_dict(value, validate=validate)
 
     def to_dict(self: AuthAccount) -> Dict[str, Any]:
         """
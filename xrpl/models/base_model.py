@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
-import json
 import re
 from abc import ABC
-from dataclasses import fields
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Dict, List, Pattern, Type, TypeVar, Union, cast, get_type_hints
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_type_hints,
+)
 
 from typing_extensions import Final, get_args, get_origin
 
+from xrpl import json_backend
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.required import REQUIRED
 from xrpl.models.types import XRPL_VALUE_TYPE
+from xrpl.models.utils import _DEFINED_METHODS, _GENERATED_METHODS, _HASH_SLOT
 
 # this regex splits words based on one of three cases:
 #
@@ -45,6 +63,59 @@ ABBREVIATIONS: Final[Dict[str, str]] = {
 
 BM = TypeVar("BM", bound="BaseModel")  # any type inherited from BaseModel
 
+# whether models validate themselves when they are constructed
+_VALIDATION_ENABLED: Final[ContextVar[bool]] = ContextVar(
+    "_VALIDATION_ENABLED", default=True
+)
+# set by `set_trusted_construction`, for every thread and task
+_trusted_globally = False
+
+
+@contextmanager
+def trusted_construction() -> Iterator[None]:
+    """
+    Models constructed within this context manager are not validated. Use it for
+    data that is already known to be valid, such as transactions read from a
+    validated ledger, and call ``validate()`` explicitly where needed::
+
+        with trusted_construction():
+            transactions = [Transaction.from_xrpl(tx) for tx in ledger_transactions]
+
+    Yields:
+        Nothing.
+    """
+    token = _VALIDATION_ENABLED.set(False)
+    try:
+        yield
+    finally:
+        _VALIDATION_ENABLED.reset(token)
+
+
+def set_trusted_construction(trusted: bool) -> None:
+    """
+    Turns the validation of models on construction off, or back on, for the whole
+    process. See `trusted_construction`.
+
+    Args:
+        trusted: Whether models are constructed without being validated.
+    """
+    global _trusted_globally
+    _trusted_globally = trusted
+
+
+def _is_validation_enabled() -> bool:
+    return not _trusted_globally and _VALIDATION_ENABLED.get()
+
+
+@contextmanager
+def _validation(validate: bool) -> Iterator[None]:
+    """Skips the validation within the context if `validate` is False."""
+    if validate:
+        yield
+    else:
+        with trusted_construction():
+            yield
+
 
 def _key_to_json(field: str) -> str:
     """
@@ -52,7 +123,28 @@ def _key_to_json(field: str) -> str:
         1. 'TransactionType' becomes 'transaction_type'
         2. 'value' remains 'value'
         3. 'URI' becomes 'uri'
+
+    The fields of the definitions are looked up in a table, and other keys in a
+    bounded cache.
     """
+    if not _SNAKE_CASE_KEYS:
+        _load_snake_case_keys()
+    snake_case_key = _SNAKE_CASE_KEYS.get(field)
+    if snake_case_key is None:
+        return _cached_key_to_json(field)
+    return snake_case_key
+
+
+def _load_snake_case_keys() -> None:
+    # imported here, as the binary codec imports the models
+    from xrpl.core.binarycodec.definitions import get_field_names
+
+    _SNAKE_CASE_KEYS.update(
+        {field: _convert_key_to_json(field) for field in get_field_names()}
+    )
+
+
+def _convert_key_to_json(field: str) -> str:
     # convert all special CamelCase substrings to capitalized strings
     for spec_str in ABBREVIATIONS.values():
         if spec_str in field:
@@ -63,6 +155,11 @@ def _key_to_json(field: str) -> str:
     )
 
 
+# the snake_case keys of the fields of the definitions, loaded on first use
+_SNAKE_CASE_KEYS: Dict[str, str] = {}
+_cached_key_to_json: Final = lru_cache(maxsize=1024)(_convert_key_to_json)
+
+
 def _value_to_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     if isinstance(value, dict):
         return {_key_to_json(k): _value_to_json(v) for (k, v) in value.items()}
@@ -71,9 +168,169 @@ def _value_to_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     return value
 
 
+_Converter = Callable[[str, Any], Any]
+
+
+def _get_slots(cls: type) -> List[Tuple[str, Any]]:
+    """Returns the name and the descriptor of each slot of a class and its bases."""
+    return [
+        (name, base.__dict__[name])
+        for base in cls.__mro__
+        for name in base.__dict__.get("__slots__", ())
+        # a cached hash is not valid in another process
+        if name not in ("__dict__", "__weakref__", _HASH_SLOT)
+    ]
+
+
+@dataclass(frozen=True)
+class _FieldPlan:
+    """How `from_dict` converts the value of one field of a model."""
+
+    type: Any
+    convert: _Converter
+    required: bool
+    init: bool
+
+
+# the deserialization plan of each model class, built on its first `from_dict`
+_PLANS: Dict[type, Dict[str, _FieldPlan]] = {}
+# the converter of each type hint
+_CONVERTERS: Dict[Any, _Converter] = {}
+
+
+def _get_plan(cls: type) -> Dict[str, _FieldPlan]:
+    plan = _PLANS.get(cls)
+    if plan is None:
+        dataclass_fields = {field.name: field for field in fields(cls)}
+        plan = {}
+        for name, param_type in get_type_hints(cls).items():
+            field = dataclass_fields.get(name)
+            plan[name] = _FieldPlan(
+                type=param_type,
+                convert=_get_converter(param_type),
+                required=field is not None and field.default is REQUIRED,
+                init=field is not None and field.init,
+            )
+        _PLANS[cls] = plan
+    return plan
+
+
+def _get_converter(param_type: Any) -> _Converter:
+    converter = _CONVERTERS.get(param_type)
+    if converter is None:
+        converter = _compile_converter(param_type)
+        _CONVERTERS[param_type] = converter
+    return converter
+
+
+def _compile_converter(param_type: Any) -> _Converter:
+    """
+    Builds the function that converts a value of a `from_dict` dictionary to the
+    given type hint, raising XRPLModelException if the value does not match it.
+    """
+    # returns `list` if a List, `Union` if a Union, None otherwise
+    param_type_origin = get_origin(param_type)
+
+    if param_type_origin is list:
+        convert_item = _get_converter(get_args(param_type)[0])
+
+        def convert_list(param: str, param_value: Any) -> Any:
+            if not isinstance(param_value, list):
+                raise _type_error(param, param_type, param_value)
+            return [convert_item(param, item) for item in param_value]
+
+        return convert_list
+
+    if param_type_origin is Union:
+        options = get_args(param_type)
+        convert_options = [_get_converter(option) for option in options]
+        # no option before `None` can accept a None value
+        accepts_none = type(None) in options
+
+        def convert_union(param: str, param_value: Any) -> Any:
+            if param_value is None and accepts_none:
+                return None
+            for convert_option in convert_options:
+                # try to use this Union-ed type to process param_value
+                try:
+                    return convert_option(param, param_value)
+                except XRPLModelException:
+                    # this Union-ed type did not work, move onto the next one
+                    pass
+            raise _type_error(param, param_type, param_value)
+
+        return convert_union
+
+    # no more collections (no params expect a Dict)
+
+    if param_type is Any:
+        # param_type is Any (e.g. will accept anything)
+        return lambda param, param_value: param_value
+
+    if isinstance(param_type, type) and issubclass(param_type, Enum):
+        members = tuple(param_type)
+
+        def convert_enum(param: str, param_value: Any) -> Any:
+            # a valid value for the Enum is kept as is, as the Enum member may not
+            # be required for string enums
+            if isinstance(param_value, param_type) or param_value in members:
+                return param_value
+            raise _type_error(param, param_type, param_value)
+
+        return convert_enum
+
+    if isinstance(param_type, type) and issubclass(param_type, BaseModel):
+
+        def convert_model(param: str, param_value: Any) -> Any:
+            if isinstance(param_value, param_type):
+                return param_value
+            if isinstance(param_value, dict):
+                # expected an XRPL Model, received a Dict
+                return param_type.from_dict(param_value)
+            raise XRPLModelException(
+                f"{param} expected a {param_type} or a Dict representing "
+                f"{param_type}, received a {type(param_value)}"
+            )
+
+        return convert_model
+
+    def convert_value(param: str, param_value: Any) -> Any:
+        if isinstance(param_type, type) and isinstance(param_value, param_type):
+            return param_value
+        raise _type_error(param, param_type, param_value)
+
+    return convert_value
+
+
+def _type_error(param: str, param_type: Any, param_value: Any) -> XRPLModelException:
+    return XRPLModelException(
+        f"{param} expected a {param_type}, received a {type(param_value)}"
+    )
+
+
 class BaseModel(ABC):
     """The base class for all model types."""
 
+    # the fields of each model are slotted by `require_kwargs_on_init`
+    __slots__ = ()
+
+    def __init_subclass__(cls: Type[BaseModel], **kwargs: Any) -> None:
+        """
+        Records which of the methods that `dataclass` generates the class defines
+        itself, so that `require_kwargs_on_init` only replaces the generated ones.
+
+        Args:
+            kwargs: The keyword arguments of the class definition.
+        """
+        super().__init_subclass__(**kwargs)
+        # the slotted copy of a model keeps the record of the original class
+        if _DEFINED_METHODS not in cls.__dict__:
+            setattr(
+                cls,
+                _DEFINED_METHODS,
+                frozenset(name for name in _GENERATED_METHODS if name in cls.__dict__),
+            )
+
     @classmethod
     def is_dict_of_model(cls: Type[BM], dictionary: Any) -> bool:
         """
@@ -91,25 +348,21 @@ class BaseModel(ABC):
             True if dictionary is a ``dict`` representation of an instance of this
             class; False if not.
         """
-        return (
-            isinstance(dictionary, dict)
-            and set(get_type_hints(cls).keys()).issuperset(set(dictionary.keys()))
-            and all(
-                [
-                    attr in dictionary
-                    for attr, value in get_type_hints(cls).items()
-                    if value is REQUIRED
-                ]
-            )
+        return isinstance(dictionary, dict) and _get_plan(cls).keys() >= set(
+            dictionary.keys()
         )
 
     @classmethod
-    def from_dict(cls: Type[BM], value: Dict[str, XRPL_VALUE_TYPE]) -> BM:
+    def from_dict(
+        cls: Type[BM], value: Dict[str, XRPL_VALUE_TYPE], *, validate: bool = True
+    ) -> BM:
         """
         Construct a new BaseModel from a dictionary of parameters.
 
         Args:
             value: The value to construct the BaseModel from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new BaseModel object, constructed using the given parameters.
@@ -117,22 +370,22 @@ class BaseModel(ABC):
         Raises:
             XRPLModelException: If the dictionary provided is invalid.
         """
-        # returns a dictionary mapping class params to their types
-        class_types = get_type_hints(cls)
-
-        args = {}
-        for param in value:
-            if param not in class_types:
-                raise XRPLModelException(
-                    f"{param} not a valid parameter for {cls.__name__}"
-                )
-
-            args[param] = cls._from_dict_single_param(
-                param, class_types[param], value[param]
-            )
+        plan = _get_plan(cls)
+
+        with _validation(validate):
+            init = {}
+            for param, param_value in value.items():
+                field_plan = plan.get(param)
+                if field_plan is None:
+                    raise XRPLModelException(
+                        f"{param} not a valid parameter for {cls.__name__}"
+                    )
+
+                converted = field_plan.convert(param, param_value)
+                if field_plan.init:
+                    init[param] = converted
 
-        init = cls._get_only_init_args(args)
-        return cls(**init)
+            return cls(**init)
 
     @classmethod
     def _from_dict_single_param(
@@ -142,100 +395,83 @@ class BaseModel(ABC):
         param_value: Union[int, str, bool, BaseModel, Enum, List[Any], Dict[str, Any]],
     ) -> Any:
         """Recursively handles each individual param in `from_dict`."""
-        param_type_origin = get_origin(param_type)
-        # returns `list` if a List, `Union` if a Union, None otherwise
-
-        if param_type_origin is list and isinstance(param_value, list):
-            # expected a List, received a List
-            list_type = get_args(param_type)[0]
-            return [
-                cls._from_dict_single_param(param, list_type, item)
-                for item in param_value
-            ]
-
-        if param_type_origin is Union:
-            for param_type_option in get_args(param_type):
-                # iterate through the types Union-ed together
-                try:
-                    # try to use this Union-ed type to process param_value
-                    return cls._from_dict_single_param(
-                        param, param_type_option, param_value
-                    )
-                except XRPLModelException:
-                    # this Union-ed type did not work, move onto the next one
-                    pass
-
-        # no more collections (no params expect a Dict)
-
-        if param_type is Any:
-            # param_type is Any (e.g. will accept anything)
-            return param_value
-
-        if isinstance(param_type, type) and isinstance(param_value, param_type):
-            # expected an object, received the correct object
-            return param_value
-
-        if (
-            isinstance(param_type, type)
-            and issubclass(param_type, Enum)
-            and param_value in list(param_type)
-        ):
-            # expected an Enum and received a valid value for it.
-            # for some reason required for string enums.
-            return param_value
-
-        if (
-            isinstance(param_type, type)
-            and issubclass(param_type, BaseModel)
-            and isinstance(param_value, dict)
-        ):
-            # expected an XRPL Model, received a Dict
-            return cast(BaseModel, param_type).from_dict(param_value)
-
-        # received something we didn't expect, raise an error
-        if isinstance(param_type, type) and issubclass(param_type, BaseModel):
-            error_message = (
-                f"{param} expected a {param_type} or a Dict representing {param_type}, "
-                f"received a {type(param_value)}"
-            )
-        else:
-            error_message = (
-                f"{param} expected a {param_type}, received a {type(param_value)}"
-            )
-        raise XRPLModelException(error_message)
+        return _get_converter(param_type)(param, param_value)
 
     @classmethod
     def _get_only_init_args(cls: Type[BM], args: Dict[str, Any]) -> Dict[str, Any]:
-        init_keys = {field.name for field in fields(cls) if field.init is True}
-        valid_args = {key: value for key, value in args.items() if key in init_keys}
-        return valid_args
+        plan = _get_plan(cls)
+        return {
+            key: value for key, value in args.items() if key in plan and plan[key].init
+        }
 
     @classmethod
-    def from_xrpl(cls: Type[BM], value: Union[str, Dict[str, Any]]) -> BM:
+    def from_xrpl(
+        cls: Type[BM],
+        value: Union[str, bytes, Dict[str, Any]],
+        *,
+        validate: bool = True,
+    ) -> BM:
         """
         Creates a BaseModel object based on a JSON-like dictionary of keys in the JSON
-        format used by the binary codec, or an actual JSON string representing the same
-        data.
+        format used by the binary codec, or an actual JSON string (or UTF-8 bytes)
+        representing the same data.
 
         Args:
             value: The dictionary or JSON string to be instantiated.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A BaseModel object instantiated from the input.
         """
-        if isinstance(value, str):
-            value = json.loads(value)
+        if isinstance(value, (str, bytes)):
+            value = json_backend.loads(value)
 
         formatted_dict = {
             _key_to_json(k): _value_to_json(v)
             for (k, v) in cast(Dict[str, XRPL_VALUE_TYPE], value).items()
         }
 
-        return cls.from_dict(formatted_dict)
+        return cls.from_dict(formatted_dict, validate=validate)
+
+    def __getstate__(
+        self: BaseModel,
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Returns the state of a model for pickling and copying, read from its slots
+        since a frozen model cannot be restored through `setattr`.
+
+        Returns:
+            The model's `__dict__`, if it has one, and the values of its slots.
+        """
+        slot_state = {}
+        for name, slot in _get_slots(type(self)):
+            try:
+                slot_state[name] = slot.__get__(self)
+            except AttributeError:  # an unset slot
+                pass
+        return getattr(self, "__dict__", None), slot_state
+
+    def __setstate__(
+        self: BaseModel, state: Tuple[Optional[Dict[str, Any]], Dict[str, Any]]
+    ) -> None:
+        """
+        Restores the state returned by `__getstate__`.
+
+        Args:
+            state: The model's `__dict__`, if it has one, and the values of its slots.
+        """
+        dict_state, slot_state = state
+        if dict_state:
+            self.__dict__.update(dict_state)
+        slots = dict(_get_slots(type(self)))
+        for name, value in slot_state.items():
+            slots[name].__set__(self, value)
 
     def __post_init__(self: BaseModel) -> None:
         """Called by dataclasses immediately after __init__."""
-        self.validate()
+        if _is_validation_enabled():
+            self.validate()
 
     def validate(self: BaseModel) -> None:
         """
@@ -264,10 +500,12 @@ class BaseModel(ABC):
         Returns:
             Dictionary of any errors found on self.
         """
+        # mypy doesn't realize that BaseModel has a field called __dataclass_fields__
+        dataclass_fields = self.__dataclass_fields__.keys()  # type: ignore
         return {
             attr: f"{attr} is not set"
-            for attr, value in self.__dict__.items()
-            if value is REQUIRED
+            for attr in dataclass_fields
+            if getattr(self, attr) is REQUIRED
         }
 
     def to_dict(self: BaseModel) -> Dict[str, Any]:
@@ -301,8 +539,18 @@ class BaseModel(ABC):
         return elem
 
     def __eq__(self: BaseModel, other: object) -> bool:
-        """Compares a BaseModel to another object to determine if they are equal."""
-        return isinstance(other, BaseModel) and self.to_dict() == other.to_dict()
+        """
+        Compares a BaseModel to another object to determine if they are equal.
+        Models are compared field by field, and only to models of the same class.
+        `require_kwargs_on_init` generates a faster version for each model.
+        """
+        if other.__class__ is not self.__class__:
+            return False
+        # mypy doesn't realize that BaseModel has a field called __dataclass_fields__
+        dataclass_fields = self.__dataclass_fields__.keys()  # type: ignore
+        return all(
+            getattr(self, key) == getattr(other, key) for key in dataclass_fields
+        )
 
     def __repr__(self: BaseModel) -> str:
         """Returns a string representation of a BaseModel object"""
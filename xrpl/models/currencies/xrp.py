@@ -13,7 +13,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Type, Union
 
-from xrpl.models.base_model import BaseModel
+from xrpl.models.base_model import BaseModel, _validation
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.utils import require_kwargs_on_init
 
@@ -35,12 +35,16 @@ class XRP(BaseModel):
     currency: str = field(default="XRP", init=False)
 
     @classmethod
-    def from_dict(cls: Type[XRP], value: Dict[str, Any]) -> XRP:
+    def from_dict(
+        cls: Type[XRP], value: Dict[str, Any], *, validate: bool = True
+    ) -> XRP:
         """
         Construct a new XRP from a dictionary of parameters.
 
         Args:
             value: The value to construct the XRP from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new XRP object, constructed using the given parameters.
@@ -50,7 +54,8 @@ class XRP(BaseModel):
         """
         if len(value) != 1 or "currency" not in value or value["currency"] != "XRP":
             raise XRPLModelException("Not a valid XRP type")
-        return XRP()
+        with _validation(validate):
+            return XRP()
 
     def to_dict(self: XRP) -> Dict[str, Any]:
         """
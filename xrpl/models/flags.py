@@ -1,6 +1,8 @@
 """All transacion flags and utils to build a list of ints from a FlagInterface"""
 
-from typing import Dict, List, Union
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 from typing_extensions import TypedDict
 
@@ -59,6 +61,28 @@ TX_FLAGS: Dict[str, Dict[str, int]] = {
 }
 
 
+# the flags of each transaction type, as (name, value) pairs
+_FLAG_TABLES: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    tx_type: tuple(flags.items()) for tx_type, flags in TX_FLAGS.items()
+}
+# the names of the flags of each transaction type, by value
+_FLAG_NAMES: Dict[str, Dict[int, Tuple[str, ...]]] = {
+    tx_type: {
+        num: tuple(flag for flag, other in flags.items() if other == num)
+        for num in flags.values()
+    }
+    for tx_type, flags in TX_FLAGS.items()
+}
+
+
+@lru_cache(maxsize=1)
+def _load_numpy() -> Optional[Any]:
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
+
+
 class FlagInterface(TypedDict):
     """A TypedDict to define transaction flags by bool."""
 
@@ -96,6 +120,106 @@ def interface_to_flag_list(
     return flag_list
 
 
+def interface_to_flag_int(
+    tx_type: Union[TransactionType, PseudoTransactionType],
+    tx_flags: Dict[str, bool],
+) -> int:
+    """Combine the flags set in a FlagInterface into the integer of the Flags field.
+
+    Args:
+        tx_type (Union[TransactionType, PseudoTransactionType]):
+            Type of the transaction.
+        tx_flags (dict):
+            FlagInterface
+
+    Returns:
+        int:
+            The flags set to True, combined. Flags the transaction type does not
+            have are ignored.
+
+    Raises:
+        XRPLModelException: Flags were not set correctly.
+    """
+    flags = TX_FLAGS.get(tx_type, {})
+    value = 0
+    # checks the definition of the flags as it goes, like check_false_flag_definition
+    for flag, set_flag in tx_flags.items():
+        if not isinstance(flag, str) or not isinstance(set_flag, bool):
+            raise XRPLModelException(_false_flag_definition(tx_type))
+        if set_flag:
+            value |= flags.get(flag, 0)
+    return value
+
+
+def _has_interface_flag(
+    tx_type: Union[TransactionType, PseudoTransactionType],
+    tx_flags: Dict[str, bool],
+    flag: int,
+) -> bool:
+    """Whether `interface_to_flag_list` would contain the flag, without building it."""
+    names = _FLAG_NAMES.get(tx_type)
+    if names is None:  # a transaction type without flags has only 0
+        return flag == 0
+    if flag == 0:  # each flag that is not set counts as 0
+        return not all(tx_flags.get(name) for name in TX_FLAGS[tx_type])
+    for name in names.get(flag, ()):
+        if tx_flags.get(name):
+            return True
+    return False
+
+
+def decode_flags(
+    tx_type: Union[str, TransactionType, PseudoTransactionType],
+    flags: int,
+) -> FrozenSet[str]:
+    """Decode the integer Flags field of a transaction into the names of its flags.
+
+    Args:
+        tx_type (Union[str, TransactionType, PseudoTransactionType]):
+            Type of the transaction.
+        flags (int):
+            The Flags field of the transaction.
+
+    Returns:
+        FrozenSet[str]:
+            The names of the flags of the transaction type that are set, as in
+            its FlagInterface.
+    """
+    return frozenset(
+        flag
+        for flag, num in _FLAG_TABLES.get(tx_type, ())
+        if num and flags & num == num
+    )
+
+
+def decode_flag_columns(
+    tx_type: Union[str, TransactionType, PseudoTransactionType],
+    flags: Sequence[int],
+) -> Dict[str, Sequence[bool]]:
+    """Decode the Flags fields of many transactions of one type, column by column.
+
+    Each flag of the transaction type gets a column telling, for each transaction,
+    whether the flag is set. If NumPy is installed, the flags may be any array-like
+    and the columns are boolean NumPy arrays; otherwise they are lists.
+
+    Args:
+        tx_type (Union[str, TransactionType, PseudoTransactionType]):
+            Type of the transactions.
+        flags (Sequence[int]):
+            The Flags field of each transaction.
+
+    Returns:
+        Dict[str, Sequence[bool]]:
+            The column of each flag of the transaction type, by its name.
+    """
+    table = [(flag, num) for flag, num in _FLAG_TABLES.get(tx_type, ()) if num]
+    numpy = _load_numpy()
+    if numpy is not None:
+        array = numpy.asarray(flags, dtype=numpy.uint32)
+        return {flag: (array & num) == num for flag, num in table}
+    return {flag: [value & num == num for value in flags] for flag, num in table}
+
+
 def check_false_flag_definition(
     tx_type: Union[TransactionType, PseudoTransactionType],
     tx_flags: Union[Dict[str, bool], List[int]],
@@ -114,27 +238,22 @@ def check_false_flag_definition(
     Raises:
         XRPLModelException: Flags were not set correctly.
     """
-    try:
-        if isinstance(tx_flags, dict):
-            interface_flags: Dict[str, bool] = tx_flags
-            assert all(
-                [
-                    all(
-                        (
-                            isinstance(flag, str),
-                            isinstance(set_flag, bool),
-                        )
-                    )
-                    for flag, set_flag in interface_flags.items()
-                ]
-            )
-        else:  # List[int]
-            list_flags: List[int] = tx_flags
-            assert all(isinstance(flag, int) for flag in list_flags)
-    except AssertionError:
-        msg = f"""
+    if isinstance(tx_flags, dict):
+        valid = all(
+            isinstance(flag, str) and isinstance(set_flag, bool)
+            for flag, set_flag in tx_flags.items()
+        )
+    else:  # List[int]
+        valid = all(isinstance(flag, int) for flag in tx_flags)
+    if not valid:
+        raise XRPLModelException(_false_flag_definition(tx_type))
+
+
+def _false_flag_definition(
+    tx_type: Union[TransactionType, PseudoTransactionType]
+) -> str:
+    return f"""
 False flag definition: Please define flags either by setting bools using
 `{tx_type}FlagInterface` or by using `{tx_type}Flag`.
 Do not put the FlagInterface in a list or mix them.
 """.strip()
-        raise XRPLModelException(msg)
@@ -18,6 +18,8 @@ def _get_nested_name(cls: Union[NestedModel, Type[NestedModel]]) -> str:
 class NestedModel(BaseModel):
     """The base class for models that involve a nested dictionary e.g. memos."""
 
+    __slots__ = ()
+
     @classmethod
     def is_dict_of_model(cls: Type[NestedModel], dictionary: Any) -> bool:
         """
@@ -43,12 +45,16 @@ class NestedModel(BaseModel):
         )
 
     @classmethod
-    def from_dict(cls: Type[NestedModel], value: Dict[str, Any]) -> NestedModel:
+    def from_dict(
+        cls: Type[NestedModel], value: Dict[str, Any], *, validate: bool = True
+    ) -> NestedModel:
         """
         Construct a new NestedModel from a dictionary of parameters.
 
         Args:
             value: The value to construct the NestedModel from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new NestedModel object, constructed using the given parameters.
@@ -57,8 +63,10 @@ class NestedModel(BaseModel):
             XRPLModelException: If the dictionary provided is invalid.
         """
         if _get_nested_name(cls) not in value:
-            return super(NestedModel, cls).from_dict(value)
-        return super(NestedModel, cls).from_dict(value[_get_nested_name(cls)])
+            return super(NestedModel, cls).from_dict(value, validate=validate)
+        return super(NestedModel, cls).from_dict(
+            value[_get_nested_name(cls)], validate=validate
+        )
 
     def to_dict(self: NestedModel) -> Dict[str, Any]:
         """
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Type, Union, cast
 
+from xrpl.models.base_model import _validation
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.utils import require_kwargs_on_init
@@ -18,6 +19,9 @@ class GenericRequest(Request):
     There is no analog in rippled - this is an xrpl-py-specific model.
     """
 
+    # keeps the arbitrary parameters of the request
+    __slots__ = ("__dict__",)
+
     method: RequestMethod = field(default=RequestMethod.GENERIC_REQUEST, init=False)
     """
     This field is required.
@@ -42,13 +46,17 @@ class GenericRequest(Request):
             object.__setattr__(self, key, value)
 
     @classmethod
-    def from_dict(cls: Type[GenericRequest], value: Dict[str, Any]) -> GenericRequest:
+    def from_dict(
+        cls: Type[GenericRequest], value: Dict[str, Any], *, validate: bool = True
+    ) -> GenericRequest:
         """
         Construct a new GenericRequest from a dictionary of parameters. Also converts
         from JSON and WS formatting.
 
         Args:
             value: The value to construct the GenericRequest from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new GenericRequest object, constructed using the given parameters.
@@ -68,7 +76,8 @@ class GenericRequest(Request):
         else:
             raise XRPLModelException("Must have a command or a method in a request")
 
-        return cls(**value)
+        with _validation(validate):
+            return cls(**value)
 
     def to_dict(self: GenericRequest) -> Dict[str, Any]:
         """
@@ -77,11 +86,11 @@ class GenericRequest(Request):
         Returns:
             The dictionary representation of a GenericRequest.
         """
-        # uses self.__dict__ instead of self.__dataclass_fields__.keys(), which is what
-        # the other models do, because this model doesn't have any dataclass fields
+        # uses self.__dict__ as well as the dataclass fields, which are what the other
+        # models use, because the parameters of this model are not dataclass fields
         dict = {
             key: self._to_dict_elem(getattr(self, key))
-            for key in self.__dict__
+            for key in {**self.__dataclass_fields__, **self.__dict__}
             if getattr(self, key) is not None
         }
 
@@ -105,12 +105,14 @@ class Request(BaseModel):
     id: Optional[Union[str, int]] = None
 
     @classmethod
-    def from_dict(cls: Type[R], value: Dict[str, Any]) -> R:
+    def from_dict(cls: Type[R], value: Dict[str, Any], *, validate: bool = True) -> R:
         """
         Construct a new Request from a dictionary of parameters.
 
         Args:
             value: The value to construct the Request from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new Request object, constructed using the given parameters.
@@ -122,7 +124,7 @@ class Request(BaseModel):
             if "method" not in value:
                 raise XRPLModelException("Request does not include method.")
             correct_type = cls.get_method(value["method"])
-            return correct_type.from_dict(value)  # type: ignore
+            return correct_type.from_dict(value, validate=validate)  # type: ignore
 
         if "method" in value:
             method = value["method"]
@@ -141,7 +143,7 @@ class Request(BaseModel):
             value = {**value}
             del value["method"]
 
-        return super(Request, cls).from_dict(value)
+        return super(Request, cls).from_dict(value, validate=validate)
 
     @classmethod
     def get_method(cls: Type[Request], method: str) -> Type[Request]:
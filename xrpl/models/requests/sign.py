@@ -66,12 +66,16 @@ class Sign(Request):
     fee_div_max: int = 1
 
     @classmethod
-    def from_dict(cls: Type[Sign], value: Dict[str, Any]) -> Sign:
+    def from_dict(
+        cls: Type[Sign], value: Dict[str, Any], *, validate: bool = True
+    ) -> Sign:
         """
         Construct a new Sign from a dictionary of parameters.
 
         Args:
             value: The value to construct the Sign from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new Sign object, constructed using the given parameters.
@@ -81,7 +85,7 @@ class Sign(Request):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super(Sign, cls).from_dict(fixed_value)
+        return super(Sign, cls).from_dict(fixed_value, validate=validate)
 
     def to_dict(self: Sign) -> Dict[str, Any]:
         """
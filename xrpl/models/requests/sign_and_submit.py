@@ -75,12 +75,16 @@ class SignAndSubmit(Submit):
     fee_div_max: int = 1
 
     @classmethod
-    def from_dict(cls: Type[SignAndSubmit], value: Dict[str, Any]) -> SignAndSubmit:
+    def from_dict(
+        cls: Type[SignAndSubmit], value: Dict[str, Any], *, validate: bool = True
+    ) -> SignAndSubmit:
         """
         Construct a new SignAndSubmit from a dictionary of parameters.
 
         Args:
             value: The value to construct the SignAndSubmit from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new SignAndSubmit object, constructed using the given parameters.
@@ -90,7 +94,7 @@ class SignAndSubmit(Submit):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super(SignAndSubmit, cls).from_dict(fixed_value)
+        return super(SignAndSubmit, cls).from_dict(fixed_value, validate=validate)
 
     def to_dict(self: SignAndSubmit) -> Dict[str, Any]:
         """
@@ -57,12 +57,16 @@ class SignFor(Request):
     key_type: Optional[CryptoAlgorithm] = None
 
     @classmethod
-    def from_dict(cls: Type[SignFor], value: Dict[str, Any]) -> SignFor:
+    def from_dict(
+        cls: Type[SignFor], value: Dict[str, Any], *, validate: bool = True
+    ) -> SignFor:
         """
         Construct a new SignFor from a dictionary of parameters.
 
         Args:
             value: The value to construct the SignFor from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new SignFor object, constructed using the given parameters.
@@ -72,7 +76,7 @@ class SignFor(Request):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super(SignFor, cls).from_dict(fixed_value)
+        return super(SignFor, cls).from_dict(fixed_value, validate=validate)
 
     def to_dict(self: SignFor) -> Dict[str, Any]:
         """
@@ -62,12 +62,14 @@ class Submit(Request):
     method: RequestMethod = field(default=RequestMethod.SUBMIT, init=False)
 
     @classmethod
-    def from_dict(cls: Type[S], value: Dict[str, Any]) -> S:
+    def from_dict(cls: Type[S], value: Dict[str, Any], *, validate: bool = True) -> S:
         """
         Construct a new Submit from a dictionary of parameters.
 
         Args:
             value: The value to construct the Submit from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new Submit object, constructed using the given parameters.
@@ -79,6 +81,6 @@ class Submit(Request):
 
         if cls.__name__ == "Submit":
             if "tx_blob" in value:
-                return SubmitOnly.from_dict(value)  # type: ignore
-            return SignAndSubmit.from_dict(value)  # type: ignore
-        return super(Submit, cls).from_dict(value)
+                return SubmitOnly.from_dict(value, validate=validate)  # type: ignore
+            return SignAndSubmit.from_dict(value, validate=validate)  # type: ignore
+        return super(Submit, cls).from_dict(value, validate=validate)
@@ -43,21 +43,25 @@ class SubmitMultisigned(Request):
 
     @classmethod
     def from_dict(
-        cls: Type[SubmitMultisigned], value: Dict[str, Any]
+        cls: Type[SubmitMultisigned], value: Dict[str, Any], *, validate: bool = True
     ) -> SubmitMultisigned:
         """
         Construct a new SubmitMultisigned object from a dictionary of parameters.
 
         Args:
             value: The value to construct the SubmitMultisigned from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new SubmitMultisigned object, constructed using the given parameters.
         """
         fixed_value = {**value}
         if "TransactionType" in fixed_value["tx_json"]:  # xrpl format
-            fixed_value["tx_json"] = Transaction.from_xrpl(fixed_value["tx_json"])
-        return super(SubmitMultisigned, cls).from_dict(fixed_value)
+            fixed_value["tx_json"] = Transaction.from_xrpl(
+                fixed_value["tx_json"], validate=validate
+            )
+        return super(SubmitMultisigned, cls).from_dict(fixed_value, validate=validate)
 
     def to_dict(self: SubmitMultisigned) -> Dict[str, Any]:
         """
@@ -8,14 +8,17 @@ from __future__ import annotations
 import warnings
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Type, Union, cast
 
-from xrpl.models.base_model import BaseModel
+from xrpl.models.base_model import BaseModel, _is_validation_enabled
 from xrpl.models.required import REQUIRED
 from xrpl.models.transactions import PaymentFlag
 from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import require_kwargs_on_init
 
+_PARTIAL_PAYMENT_WARNING = """This response contains a partial payment. Please confirm
+                the delivered amount is correct"""
+
 
 class ResponseStatus(str, Enum):
     """Represents the different status possibilities."""
@@ -41,6 +44,9 @@ class Response(BaseModel):
     Represents fields common to all response types.
     """
 
+    # memoizes `contains_partial_payment`
+    __slots__ = ("_contains_partial_payment",)
+
     status: ResponseStatus = REQUIRED  # type: ignore
     """
     This field is required.
@@ -59,14 +65,37 @@ class Response(BaseModel):
     type: Optional[ResponseType] = None
 
     def __post_init__(self: Response) -> None:
-        """Called by dataclasses immediately after __init__."""
+        """
+        Called by dataclasses immediately after __init__. A Response constructed
+        in trusted mode (see `trusted_construction`) is neither validated nor
+        scanned for partial payments until it is asked for them.
+        """
         super().__post_init__()
-        if self.contains_partial_payment():
-            warnings.warn(
-                """This response contains a partial payment. Please confirm
-                the delivered amount is correct""",
-                stacklevel=2,
-            )
+        if _is_validation_enabled() and self.contains_partial_payment():
+            warnings.warn(_PARTIAL_PAYMENT_WARNING, stacklevel=2)
+
+    @classmethod
+    def _from_server(
+        cls: Type[Response],
+        status: ResponseStatus,
+        result: Dict[str, Any],
+        id: Optional[Union[int, str]] = None,
+        type: Optional[ResponseType] = None,
+    ) -> Response:
+        """
+        Constructs a Response from what the clients received, without validating it.
+        The result is only scanned for partial payments on construction if it is
+        itself a payment; any other result is scanned when `contains_partial_payment`
+        is first called.
+        """
+        response = object.__new__(cls)
+        object.__setattr__(response, "status", status)
+        object.__setattr__(response, "result", result)
+        object.__setattr__(response, "id", id)
+        object.__setattr__(response, "type", type)
+        if _is_payment(result) and response.contains_partial_payment():
+            warnings.warn(_PARTIAL_PAYMENT_WARNING, stacklevel=3)
+        return response
 
     def is_successful(self: Response) -> bool:
         """
@@ -87,34 +116,43 @@ class Response(BaseModel):
             True if at least one transaction in this Response has the partial
             payment flag set. False otherwise.
         """
-        return self._do_contains_partial_payment(self.result)
+        # the result is scanned once, on first use
+        contains_partial_payment = getattr(self, "_contains_partial_payment", None)
+        if contains_partial_payment is None:
+            contains_partial_payment = self._do_contains_partial_payment(self.result)
+            object.__setattr__(
+                self, "_contains_partial_payment", contains_partial_payment
+            )
+        return cast(bool, contains_partial_payment)
 
     def _do_contains_partial_payment(self: Response, val: Any) -> bool:
-        flagged = []
+        # only the fields of payments are looked into, so that large results, such
+        # as pages of ledger objects, are not walked
         if isinstance(val, dict):
-            formatted = {key.strip().lower(): value for key, value in val.items()}
-            if (
-                "transactiontype" in formatted
-                and formatted["transactiontype"] == TransactionType.PAYMENT
-            ):
-                flagged = [
-                    True
-                    for key, value in val.items()
-                    if self._is_partial_payment(key, value)
-                ]
+            return _is_payment(val) and any(
+                self._is_partial_payment(key, value) for key, value in val.items()
+            )
         if isinstance(val, list):
-            flagged = [
-                True for sub_val in val if self._do_contains_partial_payment(sub_val)
-            ]
-        return len(flagged) > 0
+            return any(self._do_contains_partial_payment(sub_val) for sub_val in val)
+        return False
 
     def _is_partial_payment(self: Response, key: str, val: Any) -> bool:
         if isinstance(val, dict):
             return self._do_contains_partial_payment(val)
+        if key.strip().lower() != "flags":
+            return False
         try:
             int_val = int(val)
         except (TypeError, ValueError):
             return False
-        return key.strip().lower() == "flags" and (
-            int_val & PaymentFlag.TF_PARTIAL_PAYMENT != 0
-        )
+        return int_val & PaymentFlag.TF_PARTIAL_PAYMENT != 0
+
+
+def _is_payment(val: Dict[str, Any]) -> bool:
+    transaction_type = val.get("TransactionType")
+    if transaction_type is None:
+        # the key may be spelled in another case, or padded
+        for key, value in val.items():
+            if key.strip().lower() == "transactiontype":
+                transaction_type = value
+    return bool(transaction_type == TransactionType.PAYMENT)
@@ -1,17 +1,36 @@
 """The base model for all transactions and their nested object types."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import Field, dataclass, fields
+from functools import lru_cache
 from hashlib import sha512
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from typing_extensions import Final
 
-from xrpl.core.binarycodec import encode
+from xrpl.core.addresscodec import is_valid_xaddress
+from xrpl.core.binarycodec import XRPLBinaryCodecException, encode
+from xrpl.core.binarycodec.binary_wrappers import BinaryParser, BinarySerializer
+from xrpl.core.binarycodec.definitions import (
+    FieldInstance,
+    get_field_instance,
+    get_field_names,
+    get_transaction_type_code,
+    get_transaction_type_name,
+)
 from xrpl.models.amounts import IssuedCurrencyAmount
-from xrpl.models.base_model import ABBREVIATIONS, BaseModel
+from xrpl.models.base_model import (
+    ABBREVIATIONS,
+    BaseModel,
+    _key_to_json,
+    _value_to_json,
+)
 from xrpl.models.exceptions import XRPLModelException
-from xrpl.models.flags import check_false_flag_definition, interface_to_flag_list
+from xrpl.models.flags import (
+    _has_interface_flag,
+    check_false_flag_definition,
+    interface_to_flag_int,
+)
 from xrpl.models.nested_model import NestedModel
 from xrpl.models.requests import PathStep
 from xrpl.models.required import REQUIRED
@@ -49,7 +68,16 @@ def _key_to_tx_json(key: str) -> str:
         2. 'URI' becomes 'uri'
 
     Known abbreviations (example 2 above) need to be enumerated in ABBREVIATIONS.
+    The keys of the fields of the definitions are looked up in a table, and other
+    keys in a bounded cache.
     """
+    tx_json_key = _TX_JSON_KEYS.get(key)
+    if tx_json_key is None:
+        return _cached_key_to_tx_json(key)
+    return tx_json_key
+
+
+def _convert_key_to_tx_json(key: str) -> str:
     return "".join(
         [
             ABBREVIATIONS[word] if word in ABBREVIATIONS else word.capitalize()
@@ -58,6 +86,15 @@ def _key_to_tx_json(key: str) -> str:
     )
 
 
+# the PascalCase keys of the fields of the definitions, by their snake_case keys
+_FIELD_NAMES: Final[List[str]] = get_field_names()
+_TX_JSON_KEYS: Final[Dict[str, str]] = {
+    key: _convert_key_to_tx_json(key)
+    for key in (_key_to_json(field) for field in _FIELD_NAMES)
+}
+_cached_key_to_tx_json: Final = lru_cache(maxsize=1024)(_convert_key_to_tx_json)
+
+
 def _value_to_tx_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     # IssuedCurrencyAmount and PathStep are special cases and should not be snake cased
     # and only contain primitive members
@@ -161,6 +198,63 @@ class Signer(NestedModel):
 
 T = TypeVar("T", bound="Transaction")  # any type inherited from Transaction
 
+_ACCOUNT_ID: Final[str] = "AccountID"
+_TRANSACTION_TYPE: Final[str] = "TransactionType"
+_OBJECT_END_MARKER: Final[str] = "ObjectEndMarker"
+_ST_OBJECT: Final[str] = "STObject"
+_OBJECT_END_MARKER_BYTE: Final[bytes] = bytes([0xE1])
+_XADDRESS_PREFIXES: Final[str] = "XT"
+
+# the serialized fields of each transaction class, as (attribute, field) pairs in
+# the order of the definitions, or None if it must go through `to_xrpl`
+_BINARY_FIELDS: Dict[type, Optional[List[Tuple[str, Optional[FieldInstance]]]]] = {}
+
+
+def _get_binary_fields(
+    cls: Type[Transaction],
+) -> Optional[List[Tuple[str, Optional[FieldInstance]]]]:
+    if cls in _BINARY_FIELDS:
+        return _BINARY_FIELDS[cls]
+
+    binary_fields: Optional[List[Tuple[str, Optional[FieldInstance]]]] = None
+    if cls.to_dict is Transaction.to_dict and cls.to_xrpl is Transaction.to_xrpl:
+        known = []
+        unknown: List[Tuple[str, Optional[FieldInstance]]] = []
+        for field in fields(cls):
+            field_name = _key_to_tx_json(field.name)
+            if field_name not in _FIELD_NAMES:
+                unknown.append((field.name, None))
+                continue
+            field_instance = get_field_instance(field_name)
+            if field_instance.is_serialized:
+                known.append((field.name, field_instance))
+        known.sort(key=lambda pair: pair[1].ordinal)
+        binary_fields = [*unknown, *known]
+    _BINARY_FIELDS[cls] = binary_fields
+    return binary_fields
+
+
+# the class of each transaction type, by name and by its code in the definitions,
+# filled in as the classes are defined
+_TRANSACTION_TYPES: Dict[str, Type[Transaction]] = {}
+_TRANSACTION_TYPE_CODES: Dict[int, Type[Transaction]] = {}
+
+
+def _register_transaction_type(cls: Type[Transaction]) -> None:
+    # only a class that declares its own `transaction_type` is registered, so that
+    # subclasses of a transaction type do not replace it
+    transaction_type = cls.__dict__.get("transaction_type")
+    if isinstance(transaction_type, Field):
+        transaction_type = transaction_type.default
+    if not isinstance(transaction_type, (TransactionType, PseudoTransactionType)):
+        return
+    _TRANSACTION_TYPES[transaction_type.value] = cls
+    try:
+        _TRANSACTION_TYPE_CODES[get_transaction_type_code(transaction_type.value)] = cls
+    except KeyError:
+        # a type the definitions do not know yet cannot be decoded from binary
+        pass
+
 
 @require_kwargs_on_init
 @dataclass(frozen=True)
@@ -256,6 +350,17 @@ class Transaction(BaseModel):
     transaction. Automatically added during signing.
     """
 
+    def __init_subclass__(cls: Type[Transaction], **kwargs: Any) -> None:
+        """
+        Registers each transaction type as it is defined, for `get_transaction_type`
+        and `get_transaction_type_by_code`.
+
+        Args:
+            kwargs: The keyword arguments of the class definition.
+        """
+        super().__init_subclass__(**kwargs)
+        _register_transaction_type(cls)
+
     def _get_errors(self: Transaction) -> Dict[str, str]:
         errors = super()._get_errors()
         if self.ticket_sequence is not None and (
@@ -296,15 +401,12 @@ class Transaction(BaseModel):
     def _flags_to_int(self: Transaction) -> int:
         if isinstance(self.flags, int):
             return self.flags
-        check_false_flag_definition(tx_type=self.transaction_type, tx_flags=self.flags)
         if isinstance(self.flags, dict):
-            return self._iter_to_int(
-                lst=interface_to_flag_list(
-                    tx_type=self.transaction_type,
-                    tx_flags=self.flags,
-                )
+            return interface_to_flag_int(
+                tx_type=self.transaction_type,
+                tx_flags=self.flags,
             )
-
+        check_false_flag_definition(tx_type=self.transaction_type, tx_flags=self.flags)
         return self._iter_to_int(lst=self.flags)
 
     def to_xrpl(self: Transaction) -> Dict[str, Any]:
@@ -317,13 +419,116 @@ class Transaction(BaseModel):
         """
         return transaction_json_to_binary_codec_form(self.to_dict())
 
+    def to_bytes(self: Transaction) -> bytes:
+        """
+        Serializes the Transaction into the canonical binary format, as
+        ``encode(transaction.to_xrpl())`` does. The fields are serialized straight
+        from the model's attributes, in the order of the definitions, without
+        building the JSON dictionary of the whole transaction first.
+
+        Returns:
+            The binary-encoded transaction.
+
+        Raises:
+            XRPLBinaryCodecException: if a field cannot be serialized.
+        """
+        binary_fields = _get_binary_fields(type(self))
+        # UNLModify is encoded differently, due to a bug in rippled
+        if binary_fields is None or isinstance(
+            self.transaction_type, PseudoTransactionType
+        ):
+            return bytes.fromhex(encode(self.to_xrpl()))
+
+        serializer = BinarySerializer()
+        for attribute, field in binary_fields:
+            value = getattr(self, attribute)
+            if value is None:
+                continue
+            if field is None:
+                # not a field of the definitions, which the codec rejects
+                return bytes.fromhex(encode(self.to_xrpl()))
+            if attribute == "flags":
+                value = self._flags_to_int()
+            elif attribute == "transaction_type":
+                value = get_transaction_type_code(value.value)
+            else:
+                value = self._to_dict_elem(value)
+                if isinstance(value, (dict, list)):
+                    value = _value_to_tx_json(value)
+                elif (
+                    field.type == _ACCOUNT_ID
+                    and value[:1] in _XADDRESS_PREFIXES
+                    and is_valid_xaddress(value)
+                ):
+                    # the codec splits X-Addresses into an address and a tag
+                    return bytes.fromhex(encode(self.to_xrpl()))
+            try:
+                serializer.write_field_and_value(
+                    field, field.associated_type.from_value(value)
+                )
+            except XRPLBinaryCodecException as e:
+                # the same context as the errors of the codec
+                e.args = (f"Error processing {field.name}: {e.args[0]}",) + e.args[1:]
+                raise
+            if field.type == _ST_OBJECT:
+                serializer.append(_OBJECT_END_MARKER_BYTE)
+        return bytes(serializer)
+
+    def to_binary(self: Transaction) -> str:
+        """
+        Serializes the Transaction into the canonical binary format, as hex. See
+        `to_bytes`.
+
+        Returns:
+            The binary-encoded transaction, as an uppercase hexadecimal string.
+        """
+        return self.to_bytes().hex().upper()
+
     @classmethod
-    def from_dict(cls: Type[T], value: Dict[str, Any]) -> T:
+    def from_blob(cls: Type[T], blob: Union[str, bytes], *, validate: bool = True) -> T:
+        """
+        Construct a new Transaction from its canonical binary format, as
+        ``Transaction.from_xrpl(decode(blob))`` does, but reading the fields of the
+        blob straight into the parameters of the model.
+
+        Args:
+            blob: The binary-encoded transaction, as bytes or as a hexadecimal
+                string.
+            validate: Whether to validate the model and its nested models, as their
+                constructors do. Transactions decoded from a validated ledger can
+                skip the validation. Defaults to True.
+
+        Returns:
+            A new Transaction object of the type of the transaction, constructed
+            from the blob.
+        """
+        parser = BinaryParser(blob.hex() if isinstance(blob, bytes) else blob)
+        value: Dict[str, Any] = {}
+        transaction_class: Optional[Type[Transaction]] = None
+        while not parser.is_end():
+            field = parser.read_field()
+            if field.name == _OBJECT_END_MARKER:
+                break
+            field_value = parser.read_field_value(field).to_json()
+            if field.name == _TRANSACTION_TYPE:
+                transaction_class = cls.get_transaction_type_by_code(field_value)
+                field_value = get_transaction_type_name(field_value)
+            value[_key_to_json(field.name)] = _value_to_json(field_value)
+
+        if transaction_class is None or not issubclass(transaction_class, cls):
+            # let `from_dict` report the missing or mismatched transaction type
+            return cls.from_dict(value, validate=validate)
+        return transaction_class.from_dict(value, validate=validate)
+
+    @classmethod
+    def from_dict(cls: Type[T], value: Dict[str, Any], *, validate: bool = True) -> T:
         """
         Construct a new Transaction from a dictionary of parameters.
 
         Args:
             value: The value to construct the Transaction from.
+            validate: Whether to validate the model and its nested models. See
+                `trusted_construction`. Defaults to True.
 
         Returns:
             A new Transaction object, constructed using the given parameters.
@@ -338,7 +543,7 @@ class Transaction(BaseModel):
                     "Transaction does not include transaction_type."
                 )
             correct_type = cls.get_transaction_type(value["transaction_type"])
-            return correct_type.from_dict(value)  # type: ignore
+            return correct_type.from_dict(value, validate=validate)  # type: ignore
         else:
             if "transaction_type" in value:
                 if value["transaction_type"] != cls.__name__:
@@ -349,7 +554,7 @@ class Transaction(BaseModel):
                     )
                 value = {**value}
                 del value["transaction_type"]
-            return super(Transaction, cls).from_dict(value)
+            return super(Transaction, cls).from_dict(value, validate=validate)
 
     def has_flag(self: Transaction, flag: int) -> bool:
         """
@@ -365,9 +570,10 @@ class Transaction(BaseModel):
         if isinstance(self.flags, int):
             return self.flags & flag != 0
         elif isinstance(self.flags, dict):
-            return flag in interface_to_flag_list(
+            return _has_interface_flag(
                 tx_type=self.transaction_type,
                 tx_flags=self.flags,
+                flag=flag,
             )
         else:  # is List[int]
             return flag in self.flags
@@ -387,9 +593,8 @@ class Transaction(BaseModel):
             raise XRPLModelException(
                 "Cannot get the hash from an unsigned Transaction."
             )
-        prefix = hex(_TRANSACTION_HASH_PREFIX)[2:].upper()
-        encoded_str = bytes.fromhex(prefix + encode(self.to_xrpl()))
-        return sha512(encoded_str).digest().hex().upper()[:64]
+        encoded = _TRANSACTION_HASH_PREFIX.to_bytes(4, "big") + self.to_bytes()
+        return sha512(encoded).digest().hex().upper()[:64]
 
     @classmethod
     def get_transaction_type(
@@ -407,21 +612,33 @@ class Transaction(BaseModel):
         Raises:
             XRPLModelException: If `transaction_type` is not a valid Transaction type.
         """
-        import xrpl.models.transactions as transaction_models
-        import xrpl.models.transactions.pseudo_transactions as pseudo_transaction_models
+        if transaction_type in _TRANSACTION_TYPES:
+            return _TRANSACTION_TYPES[transaction_type]
 
-        transaction_types: Dict[str, Type[Transaction]] = {
-            t.value: getattr(transaction_models, t)
-            for t in transaction_models.types.TransactionType
-        }
-        if transaction_type in transaction_types:
-            return transaction_types[transaction_type]
+        raise XRPLModelException(f"{transaction_type} is not a valid Transaction type")
 
-        pseudo_transaction_types: Dict[str, Type[Transaction]] = {
-            t.value: getattr(pseudo_transaction_models, t)
-            for t in transaction_models.types.PseudoTransactionType
-        }
-        if transaction_type in pseudo_transaction_types:
-            return pseudo_transaction_types[transaction_type]
+    @classmethod
+    def get_transaction_type_by_code(
+        cls: Type[Transaction], transaction_type_code: int
+    ) -> Type[Transaction]:
+        """
+        Returns the correct transaction type based on its ``TransactionType`` code in
+        the binary format.
 
-        raise XRPLModelException(f"{transaction_type} is not a valid Transaction type")
+        Args:
+            transaction_type_code: The code of the transaction type, as in the
+                definitions of the binary codec.
+
+        Returns:
+            The transaction class with the given code.
+
+        Raises:
+            XRPLModelException: If `transaction_type_code` is not the code of a valid
+                Transaction type.
+        """
+        if transaction_type_code in _TRANSACTION_TYPE_CODES:
+            return _TRANSACTION_TYPE_CODES[transaction_type_code]
+
+        raise XRPLModelException(
+            f"{transaction_type_code} is not a valid Transaction type code"
+        )
@@ -1,7 +1,9 @@
 """Helper util functions for the models module."""
 
-from dataclasses import is_dataclass
-from typing import Any, Dict, List, Type, TypeVar
+from dataclasses import MISSING, Field, fields, is_dataclass
+from typing import Any, Dict, List, Tuple, Type, TypeVar, cast
+
+from typing_extensions import Final
 
 from xrpl.models.exceptions import XRPLModelException
 
@@ -11,16 +13,31 @@ from xrpl.models.exceptions import XRPLModelException
 _T = TypeVar("_T")
 _Self = TypeVar("_Self")
 
+# the slot in which a model caches its hash
+_HASH_SLOT: Final[str] = "_hash"
+
+# the methods of a dataclass that `require_kwargs_on_init` replaces, when they were
+# generated by `dataclass`
+_GENERATED_METHODS: Final[Tuple[str, ...]] = ("__init__", "__eq__", "__hash__")
+
+# the class attribute in which a model records which of those its class body
+# defines, before `dataclass` generates the others
+_DEFINED_METHODS: Final[str] = "_defined_methods"
+
 
 def require_kwargs_on_init(cls: Type[_T]) -> Type[_T]:
     """
     Force a dataclass's init function to only work if called with keyword arguments.
-    If parameters are not positional-only, a TypeError is thrown with a helpful message.
-    This function may only be used on dataclasses.
+    If parameters are not positional-only, an XRPLModelException is thrown with a
+    helpful message. This function may only be used on dataclasses.
 
-    This works by wrapping the __init__ function and dynamically replacing it.
-    Therefore, stacktraces for calls to the new __init__ might look a bit strange. Fear
-    not though, all is well.
+    The generated __init__ of a model is replaced by an equivalent one whose
+    parameters are keyword-only, so that the check does not cost an extra call. A
+    class that only derives from classes with ``__slots__``, such as a model, is also
+    replaced by a copy that keeps its fields in ``__slots__`` instead of an instance
+    ``__dict__``.
+    Fields that are not in the init and have a default, such as ``transaction_type``,
+    stay class attributes.
 
     Note: although this may be used as a decorator, this is not advised as IDEs will no
     longer suggest parameters in the constructor. Instead, this is the recommended
@@ -35,7 +52,8 @@ def require_kwargs_on_init(cls: Type[_T]) -> Type[_T]:
         cls: The class that requires keyword arguments (must be a dataclass).
 
     Returns:
-        The provided class, adding an error on init if positional args are provided.
+        The provided class, or its slotted copy, adding an error on init if
+        positional args are provided.
 
     Raises:
         TypeError: If cls is None or is not a dataclass.
@@ -49,17 +67,220 @@ def require_kwargs_on_init(cls: Type[_T]) -> Type[_T]:
             "dataclass."
         )
 
+    bases = cls.__mro__[1:-1]  # without `object`
+    if bases and all("__slots__" in base.__dict__ for base in bases):
+        cls = cast(Type[_T], _add_slots(cls))
+
+    if _is_generated(cls, "__init__"):
+        # noinspection PyTypeHints
+        cls.__init__ = _keyword_only_init(cls)  # type: ignore
+        return cls
+
     original_init = cls.__init__
 
     def new_init(self: _Self, *args: List[Any], **kwargs: Dict[str, Any]) -> None:
         if len(args) > 0:
-            raise XRPLModelException(
-                f"{type(self).__name__}.__init__ only allows keyword arguments. "
-                f"Found the following positional arguments: {args}"
-            )
+            raise _positional_error(self, args)
         original_init(self, **kwargs)
 
     # noinspection PyTypeHints
     cls.__init__ = new_init  # type: ignore
 
     return cls
+
+
+def _positional_error(self: Any, args: Tuple[Any, ...]) -> XRPLModelException:
+    return XRPLModelException(
+        f"{type(self).__name__}.__init__ only allows keyword arguments. "
+        f"Found the following positional arguments: {args}"
+    )
+
+
+def _is_class_attribute(field: "Field[Any]") -> bool:
+    return not field.init and field.default is not MISSING
+
+
+def _add_slots(cls: Type[Any]) -> Type[Any]:
+    """
+    Returns a copy of a dataclass that keeps its fields in ``__slots__``, like
+    ``dataclass(slots=True)`` does on Python 3.10+.
+    """
+    cls_dict = dict(cls.__dict__)
+    declared = cls_dict.get("__slots__", ())
+    if isinstance(declared, str):
+        declared = (declared,)
+    slotted_fields = [
+        field.name for field in fields(cls) if not _is_class_attribute(field)
+    ]
+    slots = (
+        *declared,
+        *(
+            name
+            for name in slotted_fields
+            if name not in declared and not _has_inherited_slot(cls, name)
+        ),
+    )
+    if _is_generated(cls, "__hash__"):
+        # the structural hash of the model is cached on first use
+        if _HASH_SLOT not in slots and not _has_inherited_slot(cls, _HASH_SLOT):
+            slots = (*slots, _HASH_SLOT)
+        cls_dict["__hash__"] = _structural_hash(cls)
+    if _is_generated(cls, "__eq__"):
+        cls_dict["__eq__"] = _structural_eq(cls)
+    cls_dict["__slots__"] = slots
+    # the defaults of the slotted fields are in the generated __init__ already
+    for name in (*slots, *slotted_fields, "__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+
+    slotted_cls: Type[Any] = cast(Any, type(cls))(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    # methods that call `super()` refer to the class they were defined in
+    for value in cls_dict.values():
+        functions = (
+            (value.fget, value.fset, value.fdel)
+            if isinstance(value, property)
+            else (getattr(value, "__func__", value),)
+        )
+        for function in functions:
+            closure = getattr(function, "__closure__", None) or ()
+            for cell in closure:
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted_cls
+                except ValueError:  # an empty cell
+                    pass
+    return slotted_cls
+
+
+def _has_inherited_slot(cls: Type[Any], name: str) -> bool:
+    # a class attribute of a base, such as a default, would hide the slot of its base
+    for base in cls.__mro__[1:]:
+        if name in base.__dict__:
+            return name in base.__dict__.get("__slots__", ())
+    return False
+
+
+def _is_generated(cls: Type[Any], name: str) -> bool:
+    """
+    Whether a method of a model was generated by `dataclass`, rather than defined in
+    its class body. The methods of other dataclasses are never replaced.
+    """
+    defined = cls.__dict__.get(_DEFINED_METHODS)
+    return defined is not None and name in cls.__dict__ and name not in defined
+
+
+def _create_method(
+    cls: Type[Any], name: str, source: str, namespace: Dict[str, Any]
+) -> Any:
+    exec(source, namespace)
+    method = namespace[name]
+    method.__qualname__ = f"{cls.__qualname__}.{name}"
+    method.__module__ = cls.__module__
+    return method
+
+
+def _keyword_only_init(cls: Type[Any]) -> Any:
+    """
+    Builds an __init__ that does what the dataclass's generated __init__ does, with
+    keyword-only parameters, and raises XRPLModelException on positional arguments.
+    """
+    namespace: Dict[str, Any] = {
+        "__positional_error": _positional_error,
+        "__setattr": object.__setattr__,
+        "__missing": MISSING,
+    }
+    # frozen dataclasses set their fields around their own __setattr__
+    if cls.__dataclass_params__.frozen:
+        set_field = "__setattr(self, {name!r}, {value})"
+    else:
+        set_field = "self.{name} = {value}"
+    params = ["self", "*args"]
+    lines = ["if args:", "    raise __positional_error(self, args)"]
+    for field in fields(cls):
+        name = field.name
+        if field.default_factory is not MISSING:
+            namespace[f"__factory_{name}"] = field.default_factory
+        if field.init:
+            if field.default is not MISSING:
+                namespace[f"__default_{name}"] = field.default
+                params.append(f"{name}=__default_{name}")
+            elif field.default_factory is not MISSING:
+                params.append(f"{name}=__missing")
+                lines.append(f"if {name} is __missing:")
+                lines.append(f"    {name} = __factory_{name}()")
+            else:
+                params.append(name)
+            lines.append(set_field.format(name=name, value=name))
+        elif field.default_factory is not MISSING:
+            lines.append(set_field.format(name=name, value=f"__factory_{name}()"))
+    if hasattr(cls, "__post_init__"):
+        lines.append("self.__post_init__()")
+
+    source = f"def __init__({', '.join(params)}):\n" + "".join(
+        f"    {line}\n" for line in lines
+    )
+    init = _create_method(cls, "__init__", source, namespace)
+    init.__annotations__ = {
+        **{field.name: field.type for field in fields(cls) if field.init},
+        "return": None,
+    }
+    return init
+
+
+def _structural_eq(cls: Type[Any]) -> Any:
+    """
+    Builds an __eq__ that compares the fields of two models of the same class one by
+    one, like the dataclass's generated __eq__, but stops at the first field that
+    differs instead of building a tuple of the fields of each model.
+    """
+    comparisons = " and ".join(
+        f"self.{field.name} == other.{field.name}"
+        for field in fields(cls)
+        if field.compare
+    )
+    source = (
+        "def __eq__(self, other):\n"
+        "    if other.__class__ is not self.__class__:\n"
+        "        return NotImplemented\n"
+        f"    return self is other or ({comparisons or 'True'})\n"
+    )
+    return _create_method(cls, "__eq__", source, {})
+
+
+def _structural_hash(cls: Type[Any]) -> Any:
+    """
+    Builds a __hash__ that hashes the fields of a model, like the dataclass's
+    generated __hash__, but that also hashes the lists and dictionaries of a model,
+    as their contents, and caches the hash in the model.
+    """
+    values = "".join(
+        f"self.{field.name}, "
+        for field in fields(cls)
+        if (field.compare if field.hash is None else field.hash)
+    )
+    source = (
+        "def __hash__(self):\n"
+        "    try:\n"
+        f"        return self.{_HASH_SLOT}\n"
+        "    except AttributeError:\n"
+        "        pass\n"
+        f"    values = ({values})\n"
+        "    try:\n"
+        "        value = hash(values)\n"
+        "    except TypeError:\n"
+        "        value = hash(__hashable(values))\n"
+        f"    __setattr(self, {_HASH_SLOT!r}, value)\n"
+        "    return value\n"
+    )
+    namespace = {"__hashable": _hashable, "__setattr": object.__setattr__}
+    return _create_method(cls, "__hash__", source, namespace)
+
+
+def _hashable(value: Any) -> Any:
+    """Returns a hashable value that is equal for equal lists and dictionaries."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    return value
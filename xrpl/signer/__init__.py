@@ -0,0 +1,7 @@
+"""
+A signing worker that signs batches of transactions on a host that never talks to
+the network. Run it with ``python -m xrpl.signer``.
+"""
+from xrpl.signer.main import SigningMetrics, SigningWorker
+
+__all__ = ["SigningMetrics", "SigningWorker"]
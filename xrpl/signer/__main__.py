@@ -0,0 +1,75 @@
+"""
+Runs a signing worker::
+
+    python -m xrpl.signer --seeds seeds.txt [--port 5005 | --socket PATH]
+
+The seeds file holds one wallet seed per line. The worker answers on stdin and
+stdout unless a port or a socket path is given, and writes its metrics to stderr
+when it stops.
+"""
+import sys
+from argparse import ArgumentParser
+from asyncio import run
+from typing import List, Optional
+
+from xrpl import json_backend
+from xrpl.signer.main import SigningWorker
+from xrpl.wallet.main import Wallet
+
+
+def _read_wallets(path: str) -> List[Wallet]:
+    with open(path) as seeds:
+        return [Wallet(line.strip(), 0) for line in seeds if line.strip()]
+
+
+async def _run(
+    worker: SigningWorker, port: Optional[int], socket_path: Optional[str]
+) -> None:
+    if port is None and socket_path is None:
+        await worker.serve_stdio()
+    else:
+        await worker.serve(port=port, path=socket_path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs a signing worker with the given command line arguments.
+
+    Args:
+        argv: The command line arguments. Defaults to those of the process.
+    """
+    parser = ArgumentParser(
+        prog="python -m xrpl.signer",
+        description="Signs batches of transactions without talking to the network.",
+    )
+    parser.add_argument(
+        "--seeds", required=True, help="a file with one wallet seed per line"
+    )
+    parser.add_argument("--port", type=int, help="a local TCP port to listen on")
+    parser.add_argument("--socket", help="a Unix socket path to listen on")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="how many processes sign"
+    )
+    parser.add_argument(
+        "--no-check-fee",
+        action="store_true",
+        help="do not check the fees against the expected fees",
+    )
+    args = parser.parse_args(argv)
+
+    worker = SigningWorker(
+        _read_wallets(args.seeds),
+        check_fee=not args.no_check_fee,
+        workers=args.workers,
+    )
+    try:
+        run(_run(worker, args.port, args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+        sys.stderr.write(json_backend.dumps(worker.metrics.to_dict()) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""A long-running worker that signs batches of transactions without the network."""
+from __future__ import annotations
+
+import sys
+from asyncio import (
+    StreamReader,
+    StreamWriter,
+    gather,
+    get_running_loop,
+    start_server,
+    start_unix_server,
+)
+from concurrent.futures import Executor, ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from xrpl import json_backend
+from xrpl.asyncio.transaction.main import (
+    _check_fee,
+    _prepare_transaction,
+    _sign_prepared,
+)
+from xrpl.asyncio.transaction.signed_transaction import SignedTransaction
+from xrpl.constants import XRPLException
+from xrpl.models.transactions.transaction import Transaction
+from xrpl.wallet.main import Wallet
+
+# a signing job: where its result goes, the prepared transaction and the private key
+_Job = Tuple[int, Dict[str, Any], str]
+
+
+class SigningMetrics:
+    """Throughput and latency of the batches a SigningWorker has signed."""
+
+    def __init__(self: SigningMetrics) -> None:
+        """Initializes empty metrics."""
+        self.batches = 0
+        self.signed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_batch_seconds = 0.0
+
+    def record(self: SigningMetrics, signed: int, failed: int, seconds: float) -> None:
+        """
+        Records a signed batch.
+
+        Args:
+            signed: How many transactions of the batch were signed.
+            failed: How many transactions of the batch could not be signed.
+            seconds: How long the batch took.
+        """
+        self.batches += 1
+        self.signed += signed
+        self.failed += failed
+        self.busy_seconds += seconds
+        self.max_batch_seconds = max(self.max_batch_seconds, seconds)
+
+    def to_dict(self: SigningMetrics) -> Dict[str, Any]:
+        """
+        Returns the metrics, in the format of the worker's `metrics` response.
+
+        Returns:
+            The counts, the signing throughput in transactions per second, and the
+            mean and maximum batch latencies in milliseconds.
+        """
+        return {
+            "batches": self.batches,
+            "signed": self.signed,
+            "failed": self.failed,
+            "transactions_per_second": (
+                self.signed / self.busy_seconds if self.busy_seconds else 0.0
+            ),
+            "mean_batch_latency_ms": (
+                1000 * self.busy_seconds / self.batches if self.batches else 0.0
+            ),
+            "max_batch_latency_ms": 1000 * self.max_batch_seconds,
+        }
+
+
+class SigningWorker:
+    """
+    Signs batches of unsigned transactions with wallets it keeps in memory, without
+    talking to any server. Requests and responses are JSON objects, one per line::
+
+        {"id": 1, "transactions": [{"TransactionType": "Payment", ...}, ...]}
+        {"id": 1, "results": [{"tx_blob": "...", "hash": "..."}, ...],
+         "latency_ms": 1.5}
+
+    Each transaction is signed by the wallet of its ``Account``, or by the wallet of
+    the request's ``signer`` address, such as a regular key. A transaction that
+    cannot be signed gets an ``error`` result instead, without failing the rest of
+    the batch. ``{"command": "metrics"}`` returns the throughput and latency of the
+    worker so far.
+
+    Run it with ``python -m xrpl.signer``.
+    """
+
+    def __init__(
+        self: SigningWorker,
+        wallets: Iterable[Wallet],
+        *,
+        check_fee: bool = True,
+        workers: int = 1,
+    ) -> None:
+        """
+        Initializes a signing worker.
+
+        Args:
+            wallets: The wallets to sign with.
+            check_fee: Whether to check if the fees are higher than the expected
+                transaction type fees. Defaults to True.
+            workers: How many processes sign the transactions. Defaults to 1, which
+                signs them in this process.
+        """
+        self.wallets = {wallet.classic_address: wallet for wallet in wallets}
+        self.check_fee = check_fee
+        self.metrics = SigningMetrics()
+        self._executor: Optional[Executor] = (
+            ProcessPoolExecutor(workers) if workers > 1 else None
+        )
+        self._workers = workers
+
+    def close(self: SigningWorker) -> None:
+        """Stops the signing processes, if there are any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def handle(self: SigningWorker, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answers one request of the worker's protocol.
+
+        Args:
+            request: The request, either a batch of transactions to sign or a
+                `metrics` command.
+
+        Returns:
+            The response to the request, with the request's `id`, if it has one.
+        """
+        response: Dict[str, Any]
+        if request.get("command") == "metrics":
+            response = self.metrics.to_dict()
+        elif isinstance(request.get("transactions"), list):
+            response = await self.sign_batch(
+                request["transactions"], request.get("signer")
+            )
+        else:
+            response = {"error": "Expected a `transactions` list or a command."}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def sign_batch(
+        self: SigningWorker,
+        transactions: List[Dict[str, Any]],
+        signer: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Signs a batch of transactions.
+
+        Args:
+            transactions: The unsigned transactions, in the JSON format of the XRPL.
+                They must already be autofilled.
+            signer: The address of the wallet to sign every transaction with. By
+                default, each transaction is signed by the wallet of its account.
+
+        Returns:
+            The signed blob and hash, or the error, of each transaction, in order,
+            and the latency of the batch.
+        """
+        started = perf_counter()
+        results: List[Dict[str, Any]] = [{} for _ in transactions]
+        jobs: List[_Job] = []
+        for index, transaction_json in enumerate(transactions):
+            try:
+                transaction = Transaction.from_xrpl(transaction_json)
+                wallet = self._get_wallet(signer or transaction.account)
+                if self.check_fee:
+                    await _check_fee(transaction)
+                jobs.append(
+                    (
+                        index,
+                        _prepare_transaction(transaction, wallet),
+                        wallet.private_key,
+                    )
+                )
+            except Exception as error:
+                # a malformed transaction fails only its own result
+                results[index] = {"error": str(error)}
+
+        for (index, _, _), signed in zip(jobs, await self._sign_jobs(jobs)):
+            results[index] = {"tx_blob": signed.tx_blob, "hash": signed.hash}
+
+        seconds = perf_counter() - started
+        self.metrics.record(len(jobs), len(transactions) - len(jobs), seconds)
+        return {"results": results, "latency_ms": 1000 * seconds}
+
+    def _get_wallet(self: SigningWorker, address: str) -> Wallet:
+        wallet = self.wallets.get(address)
+        if wallet is None:
+            raise XRPLException(f"There is no wallet for {address}.")
+        return wallet
+
+    async def _sign_jobs(
+        self: SigningWorker, jobs: List[_Job]
+    ) -> List[SignedTransaction]:
+        if self._executor is None or len(jobs) < 2:
+            return _sign_chunk(jobs)
+        # send the jobs in one chunk per process, to limit the pickling
+        chunk_size = -(-len(jobs) // self._workers)
+        loop = get_running_loop()
+        chunks = await gather(
+            *(
+                loop.run_in_executor(
+                    self._executor, _sign_chunk, jobs[start : start + chunk_size]
+                )
+                for start in range(0, len(jobs), chunk_size)
+            )
+        )
+        return [signed for chunk in chunks for signed in chunk]
+
+    async def serve_stdio(self: SigningWorker) -> None:
+        """Answers the requests read from stdin on stdout, until stdin closes."""
+        loop = get_running_loop()
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                return
+            if line.strip():
+                sys.stdout.write(json_backend.dumps(await self._handle_line(line)))
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+
+    async def serve(
+        self: SigningWorker,
+        *,
+        port: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        """
+        Answers requests on a local socket until cancelled. Only connections from
+        this host are accepted.
+
+        Args:
+            port: The TCP port to listen on, on the loopback interface.
+            path: The path of the Unix socket to listen on, instead of a TCP port.
+
+        Raises:
+            XRPLException: if neither a port nor a path is given.
+        """
+        if path is not None:
+            server = await start_unix_server(self._serve_connection, path)
+        elif port is not None:
+            server = await start_server(self._serve_connection, "127.0.0.1", port)
+        else:
+            raise XRPLException("A port or a socket path is needed.")
+        async with server:
+            await server.serve_forever()
+
+    async def _serve_connection(
+        self: SigningWorker, reader: StreamReader, writer: StreamWriter
+    ) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.strip():
+                    response = await self._handle_line(line)
+                    writer.write(json_backend.dumps(response).encode("utf-8") + b"\n")
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_line(self: SigningWorker, line: Any) -> Dict[str, Any]:
+        try:
+            request = json_backend.loads(line)
+        except ValueError:
+            return {"error": "The request is not valid JSON."}
+        if not isinstance(request, dict):
+            return {"error": "The request must be a JSON object."}
+        try:
+            return await self.handle(request)
+        except Exception as error:
+            # the worker keeps serving after a request it cannot answer
+            return {
+                "error": str(error),
+                **({"id": request["id"]} if "id" in request else {}),
+            }
+
+
+def _sign_chunk(jobs: List[_Job]) -> List[SignedTransaction]:
+    return [_sign_prepared(json, private_key) for _, json, private_key in jobs]
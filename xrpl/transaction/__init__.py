@@ -1,6 +1,8 @@
 """Methods for working with transactions on the XRP Ledger."""
 from xrpl.asyncio.transaction import (
+    SignedTransaction,
     XRPLReliableSubmissionException,
+    sign_many,
     transaction_json_to_binary_codec_form,
 )
 from xrpl.transaction.ledger import get_transaction_from_hash
@@ -11,16 +13,22 @@ from xrpl.transaction.main import (
     safe_sign_transaction,
     submit_transaction,
 )
+from xrpl.transaction.multisign import combine, multisign, verify_signers
 from xrpl.transaction.reliable_submission import send_reliable_submission
 
 __all__ = [
     "autofill",
+    "combine",
     "get_transaction_from_hash",
+    "multisign",
     "safe_sign_transaction",
     "safe_sign_and_autofill_transaction",
     "safe_sign_and_submit_transaction",
+    "sign_many",
     "submit_transaction",
     "transaction_json_to_binary_codec_form",
     "send_reliable_submission",
     "XRPLReliableSubmissionException",
+    "SignedTransaction",
+    "verify_signers",
 ]
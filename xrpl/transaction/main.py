@@ -1,7 +1,10 @@
 """High-level transaction methods with XRPL transactions."""
 import asyncio
+from typing import Optional, Union
 
-from xrpl.asyncio.transaction import main
+from xrpl.asyncio.account import SequenceManager
+from xrpl.asyncio.ledger import FeeOracle
+from xrpl.asyncio.transaction import SignedTransaction, main
 from xrpl.clients.sync_client import SyncClient
 from xrpl.models.response import Response
 from xrpl.models.transactions.transaction import Transaction
@@ -14,6 +17,9 @@ def safe_sign_and_submit_transaction(
     client: SyncClient,
     autofill: bool = True,
     check_fee: bool = True,
+    *,
+    sequence_manager: Optional[SequenceManager] = None,
+    fee_oracle: Optional[FeeOracle] = None,
 ) -> Response:
     """
     Signs a transaction (locally, without trusting external rippled nodes) and submits
@@ -26,6 +32,11 @@ def safe_sign_and_submit_transaction(
         autofill: whether to autofill the relevant fields. Defaults to True.
         check_fee: whether to check if the fee is higher than the expected transaction
             type fee. Defaults to True.
+        sequence_manager: the SequenceManager of the account, to autofill the
+            sequence number from. It resyncs if the submission is rejected for its
+            sequence number.
+        fee_oracle: the FeeOracle to take the network fee from, instead of asking
+            the server for every transaction.
 
     Returns:
         The response from the ledger.
@@ -37,19 +48,21 @@ def safe_sign_and_submit_transaction(
             client,
             autofill,
             check_fee,
+            sequence_manager=sequence_manager,
+            fee_oracle=fee_oracle,
         )
     )
 
 
 def submit_transaction(
-    transaction: Transaction,
+    transaction: Union[Transaction, SignedTransaction],
     client: SyncClient,
 ) -> Response:
     """
     Submits a transaction to the ledger.
 
     Args:
-        transaction: the Transaction to be submitted.
+        transaction: the signed Transaction, or SignedTransaction, to be submitted.
         client: the network client with which to submit the transaction.
 
     Returns:
@@ -97,6 +110,9 @@ def safe_sign_and_autofill_transaction(
     wallet: Wallet,
     client: SyncClient,
     check_fee: bool = True,
+    *,
+    sequence_manager: Optional[SequenceManager] = None,
+    fee_oracle: Optional[FeeOracle] = None,
 ) -> Transaction:
     """
     Signs a transaction locally, without trusting external rippled nodes. Autofills
@@ -108,6 +124,10 @@ def safe_sign_and_autofill_transaction(
         client: a network client.
         check_fee: whether to check if the fee is higher than the expected transaction
             type fee. Defaults to True.
+        sequence_manager: the SequenceManager of the account, to autofill the
+            sequence number from.
+        fee_oracle: the FeeOracle to take the network fee from, instead of asking
+            the server for every transaction.
 
     Returns:
         The signed transaction.
@@ -118,19 +138,43 @@ def safe_sign_and_autofill_transaction(
             wallet,
             client,
             check_fee,
+            sequence_manager=sequence_manager,
+            fee_oracle=fee_oracle,
         )
     )
 
 
-def autofill(transaction: Transaction, client: SyncClient) -> Transaction:
+def autofill(
+    transaction: Transaction,
+    client: SyncClient,
+    *,
+    sequence: Optional[int] = None,
+    net_fee: Optional[str] = None,
+    ledger_index: Optional[int] = None,
+    sequence_manager: Optional[SequenceManager] = None,
+    fee_oracle: Optional[FeeOracle] = None,
+) -> Transaction:
     """
     Autofills fields in a transaction. This will set `sequence`, `fee`, and
     `last_ledger_sequence` according to the current state of the server this Client is
     connected to. It also converts all X-Addresses to classic addresses.
 
+    The lookups for the missing fields are made concurrently, except with a
+    ``WebsocketClient``, which blocks on each request. Values already fetched by the
+    caller, for example once for a batch of transactions, can be passed in to skip
+    them.
+
     Args:
         transaction: the transaction to be signed.
         client: a network client.
+        sequence: the next sequence number of the account, if already known.
+        net_fee: the network fee in drops, as returned by `get_fee`, if already
+            known. The transaction fee is calculated from it.
+        ledger_index: the latest validated ledger index, if already known.
+        sequence_manager: the SequenceManager of the account, to take the sequence
+            number from instead of asking the server for every transaction.
+        fee_oracle: the FeeOracle to take the network fee from, instead of asking
+            the server for every transaction.
 
     Returns:
         The autofilled transaction.
@@ -139,5 +183,10 @@ def autofill(transaction: Transaction, client: SyncClient) -> Transaction:
         main.autofill(
             transaction,
             client,
+            sequence=sequence,
+            net_fee=net_fee,
+            ledger_index=ledger_index,
+            sequence_manager=sequence_manager,
+            fee_oracle=fee_oracle,
         )
     )
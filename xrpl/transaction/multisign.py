@@ -0,0 +1,121 @@
+"""Methods for multi-signing transactions and combining their signatures."""
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List
+
+from xrpl.asyncio.transaction.main import _prepare_transaction
+from xrpl.constants import XRPLException
+from xrpl.core.addresscodec import decode_classic_address
+from xrpl.core.binarycodec import encode_for_multisigning_prefix
+from xrpl.core.keypairs import is_valid_message, sign
+from xrpl.models.transactions.transaction import Signer, Transaction
+from xrpl.wallet.main import Wallet
+
+
+def multisign(transaction: Transaction, *wallets: Wallet) -> Transaction:
+    """
+    Signs a transaction locally as one or more of the signers of a multi-signed
+    transaction. The signing payload is encoded once, and only the AccountID of each
+    signer is appended to it. The signatures are added to any the transaction
+    already has, sorted as the ledger requires.
+
+    The transaction must already be autofilled, with a fee that covers every signer.
+
+    Args:
+        transaction: the transaction to be signed.
+        wallets: the wallets of the signers.
+
+    Returns:
+        The transaction with the signatures of the wallets in its signers.
+
+    Raises:
+        XRPLException: if no wallet is given.
+    """
+    if not wallets:
+        raise XRPLException("At least one wallet is needed to multi-sign.")
+    transaction_json = _prepare_transaction(transaction, wallets[0])
+    transaction_json["SigningPubKey"] = ""
+    prefix = bytes.fromhex(encode_for_multisigning_prefix(transaction_json))
+
+    signers = list(transaction.signers or [])
+    for wallet in wallets:
+        signers.append(
+            Signer(
+                account=wallet.classic_address,
+                txn_signature=sign(
+                    prefix + decode_classic_address(wallet.classic_address),
+                    wallet.private_key,
+                ),
+                signing_pub_key=wallet.public_key,
+            )
+        )
+    return replace(
+        Transaction.from_xrpl(transaction_json), signers=_sort_signers(signers)
+    )
+
+
+def combine(transactions: Iterable[Transaction]) -> Transaction:
+    """
+    Combines the signatures of copies of one transaction, each multi-signed by some of
+    its signers, into a transaction that is ready to be submitted.
+
+    Args:
+        transactions: the multi-signed copies of the transaction.
+
+    Returns:
+        The transaction with the signers of all the copies, sorted as the ledger
+        requires.
+
+    Raises:
+        XRPLException: if there are no transactions, if a transaction is not
+            multi-signed, or if the transactions are not all the same transaction.
+    """
+    transactions = list(transactions)
+    if not transactions:
+        raise XRPLException("There are no transactions to combine.")
+
+    unsigned = _without_signers(transactions[0])
+    signers: Dict[str, Signer] = {}
+    for transaction in transactions:
+        if not transaction.signers:
+            raise XRPLException("Only multi-signed transactions can be combined.")
+        if _without_signers(transaction) != unsigned:
+            raise XRPLException("The transactions to combine are not the same.")
+        for signer in transaction.signers:
+            signers.setdefault(signer.account, signer)
+    return replace(transactions[0], signers=_sort_signers(signers.values()))
+
+
+def verify_signers(transaction: Transaction) -> bool:
+    """
+    Verifies the signatures of all the signers of a multi-signed transaction. The
+    signing payload is encoded once for all of them.
+
+    This only checks the signatures, not that the signers belong to the signer list
+    of the account.
+
+    Args:
+        transaction: the multi-signed transaction.
+
+    Returns:
+        Whether the transaction has signers, and all of their signatures are valid.
+    """
+    if not transaction.signers:
+        return False
+    prefix = bytes.fromhex(encode_for_multisigning_prefix(transaction.to_xrpl()))
+    return all(
+        is_valid_message(
+            prefix + decode_classic_address(signer.account),
+            bytes.fromhex(signer.txn_signature),
+            signer.signing_pub_key,
+        )
+        for signer in transaction.signers
+    )
+
+
+def _sort_signers(signers: Iterable[Signer]) -> List[Signer]:
+    """Sorts signers by their numeric AccountID, as the ledger requires."""
+    return sorted(signers, key=lambda signer: decode_classic_address(signer.account))
+
+
+def _without_signers(transaction: Transaction) -> Dict[str, Any]:
+    return {**transaction.to_xrpl(), "Signers": None}
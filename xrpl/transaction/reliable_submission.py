@@ -1,7 +1,11 @@
 """High-level reliable submission methods with XRPL transactions."""
 
 import asyncio
+from typing import Union
 
+from xrpl.asyncio.transaction import (
+    SignedTransaction,
+)
 from xrpl.asyncio.transaction import (
     send_reliable_submission as async_send_reliable_submission,
 )
@@ -10,7 +14,9 @@ from xrpl.models.response import Response
 from xrpl.models.transactions.transaction import Transaction
 
 
-def send_reliable_submission(transaction: Transaction, client: SyncClient) -> Response:
+def send_reliable_submission(
+    transaction: Union[Transaction, SignedTransaction], client: SyncClient
+) -> Response:
     """
     Submits a transaction and verifies that it has been included in a validated ledger
     (or has errored/will not be included for some reason).
@@ -22,8 +28,8 @@ def send_reliable_submission(transaction: Transaction, client: SyncClient) -> Re
     close automatically.
 
     Args:
-        transaction: the signed transaction to submit to the ledger. Requires a
-            `last_ledger_sequence` param.
+        transaction: the signed Transaction, or SignedTransaction, to submit to the
+            ledger. Requires a `last_ledger_sequence` param.
         client: the network client used to submit the transaction to a rippled node.
 
     Returns: